@@ -7,6 +7,7 @@ import copy
 import logging
 import math
 from collections import defaultdict, namedtuple
+from dataclasses import dataclass
 from itertools import groupby
 from numbers import Number
 from typing import Any, Dict, List, NamedTuple, Tuple
@@ -40,7 +41,11 @@ from laboneq.compiler.code_generator.measurement_calculator import (
     MeasurementCalculator,
     SignalDelays,
 )
-from laboneq.compiler.code_generator.sampled_event_handler import SampledEventHandler
+from laboneq.compiler.code_generator.pulse_sampling_cache import PulseSamplingCache
+from laboneq.compiler.code_generator.sampled_event_handler import (
+    SampledEventHandler,
+    add_feedback_connection,
+)
 from laboneq.compiler.code_generator.seq_c_generator import (
     SeqCGenerator,
     merge_generators,
@@ -58,6 +63,7 @@ from laboneq.compiler.code_generator.wave_compressor import (
     WaveCompressor,
 )
 from laboneq.compiler.code_generator.wave_index_tracker import WaveIndexTracker
+from laboneq.compiler.code_generator.waveform_pool import WaveformPool
 from laboneq.compiler.common.awg_info import AWGInfo, AwgKey
 from laboneq.compiler.common.awg_sampled_event import (
     AWGEvent,
@@ -77,7 +83,9 @@ from laboneq.compiler.common.signal_obj import SignalObj
 from laboneq.compiler.common.trigger_mode import TriggerMode
 from laboneq.compiler.workflow.compiler_output import CodegenOutput
 from laboneq.core.exceptions import LabOneQException
+from laboneq.core.utilities.forked_pool import can_fork, run_forked
 from laboneq.core.utilities.pulse_sampler import (
+    SHFQA_COMPLEX_SAMPLE_SCALING,
     combine_pulse_parameters,
     length_to_samples,
     sample_pulse,
@@ -93,6 +101,35 @@ from laboneq.data.scheduled_experiment import (
 _logger = logging.getLogger(__name__)
 
 
+class _PreparedPulsePart(NamedTuple):
+    pulse_def: PulseDef
+    sampling_signal_type: str
+    amplitude: Any
+    oscillator_phase: float | None
+    used_oscillator_frequency: float | None
+    iq_phase: float
+    sampling_args: dict[str, Any]
+
+
+@dataclass
+class _AwgCodegenResult:
+    src: dict[AwgKey, dict[str, str]]
+    wave_indices: dict[AwgKey, dict]
+    command_tables: dict[AwgKey, dict[str, Any]]
+    sampled_signatures: Dict[str, Dict[WaveformSignature, Dict]]
+    integration_weights: dict
+    feedback_register_config: Dict[AwgKey, FeedbackRegisterConfig]
+    feedback_connections: Dict[str, FeedbackConnection]
+
+
+def _gen_seq_c_in_worker(
+    state: tuple[CodeGenerator, list[AWGInfo], List[Any], Dict[str, PulseDef]],
+    index: int,
+) -> _AwgCodegenResult:
+    code_generator, awgs, events, pulse_defs = state
+    return code_generator._gen_seq_c_isolated(awgs[index], events, pulse_defs)
+
+
 def add_wait_trigger_statements(
     awg: AWGInfo,
     init_generator: SeqCGenerator,
@@ -175,9 +212,17 @@ def setup_sine_phase(
 
 
 def calculate_integration_weights(
-    acquire_events: AWGSampledEventSequence, signal_obj, pulse_defs
+    acquire_events: AWGSampledEventSequence,
+    signal_obj,
+    pulse_defs,
+    pulse_sampling_cache: PulseSamplingCache | None = None,
 ):
     integration_weights = {}
+    sample = (
+        sample_pulse
+        if pulse_sampling_cache is None
+        else pulse_sampling_cache.sample_pulse
+    )
     signal_id = signal_obj.id
     nr_of_weights_per_event = None
     for event_list in acquire_events.sequence.values():
@@ -241,7 +286,7 @@ def calculate_integration_weights(
 
                 pulse_parameters = combine_pulse_parameters(pulse_par, None, play_par)
                 pulse_parameters = decode_pulse_parameters(pulse_parameters)
-                integration_weight = sample_pulse(
+                integration_weight = sample(
                     signal_type="iq",
                     sampling_rate=signal_obj.awg.sampling_rate,
                     length=length,
@@ -287,13 +332,17 @@ class CodeGenerator:
     DELAY_OTHER_AWG = 32 / DeviceType.HDAWG.sampling_rate
     DELAY_UHFQA = 140 / DeviceType.HDAWG.sampling_rate
 
-    # This is used as a workaround for the SHFQA requiring that for sampled pulses,  abs(s)  < 1.0 must hold
-    # to be able to play pulses with an amplitude of 1.0, we scale complex pulses by this factor
-    SHFQA_COMPLEX_SAMPLE_SCALING = 1 - 1e-10
+    SHFQA_COMPLEX_SAMPLE_SCALING = SHFQA_COMPLEX_SAMPLE_SCALING
 
     _measurement_calculator = MeasurementCalculator
 
-    def __init__(self, ir=None, settings: CompilerSettings | dict | None = None):
+    def __init__(
+        self,
+        ir=None,
+        settings: CompilerSettings | dict | None = None,
+        pulse_sampling_cache: PulseSamplingCache | None = None,
+        waveform_pool: WaveformPool | None = None,
+    ):
         if settings is not None:
             if isinstance(settings, CompilerSettings):
                 self._settings = settings
@@ -303,6 +352,8 @@ class CodeGenerator:
             self._settings = CompilerSettings()
 
         self._ir = ir
+        self._pulse_sampling_cache = pulse_sampling_cache
+        self._waveform_pool = WaveformPool() if waveform_pool is None else waveform_pool
         self._signals: dict[str, SignalObj] = {}
         self._code = {}
         self._src: dict[AwgKey, dict[str, str]] = {}
@@ -394,11 +445,12 @@ class CodeGenerator:
         self, samples, signature_pulse_map, sig_string: str, suffix: str
     ):
         filename = sig_string + suffix + ".wave"
-        wave = {"filename": filename, "samples": samples}
         assert filename not in self._waves or np.allclose(
-            self._waves[filename]["samples"], wave["samples"]
+            self._waves[filename]["samples"], samples
         )
-        self._waves[filename] = wave
+        # Identical samples, also of different signatures, share the same array
+        samples = self._waveform_pool.intern(samples)
+        self._waves[filename] = {"filename": filename, "samples": samples}
         self._append_to_pulse_map(signature_pulse_map, sig_string)
 
     def gen_waves(self):
@@ -616,11 +668,25 @@ class CodeGenerator:
             self._signals, events
         )
 
-        for _, awg in sorted(
-            self._awgs.items(),
-            key=lambda item: item[0].device_id + str(item[0].awg_number),
+        awgs = [
+            awg
+            for _, awg in sorted(
+                self._awgs.items(),
+                key=lambda item: item[0].device_id + str(item[0].awg_number),
+            )
+        ]
+        max_workers = min(self._settings.CODEGEN_MAX_WORKERS, len(awgs))
+        if (
+            max_workers > 1
+            # Feedback registers are allocated in the order of the AWGs
+            and not self._feedback_register_allocator.feedback_path
+            # The worker processes must inherit the state of the code generator
+            and can_fork()
         ):
-            self._gen_seq_c_per_awg(awg, events, pulse_defs)
+            self._gen_seq_c_parallel(awgs, events, pulse_defs, max_workers)
+        else:
+            for awg in awgs:
+                self._gen_seq_c_per_awg(awg, events, pulse_defs)
 
         for (
             awg,
@@ -630,6 +696,68 @@ class CodeGenerator:
                 awg
             ].target_feedback_register = target_fb_register
 
+    def _gen_seq_c_parallel(
+        self,
+        awgs: list[AWGInfo],
+        events: List[Any],
+        pulse_defs: Dict[str, PulseDef],
+        max_workers: int,
+    ):
+        _logger.debug(
+            "Generating code for %d AWGs in %d processes", len(awgs), max_workers
+        )
+        results = run_forked(
+            _gen_seq_c_in_worker,
+            (self, awgs, events, pulse_defs),
+            range(len(awgs)),
+            max_workers,
+        )
+
+        # Merge in the order of the AWGs, as if they were processed one by one
+        for result in results:
+            self._src.update(result.src)
+            self._wave_indices_all.update(result.wave_indices)
+            self._command_tables.update(result.command_tables)
+            self._sampled_signatures.update(result.sampled_signatures)
+            self._integration_weights.update(result.integration_weights)
+            self._feedback_register_config.update(result.feedback_register_config)
+            for handle, connection in result.feedback_connections.items():
+                if connection.acquire is not None:
+                    add_feedback_connection(
+                        self._feedback_connections, handle, connection.acquire
+                    )
+                self._feedback_connections.setdefault(
+                    handle, FeedbackConnection(None)
+                ).drive.update(connection.drive)
+
+    def _gen_seq_c_isolated(
+        self,
+        awg: AWGInfo,
+        events: List[Any],
+        pulse_defs: Dict[str, PulseDef],
+    ) -> _AwgCodegenResult:
+        """Generates the code of a single AWG into empty outputs, and returns them.
+
+        Only to be used in a worker process, on a private copy of the code generator.
+        """
+        self._src = {}
+        self._wave_indices_all = {}
+        self._command_tables = {}
+        self._sampled_signatures = {}
+        self._integration_weights = {}
+        self._feedback_register_config = defaultdict(FeedbackRegisterConfig)
+        self._feedback_connections = {}
+        self._gen_seq_c_per_awg(awg, events, pulse_defs)
+        return _AwgCodegenResult(
+            src=self._src,
+            wave_indices=self._wave_indices_all,
+            command_tables=self._command_tables,
+            sampled_signatures=self._sampled_signatures,
+            integration_weights=self._integration_weights,
+            feedback_register_config=dict(self._feedback_register_config),
+            feedback_connections=self._feedback_connections,
+        )
+
     @staticmethod
     def _calc_global_awg_params(awg: AWGInfo) -> Tuple[float, float]:
         global_sampling_rate = None
@@ -1046,7 +1174,10 @@ class CodeGenerator:
                 self._integration_weights[
                     signal_obj.id
                 ] = calculate_integration_weights(
-                    acquire_events, signal_obj, pulse_defs
+                    acquire_events,
+                    signal_obj,
+                    pulse_defs,
+                    pulse_sampling_cache=self._pulse_sampling_cache,
                 )
 
             sampled_events.merge(acquire_events)
@@ -1350,6 +1481,11 @@ class CodeGenerator:
                 "ct": handler.command_table_tracker.command_table()
             }
 
+    def _sample_pulse(self, **kwargs):
+        if self._pulse_sampling_cache is None:
+            return sample_pulse(**kwargs)
+        return self._pulse_sampling_cache.sample_pulse(**kwargs)
+
     def waveform_size_hints(self, device: DeviceType):
         settings = self._settings
 
@@ -1382,6 +1518,98 @@ class CodeGenerator:
                 min_pz_hint,
             )
 
+    def _prepare_pulse_part(
+        self,
+        pulse_part,
+        pulse_defs: Dict[str, PulseDef],
+        sampling_rate,
+        signal_type,
+        device_type,
+        mixer_type,
+        multi_iq_signal,
+    ) -> _PreparedPulsePart:
+        _logger.debug(" Sampling pulse part %s", pulse_part)
+        pulse_def = pulse_defs[pulse_part.pulse]
+
+        if pulse_def.amplitude is None:
+            pulse_def = copy.deepcopy(pulse_def)
+            pulse_def.amplitude = 1.0
+        _logger.debug(" Pulse def: %s", pulse_def)
+
+        sampling_signal_type = signal_type
+        if pulse_part.channel is not None:
+            sampling_signal_type = "single"
+        if multi_iq_signal:
+            sampling_signal_type = "iq"
+        if pulse_part.sub_channel is not None:
+            sampling_signal_type = "iq"
+
+        amplitude = pulse_def.amplitude
+        if pulse_part.amplitude is not None:
+            amplitude *= pulse_part.amplitude
+
+        oscillator_phase = pulse_part.oscillator_phase
+
+        baseband_phase = pulse_part.increment_oscillator_phase
+        used_oscillator_frequency = pulse_part.oscillator_frequency
+
+        _logger.debug(
+            " Sampling pulse %s using oscillator frequency %s",
+            pulse_part,
+            used_oscillator_frequency,
+        )
+
+        if used_oscillator_frequency and device_type == DeviceType.SHFSG:
+            amplitude /= math.sqrt(2)
+
+        iq_phase = 0.0
+
+        if pulse_part.phase is not None:
+            # According to "LabOne Q Software: Signal, channel and oscillator concept" REQ 1.3
+            iq_phase += pulse_part.phase
+
+        # In case oscillator phase can't be set at runtime (e.g. HW oscillator without
+        # phase control from a sequencer), apply oscillator phase on a baseband (iq) signal
+        iq_phase += baseband_phase or 0.0
+
+        iq_phase += oscillator_phase or 0.0
+
+        iq_phase = normalize_phase(iq_phase)
+
+        samples = pulse_def.samples
+
+        decoded_pulse_parameters = decode_pulse_parameters(
+            {}
+            if pulse_part.pulse_parameters is None
+            else {k: v for k, v in pulse_part.pulse_parameters}
+        )
+
+        sampling_args = dict(
+            signal_type=sampling_signal_type,
+            sampling_rate=sampling_rate,
+            amplitude=amplitude,
+            length=pulse_part.length / sampling_rate,
+            pulse_function=pulse_def.function,
+            modulation_frequency=used_oscillator_frequency,
+            phase=iq_phase,
+            samples=samples,
+            mixer_type=mixer_type,
+            pulse_parameters=decoded_pulse_parameters,
+            markers=None
+            if not pulse_part.markers
+            else [{k: v for k, v in m} for m in pulse_part.markers],
+        )
+
+        return _PreparedPulsePart(
+            pulse_def=pulse_def,
+            sampling_signal_type=sampling_signal_type,
+            amplitude=amplitude,
+            oscillator_phase=oscillator_phase,
+            used_oscillator_frequency=used_oscillator_frequency,
+            iq_phase=iq_phase,
+            sampling_args=sampling_args,
+        )
+
     def _sample_pulses(
         self,
         signal_id,
@@ -1409,6 +1637,31 @@ class CodeGenerator:
                     sampled_signatures[signature.waveform] = None
         _logger.debug("Signatures: %s", signatures)
 
+        prepared_parts = {
+            signature: [
+                self._prepare_pulse_part(
+                    pulse_part,
+                    pulse_defs,
+                    sampling_rate,
+                    signal_type,
+                    device_type,
+                    mixer_type,
+                    multi_iq_signal,
+                )
+                for pulse_part in signature.waveform.pulses
+            ]
+            for signature in signatures
+        }
+        if self._pulse_sampling_cache is not None:
+            # Sample the variants of the same pulses in batches
+            self._pulse_sampling_cache.sample_pulses(
+                [
+                    part.sampling_args
+                    for parts in prepared_parts.values()
+                    for part in parts
+                ]
+            )
+
         needs_conjugate = device_type == DeviceType.SHFSG
         for signature in signatures:
             length = signature.waveform.length
@@ -1435,80 +1688,26 @@ class CodeGenerator:
 
             has_q = False
 
-            for pulse_part, (play_pulse_parameters, pulse_pulse_parameters) in zip(
-                signature.waveform.pulses, signature.pulse_parameters
+            for pulse_part, prepared_part, (
+                play_pulse_parameters,
+                pulse_pulse_parameters,
+            ) in zip(
+                signature.waveform.pulses,
+                prepared_parts[signature],
+                signature.pulse_parameters,
             ):
-                _logger.debug(" Sampling pulse part %s", pulse_part)
-                pulse_def = pulse_defs[pulse_part.pulse]
-
-                if pulse_def.amplitude is None:
-                    pulse_def = copy.deepcopy(pulse_def)
-                    pulse_def.amplitude = 1.0
-                _logger.debug(" Pulse def: %s", pulse_def)
-
-                sampling_signal_type = signal_type
-                if pulse_part.channel is not None:
-                    sampling_signal_type = "single"
-                if multi_iq_signal:
-                    sampling_signal_type = "iq"
-                if pulse_part.sub_channel is not None:
-                    sampling_signal_type = "iq"
-
-                amplitude = pulse_def.amplitude
-                if pulse_part.amplitude is not None:
-                    amplitude *= pulse_part.amplitude
-
-                oscillator_phase = pulse_part.oscillator_phase
-
-                baseband_phase = pulse_part.increment_oscillator_phase
-                used_oscillator_frequency = pulse_part.oscillator_frequency
-
-                _logger.debug(
-                    " Sampling pulse %s using oscillator frequency %s",
-                    pulse_part,
+                (
+                    pulse_def,
+                    sampling_signal_type,
+                    amplitude,
+                    oscillator_phase,
                     used_oscillator_frequency,
-                )
-
-                if used_oscillator_frequency and device_type == DeviceType.SHFSG:
-                    amplitude /= math.sqrt(2)
-
-                iq_phase = 0.0
-
-                if pulse_part.phase is not None:
-                    # According to "LabOne Q Software: Signal, channel and oscillator concept" REQ 1.3
-                    iq_phase += pulse_part.phase
-
-                # In case oscillator phase can't be set at runtime (e.g. HW oscillator without
-                # phase control from a sequencer), apply oscillator phase on a baseband (iq) signal
-                iq_phase += baseband_phase or 0.0
-
-                iq_phase += oscillator_phase or 0.0
-
-                iq_phase = normalize_phase(iq_phase)
-
+                    iq_phase,
+                    sampling_args,
+                ) = prepared_part
                 samples = pulse_def.samples
 
-                decoded_pulse_parameters = decode_pulse_parameters(
-                    {}
-                    if pulse_part.pulse_parameters is None
-                    else {k: v for k, v in pulse_part.pulse_parameters}
-                )
-
-                sampled_pulse = sample_pulse(
-                    signal_type=sampling_signal_type,
-                    sampling_rate=sampling_rate,
-                    amplitude=amplitude,
-                    length=pulse_part.length / sampling_rate,
-                    pulse_function=pulse_def.function,
-                    modulation_frequency=used_oscillator_frequency,
-                    phase=iq_phase,
-                    samples=samples,
-                    mixer_type=mixer_type,
-                    pulse_parameters=decoded_pulse_parameters,
-                    markers=None
-                    if not pulse_part.markers
-                    else [{k: v for k, v in m} for m in pulse_part.markers],
-                )
+                sampled_pulse = self._sample_pulse(**sampling_args)
 
                 verify_amplitude_no_clipping(
                     sampled_pulse, pulse_def.uid, mixer_type, signal_id
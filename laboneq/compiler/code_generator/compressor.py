@@ -8,8 +8,14 @@ from collections import defaultdict
 from dataclasses import dataclass
 from typing import Callable, Hashable, List, Tuple
 
+import numpy as np
+
 _logger = logging.getLogger(__name__)
 
+# From this length of the plaintext on, `compressor_core` finds the runs via a suffix
+# array instead of comparing the candidate words element by element.
+SUFFIX_ARRAY_THRESHOLD = 200
+
 
 @dataclass
 class Run:
@@ -39,6 +45,22 @@ def compressor_core(
     plaintext: List[Hashable] | str,
     cost_function: Callable = default_cost_function,
     recurse=False,
+):
+    """Replace repeated runs of words in the plaintext by `Run` objects.
+
+    Greedily picks the run with the lowest cost among those starting before the end
+    of the best run found so far, and proceeds after it. Long plaintexts are handled
+    by `_compressor_core_suffix_array`, which produces the same output.
+    """
+    if len(plaintext) >= SUFFIX_ARRAY_THRESHOLD:
+        return _compressor_core_suffix_array(plaintext, cost_function, recurse)
+    return _compressor_core_scan(plaintext, cost_function, recurse)
+
+
+def _compressor_core_scan(
+    plaintext: List[Hashable] | str,
+    cost_function: Callable,
+    recurse: bool,
 ):
     output = []
     while True:
@@ -97,3 +119,137 @@ def compressor_core(
         output.extend(plaintext[:best_run_start])
         output.append(best_run)
         plaintext = plaintext[best_run_end:]
+
+
+class _LongestCommonPrefix:
+    """Longest common prefix of any two suffixes of a text, in constant time.
+
+    Built from the suffix array (prefix doubling), the LCP array of adjacent suffixes
+    (Kasai et al.), and a sparse table for range minimum queries over the latter.
+    """
+
+    def __init__(self, text: List[int]):
+        n = len(text)
+        rank = np.array(text, dtype=np.int64)
+        suffix_array = np.argsort(rank, kind="stable")
+        k = 1
+        while k < n:
+            if rank.max() == n - 1:
+                break
+            second = np.full(n, -1, dtype=np.int64)
+            second[: n - k] = rank[k:]
+            suffix_array = np.lexsort((second, rank))
+            sorted_rank, sorted_second = rank[suffix_array], second[suffix_array]
+            changed = np.empty(n, dtype=np.int64)
+            changed[0] = 0
+            changed[1:] = (sorted_rank[1:] != sorted_rank[:-1]) | (
+                sorted_second[1:] != sorted_second[:-1]
+            )
+            rank = np.empty(n, dtype=np.int64)
+            rank[suffix_array] = np.cumsum(changed)
+            k *= 2
+        self._rank = rank = rank.tolist()
+        suffix_array = suffix_array.tolist()
+
+        # lcp[r] is the common prefix of the suffixes at rank r - 1 and r
+        lcp = [0] * n
+        h = 0
+        for i in range(n):
+            r = rank[i]
+            if r == 0:
+                h = 0
+                continue
+            j = suffix_array[r - 1]
+            while i + h < n and j + h < n and text[i + h] == text[j + h]:
+                h += 1
+            lcp[r] = h
+            if h > 0:
+                h -= 1
+
+        level = np.array(lcp, dtype=np.int64)
+        self._table = [lcp]
+        width = 1
+        while 2 * width <= n:
+            level = np.minimum(level[:-width], level[width:])
+            self._table.append(level.tolist())
+            width *= 2
+
+    def __call__(self, i: int, j: int) -> int:
+        """Length of the common prefix of the suffixes starting at i != j."""
+        lo, hi = self._rank[i], self._rank[j]
+        if lo > hi:
+            lo, hi = hi, lo
+        level = (hi - lo).bit_length() - 1
+        row = self._table[level]
+        return min(row[lo + 1], row[hi - (1 << level) + 1])
+
+
+def _compressor_core_suffix_array(
+    plaintext: List[Hashable] | str,
+    cost_function: Callable,
+    recurse: bool,
+):
+    """Same as `_compressor_core_scan`, in near-linear time.
+
+    The candidate word at each position still reaches up to the next occurrence of the
+    same element, but the number of its repetitions is derived from the longest common
+    prefix of the suffixes at both occurrences, rather than by comparing the words.
+    The next occurrences are computed once for the whole plaintext, and a position is
+    skipped if it continues a run of the same word that was found before.
+
+    Runs of a single repetition are assumed to never be worth compressing, and are not
+    passed to the cost function.
+    """
+    n = len(plaintext)
+    codes = {}
+    text = [codes.setdefault(c, len(codes)) for c in plaintext]
+    next_occurrence = [None] * n
+    seen = {}
+    for i in range(n - 1, -1, -1):
+        next_occurrence[i] = seen.get(text[i])
+        seen[text[i]] = i
+    common_prefix = _LongestCommonPrefix(text)
+
+    output = []
+    start = 0
+    while True:
+        if n - start <= 1:
+            output.extend(plaintext[start:])
+            return output
+        # (word length, position modulo word length) -> end of the runs found so far.
+        # Within a run, the same word only recurs at multiples of its length.
+        run_ends = {}
+        best_run = None
+        best_run_start, best_run_end = None, None
+        best_cost = 0
+        for index in range(start, n):
+            if best_run_end is not None and index > best_run_end:
+                break
+            next_index = next_occurrence[index]
+            if next_index is None:
+                continue
+            offset = next_index - index
+            phase = (offset, index % offset)
+            if index < run_ends.get(phase, index):
+                continue
+            run_length = 1 + common_prefix(index, next_index) // offset
+            if run_length == 1:
+                continue
+            run_ends[phase] = index + run_length * offset
+            this_run = Run(tuple(plaintext[index:next_index]), run_length)
+            this_cost = cost_function(this_run)
+            if this_cost < best_cost:
+                best_run = this_run
+                best_cost = this_cost
+                best_run_start, best_run_end = index, index + best_run.span
+
+        if best_run is None:
+            output.extend(plaintext[start:])
+            return output
+
+        if recurse:
+            best_run.word = compressor_core(best_run.word, cost_function, recurse)
+
+        output.extend(plaintext[start:best_run_start])
+        output.append(best_run)
+        start = best_run_end
@@ -0,0 +1,198 @@
+# Copyright 2023 Zurich Instruments AG
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+import hashlib
+import logging
+import threading
+from typing import Any, Hashable, Iterable
+
+import numpy as np
+
+from laboneq.core.utilities.caching import CacheStats, LruCache
+from laboneq.core.utilities.pulse_sampler import (
+    batched_pulse_functions,
+    pulse_function_library,
+    sample_pulse,
+    sample_pulse_batch,
+)
+
+_logger = logging.getLogger(__name__)
+
+# Arguments of `sample_pulse` that may vary within a batch
+_BATCHED_ARGUMENTS = ("amplitude", "phase", "modulation_frequency", "pulse_parameters")
+
+# Default upper bound for the total size of the cached samples
+DEFAULT_PULSE_SAMPLING_CACHE_MAX_SIZE = 256 * 1024 * 1024  # bytes
+
+
+@dataclasses.dataclass
+class PulseSamplingCacheStats(CacheStats):
+    batched: int = 0
+
+    def __str__(self):
+        return (
+            f"{self.hits} hits, {self.misses} misses ({self.batched} batched),"
+            f" {self.evictions} evictions"
+        )
+
+
+_SCALAR_TYPES = frozenset((type(None), bool, int, float, complex, str))
+
+
+def _freeze(value) -> Hashable:
+    """Hashable representation of a sampling argument, compared by content."""
+    value_type = type(value)
+    if value_type in _SCALAR_TYPES:
+        # Distinguish e.g. 1 and 1.0, which sample to different dtypes
+        return value_type, value
+    if isinstance(value, enum.Enum):
+        return value
+    if isinstance(value, np.ndarray):
+        digest = hashlib.blake2b(np.ascontiguousarray(value).data, digest_size=16)
+        return "ndarray", value.dtype.str, value.shape, digest.digest()
+    if isinstance(value, np.generic):
+        return value.dtype.str, value.item()
+    if isinstance(value, (list, tuple)):
+        return value_type, tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return dict, tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    raise TypeError(f"Cannot use {value_type.__name__} in a sampling cache key")
+
+
+class PulseSamplingCache:
+    """Bounded cache of sampled pulses, keyed by the content of the arguments of
+    `sample_pulse`.
+
+    The least recently used samples are evicted once their total size exceeds
+    `max_size` bytes. Callers receive copies of the cached samples.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_PULSE_SAMPLING_CACHE_MAX_SIZE):
+        self.stats = PulseSamplingCacheStats()
+        self._entries: LruCache[Hashable, dict[str, np.ndarray]] = LruCache(
+            max_size,
+            size_of=lambda sampled: sum(v.nbytes for v in sampled.values()),
+            stats=self.stats,
+        )
+        # Keys sampled in a batch, and not yet requested
+        self._prefetched: set[Hashable] = set()
+        self._lock = threading.Lock()
+
+    def _make_key(self, kwargs: dict[str, Any]) -> Hashable | None:
+        pulse_function = kwargs.get("pulse_function")
+        try:
+            return (
+                # The function may be re-registered under the same name
+                pulse_function_library.get(pulse_function),
+                *[(name, _freeze(kwargs[name])) for name in sorted(kwargs)],
+            )
+        except TypeError as exc:
+            _logger.debug("Not caching samples of %s: %s", pulse_function, exc)
+            return None
+
+    def sample_pulse(self, **kwargs) -> dict[str, np.ndarray]:
+        """Same as `sample_pulse`, but reusing the samples of identical requests."""
+        key = self._make_key(kwargs)
+        if key is None:
+            return sample_pulse(**kwargs)
+        with self._lock:
+            prefetched = key in self._prefetched
+            self._prefetched.discard(key)
+        # Samples of a batch were already counted as misses when sampled
+        sampled = self._entries.peek(key) if prefetched else None
+        if sampled is None:
+            sampled = self._entries.get(key)
+        if sampled is None:
+            sampled = sample_pulse(**kwargs)
+            self._entries.put(key, sampled)
+        return {k: v.copy() for k, v in sampled.items()}
+
+    def sample_pulses(self, requests: Iterable[dict[str, Any]]):
+        """Samples the variants of the same pulse functional in batches.
+
+        The requests are the keyword arguments of `sample_pulse`. Requests that
+        only differ in amplitude, phase, modulation frequency or pulse parameters
+        of a functional registered with `supports_batching` are sampled at once
+        via `sample_pulse_batch`, and their samples are added to the cache.
+        """
+        groups: dict[Hashable, dict[Hashable, dict[str, Any]]] = {}
+        for kwargs in requests:
+            pulse_function = kwargs.get("pulse_function")
+            if (
+                pulse_function not in batched_pulse_functions
+                or kwargs.get("samples") is not None
+            ):
+                continue
+            key = self._make_key(kwargs)
+            if key is None or key in self._entries:
+                continue
+            pulse_parameters = kwargs.get("pulse_parameters") or {}
+            group_key = (
+                *[
+                    (name, _freeze(value))
+                    for name, value in sorted(kwargs.items())
+                    if name not in _BATCHED_ARGUMENTS
+                ],
+                type(kwargs.get("amplitude")),
+                tuple(sorted(pulse_parameters)),
+            )
+            groups.setdefault(group_key, {})[key] = kwargs
+
+        for group in groups.values():
+            if len(group) < 2:
+                continue
+            variants = list(group.values())
+            kwargs = variants[0]
+            try:
+                sampled = sample_pulse_batch(
+                    signal_type=kwargs["signal_type"],
+                    sampling_rate=kwargs["sampling_rate"],
+                    length=kwargs["length"],
+                    pulse_function=kwargs["pulse_function"],
+                    amplitudes=[v["amplitude"] for v in variants],
+                    phases=[v.get("phase") for v in variants],
+                    modulation_frequencies=[
+                        v.get("modulation_frequency") for v in variants
+                    ],
+                    mixer_type=kwargs["mixer_type"],
+                    pulse_parameters=[v.get("pulse_parameters") for v in variants],
+                    markers=kwargs.get("markers"),
+                )
+            except Exception as exc:
+                # Leave it to `sample_pulse` to sample and report errors one by one
+                _logger.debug("Not sampling %s in a batch: %s", kwargs, exc)
+                continue
+            for index, key in enumerate(group):
+                self._entries.put(key, {k: v[index].copy() for k, v in sampled.items()})
+            with self._lock:
+                # Forget the keys of evicted samples, which were never requested
+                self._prefetched = {k for k in self._prefetched if k in self._entries}
+                self._prefetched.update(k for k in group if k in self._entries)
+                self.stats.batched += len(group)
+            self._entries.count(misses=len(group))
+
+    def clear(self):
+        self._entries.clear()
+        with self._lock:
+            self._prefetched.clear()
+
+
+_pulse_sampling_cache: PulseSamplingCache | None = None
+
+
+def set_pulse_sampling_cache(cache: PulseSamplingCache | None):
+    """Sets a cache shared by all compilations.
+
+    If None (the default), every compilation uses a cache of its own.
+    """
+    global _pulse_sampling_cache
+    _pulse_sampling_cache = cache
+
+
+def get_pulse_sampling_cache() -> PulseSamplingCache | None:
+    """The cache shared by all compilations, if any."""
+    return _pulse_sampling_cache
@@ -107,6 +107,26 @@ def generate_if_else_tree(
     return if_level(0, start_bit)
 
 
+def add_feedback_connection(
+    feedback_connections: Dict[str, FeedbackConnection],
+    handle: str,
+    acquire_signal: str,
+):
+    if handle is None:
+        return
+    try:
+        fbc = feedback_connections[handle]
+        if fbc.acquire is None:
+            fbc.acquire = acquire_signal
+        elif fbc.acquire != acquire_signal:
+            raise LabOneQException(
+                f"Acquisition handle {handle} may not be "
+                f"reused with different signal {acquire_signal}"
+            )
+    except KeyError:
+        feedback_connections[handle] = FeedbackConnection(acquire_signal)
+
+
 class SampledEventHandler:
     def __init__(
         self,
@@ -990,16 +1010,4 @@ class SampledEventHandler:
         self.seqc_tracker.force_deferred_function_calls()
 
     def _add_feedback_connection(self, handle: str, acquire_signal: str):
-        if handle is None:
-            return
-        try:
-            fbc = self.feedback_connections[handle]
-            if fbc.acquire is None:
-                fbc.acquire = acquire_signal
-            elif fbc.acquire != acquire_signal:
-                raise LabOneQException(
-                    f"Acquisition handle {handle} may not be "
-                    f"reused with different signal {acquire_signal}"
-                )
-        except KeyError:
-            self.feedback_connections[handle] = FeedbackConnection(acquire_signal)
+        add_feedback_connection(self.feedback_connections, handle, acquire_signal)
@@ -0,0 +1,66 @@
+# Copyright 2023 Zurich Instruments AG
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import threading
+from typing import Hashable
+
+import numpy as np
+
+from laboneq.core.utilities.caching import CacheStats
+
+
+@dataclasses.dataclass
+class WaveformPoolStats(CacheStats):
+    """Hits are the waveforms sharing the array of an identical waveform, misses
+    the distinct waveforms."""
+
+    shared_bytes: int = 0
+
+    def __str__(self):
+        return (
+            f"{self.hits + self.misses} waveforms, {self.misses} distinct,"
+            f" {self.shared_bytes / 1024:.1f} kB shared"
+        )
+
+
+def _content_key(samples: np.ndarray) -> Hashable:
+    digest = hashlib.blake2b(np.ascontiguousarray(samples).data, digest_size=16)
+    return samples.dtype.str, samples.shape, digest.digest()
+
+
+class WaveformPool:
+    """Content-addressed store of the sampled waveforms of a compilation.
+
+    Waveforms with identical samples, e.g. of different signatures, of different
+    AWGs or of different near-time steps, share a single array, so that the
+    samples are held in memory and serialized only once. The shared arrays must
+    not be modified in place.
+
+    The pool does not affect the generated code: each wave file keeps its own
+    wave index, and is still uploaded to the instruments separately.
+    """
+
+    def __init__(self):
+        self._arrays: dict[Hashable, np.ndarray] = {}
+        self._lock = threading.Lock()
+        self.stats = WaveformPoolStats()
+
+    def intern(self, samples):
+        """Returns the pooled array with the same content as `samples`."""
+        if not isinstance(samples, np.ndarray):
+            return samples
+        key = _content_key(samples)
+        with self._lock:
+            pooled = self._arrays.get(key)
+            if pooled is not None:
+                self.stats.hits += 1
+                if pooled is not samples:
+                    self.stats.shared_bytes += samples.nbytes
+                return pooled
+            self._arrays[key] = samples
+            self.stats.misses += 1
+            return samples
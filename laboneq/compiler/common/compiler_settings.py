@@ -30,6 +30,9 @@ _USER_ENABLED_SETTINGS = [
     "OUTPUT_EXTRAS",
     "FORCE_IR_ROUNDTRIP",
     "LOG_REPORT",
+    "RT_COMPILER_MAX_WORKERS",
+    "CODEGEN_MAX_WORKERS",
+    "INCREMENTAL_COMPILATION",
 ]
 
 DEFAULT_HDAWG_LEAD_PQSC: float = 80e-9
@@ -84,6 +87,13 @@ class CompilerSettings:
 
     LOG_REPORT: bool = True
 
+    # Number of processes compiling the real-time program of the near-time steps
+    RT_COMPILER_MAX_WORKERS: int = 1
+    # Number of processes generating the code of the AWGs
+    CODEGEN_MAX_WORKERS: int = 1
+    # Reuse the previous compilation if only calibration values changed
+    INCREMENTAL_COMPILATION: bool = False
+
     @classmethod
     def from_dict(cls, settings: dict | None = None):
         if settings is None:
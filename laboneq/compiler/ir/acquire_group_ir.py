@@ -5,12 +5,13 @@ from __future__ import annotations
 
 from typing import Any, Dict, Iterator, List, Optional
 
-from attrs import define
+from attrs import define, evolve
 
 from laboneq.compiler.common.compiler_settings import CompilerSettings
 from laboneq.compiler.common.event_type import EventType
 from laboneq.compiler.common.pulse_parameters import encode_pulse_parameters
 from laboneq.compiler.ir.interval_ir import IntervalIR
+from laboneq.compiler.ir.pulse_ir import swept_pulse_values
 from laboneq.data.compilation_job import ParameterInfo, SectionSignalPulse
 
 
@@ -104,5 +105,26 @@ class AcquireGroupIR(IntervalIR):
             },
         ]
 
+    def with_parameter_values(self, parameter_values: Dict[str, Any]) -> AcquireGroupIR:
+        changes = {}
+        for i, pulse in enumerate(self.pulses):
+            swept = swept_pulse_values(pulse, parameter_values)
+            for name, value in (
+                ("amplitudes", swept.get("amplitude")),
+                ("phases", swept.get("phase")),
+                ("oscillator_frequencies", swept.get("oscillator_frequency")),
+                ("play_pulse_params", swept.get("play_pulse_params")),
+                ("pulse_pulse_params", swept.get("pulse_pulse_params")),
+            ):
+                if value is None:
+                    continue
+                values = changes.setdefault(name, list(getattr(self, name)))
+                if isinstance(value, dict):
+                    value = {**values[i], **value}
+                values[i] = value
+        if not changes:
+            return self
+        return evolve(self, **changes)
+
     def __hash__(self):
         return super().__hash__()
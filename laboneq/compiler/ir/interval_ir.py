@@ -3,9 +3,9 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterator, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set
 
-from attrs import define, field
+from attrs import define, evolve, field
 
 from laboneq.compiler.common.compiler_settings import CompilerSettings
 
@@ -39,6 +39,17 @@ class IntervalIR:
     ) -> List[Dict]:
         raise NotImplementedError
 
+    def with_parameter_values(self, parameter_values: Dict[str, Any]) -> IntervalIR:
+        """Make a copy of this interval, with the quantities given by the sweep
+        parameters in ``parameter_values`` replaced by the values therein.
+
+        Subtrees that do not depend on these parameters are shared with the original.
+        """
+        children = [c.with_parameter_values(parameter_values) for c in self.children]
+        if all(c is original for c, original in zip(children, self.children)):
+            return self
+        return evolve(self, children=children)
+
     def children_events(
         self,
         start: int,
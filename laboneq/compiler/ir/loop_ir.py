@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterator, List
+from typing import Any, Dict, Iterator, List
 
 from attrs import define
 
@@ -18,6 +18,20 @@ class LoopIR(SectionIR):
     compressed: bool
     iterations: int
 
+    #: Whether the only child is the prototype of all iterations, see `LoopSchedule`
+    parametric: bool = False
+    first_iteration: int = 0
+
+    def iteration_parameter_values(self, iteration: int) -> Dict[str, Any]:
+        """The values of the sweep parameters in the given iteration of a parametric
+        loop."""
+        prototype = self.children[0]
+        assert isinstance(prototype, LoopIterationIR)
+        return {
+            param.uid: param.values[self.first_iteration + iteration]
+            for param in prototype.sweep_parameters
+        }
+
     def generate_event_list(
         self,
         start: int,
@@ -32,7 +46,32 @@ class LoopIR(SectionIR):
         # We'll later wrap the child events in some extra events, see below.
         max_events -= 3
 
-        if not self.compressed:  # unrolled loop
+        if self.parametric:
+            # Expand the loop here, the iterations only differ in the parameter values
+            prototype = self.children[0]
+            assert isinstance(prototype, LoopIterationIR)
+            assert prototype.length is not None
+            children_events = []
+            for iteration in range(self.iterations):
+                if max_events <= 0:
+                    break
+                if iteration == 0:
+                    child = prototype
+                else:
+                    child = prototype.parametrized_iteration(
+                        iteration, self.iteration_parameter_values(iteration)
+                    )
+                children_events.append(
+                    child.generate_event_list(
+                        start + self.children_start[0] + iteration * prototype.length,
+                        max_events,
+                        id_tracker,
+                        expand_loops,
+                        settings,
+                    )
+                )
+                max_events -= len(children_events[-1])
+        elif not self.compressed:  # unrolled loop
             children_events = self.children_events(
                 start,
                 max_events,
@@ -3,12 +3,13 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterator, List
+from typing import Any, Dict, Iterator, List
 
 from attrs import define, evolve
 
 from laboneq.compiler.common.compiler_settings import CompilerSettings
 from laboneq.compiler.common.event_type import EventType
+from laboneq.compiler.ir.oscillator_ir import OscillatorFrequencyStepIR
 from laboneq.compiler.ir.section_ir import SectionIR
 from laboneq.data.compilation_job import ParameterInfo
 
@@ -27,6 +28,23 @@ class LoopIterationIR(SectionIR):
         ``shadow`` flag."""
         return evolve(self, iteration=iteration, shadow=True)
 
+    def parametrized_iteration(self, iteration: int, parameter_values: Dict[str, Any]):
+        """Make a copy of this schedule for another iteration of a parametric loop.
+
+        Args:
+            iteration: The index of the iteration in the loop (or chunk)
+            parameter_values: The values of the sweep parameters in this iteration
+        """
+        children = []
+        for child in self.children:
+            child = child.with_parameter_values(parameter_values)
+            if isinstance(child, OscillatorFrequencyStepIR):
+                child = evolve(child, iteration=iteration)
+            children.append(child)
+        return evolve(
+            self, iteration=iteration, shadow=iteration > 0, children=children
+        )
+
     def generate_event_list(
         self,
         start: int,
@@ -1,9 +1,9 @@
 # Copyright 2022 Zurich Instruments AG
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Dict, Iterator, List
+from typing import Any, Dict, Iterator, List
 
-from attrs import define
+from attrs import define, evolve
 
 from laboneq.compiler import CompilerSettings
 from laboneq.compiler.common.event_type import EventType
@@ -56,5 +56,16 @@ class OscillatorFrequencyStepIR(IntervalIR):
             )
         return retval
 
+    def with_parameter_values(self, parameter_values: Dict[str, Any]):
+        if not any(param in parameter_values for param in self.params):
+            return self
+        return evolve(
+            self,
+            values=[
+                parameter_values.get(param, value)
+                for param, value in zip(self.params, self.values)
+            ],
+        )
+
     def __hash__(self):
         return super().__hash__()
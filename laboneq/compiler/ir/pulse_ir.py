@@ -5,8 +5,9 @@ from __future__ import annotations
 
 from typing import Any, Dict, Iterator, List, Optional
 
-from attrs import define
+from attrs import define, evolve
 
+from laboneq._utils import UIDReference
 from laboneq.compiler.common.compiler_settings import CompilerSettings
 from laboneq.compiler.common.event_type import EventType
 from laboneq.compiler.common.play_wave_type import PlayWaveType
@@ -15,6 +16,49 @@ from laboneq.compiler.ir.interval_ir import IntervalIR
 from laboneq.data.compilation_job import ParameterInfo, SectionSignalPulse
 
 
+def swept_pulse_values(
+    pulse: SectionSignalPulse, parameter_values: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Collect the quantities of a played pulse that are given by one of the sweep
+    parameters in ``parameter_values``.
+
+    The keys are the names of the fields of `PulseIR`. For the pulse parameters, the
+    values are dicts of the swept pulse parameters only.
+    """
+    swept = {}
+    for name in (
+        "amplitude",
+        "phase",
+        "set_oscillator_phase",
+        "increment_oscillator_phase",
+    ):
+        value = getattr(pulse, name)
+        if isinstance(value, ParameterInfo) and value.uid in parameter_values:
+            swept[name] = parameter_values[value.uid]
+
+    osc = pulse.signal.oscillator
+    if (
+        osc is not None
+        and not osc.is_hardware
+        and isinstance(osc.frequency, ParameterInfo)
+        and osc.frequency.uid in parameter_values
+    ):
+        swept["oscillator_frequency"] = parameter_values[osc.frequency.uid]
+
+    for name, params in (
+        ("play_pulse_params", pulse.play_pulse_parameters),
+        ("pulse_pulse_params", pulse.pulse_pulse_parameters),
+    ):
+        swept_params = {
+            param: parameter_values[value.uid]
+            for param, value in (params or {}).items()
+            if isinstance(value, UIDReference) and value.uid in parameter_values
+        }
+        if swept_params:
+            swept[name] = swept_params
+    return swept
+
+
 @define(kw_only=True, slots=True)
 class PulseIR(IntervalIR):
     pulse: SectionSignalPulse
@@ -149,6 +193,15 @@ class PulseIR(IntervalIR):
             },
         ]
 
+    def with_parameter_values(self, parameter_values: Dict[str, Any]) -> PulseIR:
+        swept = swept_pulse_values(self.pulse, parameter_values)
+        if not swept:
+            return self
+        for name in ("play_pulse_params", "pulse_pulse_params"):
+            if name in swept:
+                swept[name] = {**getattr(self, name), **swept[name]}
+        return evolve(self, **swept)
+
     def __hash__(self):
         return super().__hash__()
 
@@ -22,6 +22,10 @@ class AcquireGroupSchedule(IntervalSchedule):
     play_pulse_params: list[Optional[Dict[str, Any]]]
     pulse_pulse_params: list[Optional[Dict[str, Any]]]
 
+    def __attrs_post_init__(self):
+        super().__attrs_post_init__()
+        self.has_acquire = True
+
     def _calculate_timing(
         self,
         schedule_data: ScheduleData,  # type: ignore # noqa: F821
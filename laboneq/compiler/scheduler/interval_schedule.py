@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import copy
 from typing import List, Optional, Set, TYPE_CHECKING
 
 from attrs import define, field
@@ -46,6 +47,11 @@ class IntervalSchedule:
     `absolute_time`. While this property is somewhat redundant, it also serves as a flag
     to indicate that the timing for this subtree has already be determined and thus
     allows for an early stop.
+
+    Only intervals that contain an acquisition (`IntervalSchedule.has_acquire`) keep
+    track of their absolute start. All others are independent of their position, so
+    the same instance may appear several times in the tree, for example when reusing
+    the cached schedule of a section (see `IntervalSchedule.copy_for_reuse`).
     """
 
     #: The children of this interval.
@@ -79,6 +85,10 @@ class IntervalSchedule:
     #: in the section which may lead to timing differences.
     cacheable: bool = True
 
+    #: Whether the interval contains an acquisition, and thus must record its absolute
+    #: start time.
+    has_acquire: bool = False
+
     def __attrs_post_init__(self):
         for child in self.children:
             self.grid = lcm(self.grid, child.grid)
@@ -98,6 +108,8 @@ class IntervalSchedule:
                 self.grid = lcm(self.grid, self.sequencer_grid)
             if not child.cacheable:
                 self.cacheable = False
+            if child.has_acquire:
+                self.has_acquire = True
 
     def calculate_timing(
         self, schedule_data: ScheduleData, start: int, start_may_change: bool
@@ -119,6 +131,9 @@ class IntervalSchedule:
     def on_absolute_start_time_fixed(self, start: int, schedule_data: ScheduleData):
         """Notify schedule that its absolute start time has been determined, for
         example for a child of a right-aligned section"""
+        if not self.has_acquire:
+            # The placement is stored in the parents' `children_start`
+            return
         if self.absolute_start is not None:
             assert start == self.absolute_start
             return
@@ -127,6 +142,18 @@ class IntervalSchedule:
         for c, s in zip(self.children, self.children_start):
             c.on_absolute_start_time_fixed(start + s, schedule_data)
 
+    def copy_for_reuse(self) -> IntervalSchedule:
+        """Return a copy of the schedule to be placed elsewhere in the tree.
+
+        Subtrees without acquisitions are shared with the original, only the intervals
+        that record their absolute start time are copied.
+        """
+        if not self.has_acquire:
+            return self
+        new = copy.copy(self)
+        new.children = [c.copy_for_reuse() for c in self.children]
+        return new
+
     def __hash__(self):
         # Hashing an interval schedule is expensive! We need to recursively hash the
         # children, potentially traversing the entire section tree.
@@ -26,6 +26,15 @@ class LoopSchedule(SectionSchedule):
     repetition_mode: Optional[RepetitionMode]
     repetition_time: Optional[int]
 
+    #: Whether the loop is represented by the schedule of its first iteration only.
+    #: The timing of the other iterations is the same, they only differ in the values
+    #: of the sweep parameters.
+    parametric: bool = False
+
+    #: The index of the first iteration into the values of the sweep parameters (non-
+    #: zero for all but the first chunk of a chunked sweep).
+    first_iteration: int = 0
+
     def _calculate_timing(
         self, schedule_data: ScheduleData, loop_start: int, start_may_change: bool
     ) -> int:
@@ -104,6 +113,9 @@ class LoopSchedule(SectionSchedule):
                     c.adjust_length(longest)
                 self.children_start = [longest * i for i in range(len(self.children))]
             self._calculate_length(schedule_data)
+            if self.parametric:
+                assert len(self.children) == 1
+                self.length *= self.iterations  # type: ignore
         return loop_start
 
     def __hash__(self):
@@ -118,6 +130,8 @@ class LoopSchedule(SectionSchedule):
         iterations: int,
         repetition_mode: RepetitionMode | None,
         repetition_time: int | None,
+        parametric: bool = False,
+        first_iteration: int = 0,
     ):
         """Down-cast from SectionSchedule."""
         return cls(
@@ -127,4 +141,6 @@ class LoopSchedule(SectionSchedule):
             iterations=iterations,
             repetition_mode=repetition_mode,
             repetition_time=repetition_time,
+            parametric=parametric,
+            first_iteration=first_iteration,
         )  # type: ignore
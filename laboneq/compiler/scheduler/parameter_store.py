@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import weakref
 from contextlib import contextmanager
-from typing import Dict, Set
+from typing import Dict, Iterable, Optional, Set
 
 
 class QueryTracker:
@@ -55,8 +55,15 @@ class ParameterStore(dict):
         self._notify_trackers(item)
         super().get(item, default)
 
-    def frozen(self):
-        return frozenset(self.items())
+    def frozen(self, keys: Optional[Iterable[str]] = None):
+        """Hashable snapshot of the parameter values.
+
+        If ``keys`` is given, only the values of these parameters (if present) are
+        included, and the query trackers are notified about them.
+        """
+        if keys is None:
+            return frozenset(self.items())
+        return frozenset((key, self[key]) for key in keys if key in self)
 
     def __iter__(self):
         """To avoid all items being (incorrectly) flushed to the query tracker, we must
@@ -28,6 +28,10 @@ class PulseSchedule(IntervalSchedule):
     is_acquire: bool
     markers: Any = None
 
+    def __attrs_post_init__(self):
+        super().__attrs_post_init__()
+        self.has_acquire = self.is_acquire
+
     def _calculate_timing(
         self,
         schedule_data: ScheduleData,  # type: ignore # noqa: F821
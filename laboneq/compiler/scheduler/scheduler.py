@@ -3,7 +3,6 @@
 
 from __future__ import annotations
 
-import copy
 import dataclasses
 import functools
 import itertools
@@ -152,11 +151,21 @@ class Scheduler:
         self._root_schedule: Optional[IntervalSchedule] = None
         self._root_ir: Optional[IntervalIR] = None
         self._scheduled_sections = {}
+        # The parameters queried when scheduling a section, i.e. those its schedule
+        # depends on
+        self._section_parameters: Dict[str, Set[str]] = {}
 
     @trace("scheduler.run()", {"version": "v2"})
     def run(self, nt_parameters: Optional[ParameterStore] = None):
         if nt_parameters is None:
             nt_parameters = ParameterStore()
+        # Schedules with acquisitions have recorded their absolute start time in the
+        # previous run, only the others may be reused in this near-time step
+        self._scheduled_sections = {
+            key: schedule
+            for key, schedule in self._scheduled_sections.items()
+            if not schedule.has_acquire
+        }
         self._root_schedule = self._schedule_root(nt_parameters)
         _logger.info("Schedule completed")
         for (
@@ -241,13 +250,12 @@ class Scheduler:
         """
 
         try:
-            # todo: do not hash the entire current_parameters dict, but just the param values
-            # todo: reduce key to those parameters actually required by the section
-            return copy.deepcopy(
-                self._scheduled_sections[(section_id, current_parameters.frozen())]
-            )
+            return self._scheduled_sections[
+                self._section_cache_key(section_id, current_parameters)
+            ].copy_for_reuse()
         except KeyError:
             pass
+        tracker = current_parameters.create_tracker()
 
         section_info = self._experiment_dao.section_info(section_id)
         sweep_parameters = self._experiment_dao.section_parameters(section_id)
@@ -276,12 +284,29 @@ class Scheduler:
                 schedule.prng_setup = section_info.prng
 
         if schedule.cacheable:
+            self._section_parameters.setdefault(section_id, set()).update(
+                tracker.queries()
+            )
             self._scheduled_sections[
-                (section_id, current_parameters.frozen())
+                self._section_cache_key(section_id, current_parameters)
             ] = schedule
 
         return schedule
 
+    def _section_cache_key(
+        self, section_id: str, current_parameters: ParameterStore[str, float]
+    ):
+        """Key of the cached schedules of a section.
+
+        Only includes the values of the parameters that were queried when scheduling
+        the section before, so that sections which do not depend on the parameters of
+        the enclosing sweeps are scheduled once. Accessing the parameters also notifies
+        the query trackers of the parents, as when actually scheduling the section.
+        """
+        return section_id, current_parameters.frozen(
+            self._section_parameters.get(section_id, ())
+        )
+
     def _swept_hw_oscillators(
         self, sweep_parameters: Set[str], signals: Set[str]
     ) -> Dict[str, SweptHardwareOscillator]:
@@ -343,6 +368,7 @@ class Scheduler:
             if param.values is not None:
                 assert len(param.values) >= section_info.count
         # todo: unroll loops that are too short
+        parametric = False
         if len(sweep_parameters) == 0:
             compressed = section_info.count > 1
             prototype = self._schedule_loop_iteration(
@@ -372,6 +398,9 @@ class Scheduler:
             else:
                 global_iterations = range(section_info.count)
             this_chunk_size = len(global_iterations)
+            parametric = self._has_uniform_timing(
+                section_id, section_info, sweep_parameters, global_iterations
+            )
 
             for local_iteration, global_iteration in enumerate(global_iterations):
                 new_parameters = {
@@ -394,6 +423,13 @@ class Scheduler:
                             swept_hw_oscillators,
                         )
                     )
+                if parametric:
+                    if children_schedules[0].cacheable:
+                        # The first iteration stands for all of them
+                        break
+                    # The timing of match sections depends on the acquisitions
+                    # before, so don't assume that it is the same in all iterations
+                    parametric = False
 
         schedule = self._schedule_children(section_id, section_info, children_schedules)
 
@@ -404,8 +440,51 @@ class Scheduler:
             iterations=this_chunk_size,
             repetition_mode=repetition_mode,
             repetition_time=to_tinysample(repetition_time, self._TINYSAMPLE),
+            parametric=parametric,
+            first_iteration=global_iterations[0] if parametric else 0,
         )
 
+    def _has_uniform_timing(
+        self,
+        section_id: str,
+        section_info: SectionInfo,
+        sweep_parameters: List[ParameterInfo],
+        global_iterations: range,
+    ) -> bool:
+        """Check whether the timing of the iterations of a sweep does not depend on
+        the values of its parameters.
+
+        If so, the loop need not be unrolled in the schedule. Only the first iteration
+        is scheduled, the others are derived from it when generating the events.
+        """
+        if len(global_iterations) < 2 or section_info.length is not None:
+            return False
+        swept = {param.uid: param for param in sweep_parameters}
+
+        def swept_param(value) -> ParameterInfo | None:
+            if isinstance(value, ParameterInfo):
+                return swept.get(value.uid)
+            return None
+
+        dao = self._experiment_dao
+        for section in [section_id, *dao.all_section_children(section_id)]:
+            for signal_id in dao.section_signals(section):
+                for pulse in dao.section_pulses(section, signal_id):
+                    if swept_param(pulse.length) or swept_param(pulse.offset):
+                        return False
+                    if swept_param(pulse.set_oscillator_phase):
+                        osc = pulse.signal.oscillator
+                        if osc is not None and osc.is_hardware:
+                            return False
+                    if (param := swept_param(pulse.amplitude)) is not None:
+                        values = np.asarray(param.values)[
+                            global_iterations.start : global_iterations.stop
+                        ]
+                        if np.max(np.abs(values)) > 1.0 + 1e-9:
+                            # Let the unrolled loop report the offending iteration
+                            return False
+        return True
+
     def _schedule_oscillator_frequency_step(
         self,
         swept_hw_oscillators: Dict[str, SweptHardwareOscillator],
@@ -561,11 +640,9 @@ class Scheduler:
         #  relax in the future
         grid = self._system_grid
 
-        # Deepcopy here because of caching
-        osc_phase_reset = copy.deepcopy(
-            self._schedule_phase_reset(
-                section_id, grid, frozenset(signals), frozenset(hw_osc_reset_signals)
-            )
+        # The cached phase reset is shared, it does not depend on its position
+        osc_phase_reset = self._schedule_phase_reset(
+            section_id, grid, frozenset(signals), frozenset(hw_osc_reset_signals)
         )
 
         if len(swept_hw_oscillators):
@@ -924,13 +1001,12 @@ class Scheduler:
         self, section_id: str, current_parameters: ParameterStore
     ) -> CaseSchedule:
         try:
-            # todo: do not hash the entire current_parameters dict, but just the param values
-            # todo: reduce key to those parameters actually required by the section
-            return copy.deepcopy(
-                self._scheduled_sections[(section_id, current_parameters.frozen())]
-            )
+            return self._scheduled_sections[
+                self._section_cache_key(section_id, current_parameters)
+            ].copy_for_reuse()
         except KeyError:
             pass
+        tracker = current_parameters.create_tracker()
 
         section_info = self._schedule_data.experiment_dao.section_info(section_id)
 
@@ -974,8 +1050,11 @@ class Scheduler:
         schedule = self._schedule_children(section_id, section_info, children_schedules)
         schedule = CaseSchedule.from_section_schedule(schedule, state)
         if schedule.cacheable:
+            self._section_parameters.setdefault(section_id, set()).update(
+                tracker.queries()
+            )
             self._scheduled_sections[
-                (section_id, current_parameters.frozen())
+                self._section_cache_key(section_id, current_parameters)
             ] = schedule
 
         return schedule
@@ -0,0 +1,255 @@
+# Copyright 2023 Zurich Instruments AG
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+import hashlib
+import logging
+import os
+import re
+import threading
+import types
+
+import numpy as np
+
+from laboneq import __version__
+from laboneq.compiler.common.compiler_settings import CompilerSettings
+from laboneq.core.utilities.caching import DiskCache
+from laboneq.core.utilities.pulse_sampler import pulse_function_library
+from laboneq.data.compilation_job import CompilationJob
+from laboneq.data.scheduled_experiment import ScheduledExperiment
+
+_logger = logging.getLogger(__name__)
+
+# Default upper bound for the total size of the cached compilation results
+DEFAULT_COMPILATION_CACHE_MAX_SIZE = 1024 * 1024 * 1024  # bytes
+
+# Section uids from laboneq._utils.id_generator
+_AUTO_SECTION_UID = re.compile(r"_s_\d+")
+
+
+_EMPTY_CELL = "<empty cell>"
+
+
+def _cell_contents(cell: types.CellType):
+    try:
+        return cell.cell_contents
+    except ValueError:
+        return _EMPTY_CELL
+
+
+class _Digest:
+    """Stable digest of an object graph, independent of the process and the
+    identity of the objects."""
+
+    def __init__(self):
+        self._hasher = hashlib.sha256()
+        self._memo: dict[int, int] = {}
+        # Keep the visited objects alive, so that their ids are not reused
+        self._visited: list = []
+        self._auto_uids: dict[str, int] = {}
+
+    def update(self, obj):
+        update = self._hasher.update
+        if isinstance(obj, str) and _AUTO_SECTION_UID.fullmatch(obj):
+            # Auto-generated section uids depend on the number of sections created
+            # before, identify them by the order of appearance instead.
+            index = self._auto_uids.setdefault(obj, len(self._auto_uids))
+            update(f"auto_uid:{index};".encode())
+        elif obj is None or isinstance(obj, (bool, int, float, complex, str)):
+            update(f"{type(obj).__name__}:{obj!r};".encode())
+        elif isinstance(obj, bytes):
+            update(b"bytes:%d;" % len(obj))
+            update(obj)
+        elif isinstance(obj, type):
+            update(f"type:{obj.__module__}.{obj.__qualname__};".encode())
+        elif isinstance(obj, enum.Enum):
+            update(f"enum:{type(obj).__qualname__}.{obj.name};".encode())
+        elif isinstance(obj, np.ndarray):
+            update(f"ndarray:{obj.dtype.str}:{obj.shape};".encode())
+            update(np.ascontiguousarray(obj).tobytes())
+        elif isinstance(obj, np.generic):
+            update(f"{obj.dtype.str}:{obj!r};".encode())
+        elif isinstance(obj, (list, tuple)):
+            update(f"{type(obj).__name__}:{len(obj)}[".encode())
+            for item in obj:
+                self.update(item)
+            update(b"]")
+        elif isinstance(obj, (set, frozenset)):
+            update(f"set:{len(obj)}[".encode())
+            for item_digest in sorted(_digest(item) for item in obj):
+                update(item_digest.encode())
+            update(b"]")
+        elif isinstance(obj, dict):
+            update(f"dict:{len(obj)}{{".encode())
+            for key, value in sorted(obj.items(), key=lambda kv: _digest(kv[0])):
+                self.update(key)
+                self.update(value)
+            update(b"}")
+        elif isinstance(obj, types.ModuleType):
+            update(f"module:{obj.__name__};".encode())
+        elif isinstance(obj, types.FunctionType):
+            if self._update_ref(obj):
+                return
+            update(f"function:{obj.__module__}.{obj.__qualname__};".encode())
+            self._update_code(obj.__code__, obj.__globals__)
+            self.update(obj.__defaults__)
+            self.update(obj.__kwdefaults__)
+            self.update([_cell_contents(cell) for cell in obj.__closure__ or ()])
+        elif hasattr(obj, "__dict__"):
+            if self._update_ref(obj):
+                return
+            update(f"object:{type(obj).__module__}.{type(obj).__qualname__}".encode())
+            self.update(self._object_state(obj))
+        else:
+            update(f"{type(obj).__qualname__}:{obj!r};".encode())
+
+    def _update_ref(self, obj) -> bool:
+        """Digests a reference to an object visited before, and returns True, or
+        marks the object as visited and returns False."""
+        index = self._memo.get(id(obj))
+        if index is not None:
+            # Shared or recursive reference
+            self._hasher.update(f"ref:{index};".encode())
+            return True
+        self._memo[id(obj)] = len(self._memo)
+        self._visited.append(obj)
+        return False
+
+    def _update_code(self, code: types.CodeType, globals_: dict):
+        """Digests the bytecode, with the nested code objects, e.g. of lambdas
+        and comprehensions, the referenced names, and the values of the referenced
+        globals of the function."""
+        update = self._hasher.update
+        update(b"code:")
+        update(code.co_code)
+        self.update(code.co_names)
+        update(b"consts[")
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                self._update_code(const, globals_)
+            else:
+                self.update(const)
+        update(b"]globals{")
+        for name in code.co_names:
+            if name in globals_:
+                self.update(name)
+                self.update(globals_[name])
+        update(b"}")
+
+    def _object_state(self, obj) -> dict:
+        return vars(obj)
+
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()
+
+
+def _digest(obj) -> str:
+    digest = _Digest()
+    digest.update(obj)
+    return digest.hexdigest()
+
+
+def _used_pulse_functions(job: CompilationJob) -> dict:
+    return {
+        pulse_def.function: pulse_function_library.get(pulse_def.function)
+        for pulse_def in job.experiment_info.pulse_defs
+        if pulse_def.function is not None
+    }
+
+
+class CompilationCache(DiskCache):
+    """On-disk cache of compilation results.
+
+    Entries are keyed by a digest of the compilation job, the effective compiler
+    settings, the code of the used pulse functionals and the LabOne Q version.
+    The least recently used entries are evicted once the total size of the cache
+    exceeds ``max_size`` bytes, and entries not used for more than ``max_age``
+    seconds are evicted as well.
+    """
+
+    SUFFIX = ".json"
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        max_size: int = DEFAULT_COMPILATION_CACHE_MAX_SIZE,
+        max_age: float | None = None,
+    ):
+        super().__init__(directory, max_size=max_size, max_age=max_age)
+
+    @staticmethod
+    def make_key(job: CompilationJob, settings: CompilerSettings) -> str:
+        digest = _Digest()
+        digest.update(__version__)
+        digest.update(dataclasses.asdict(settings))
+        digest.update(_used_pulse_functions(job))
+        digest.update(job.experiment_info)
+        digest.update(job.execution)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> ScheduledExperiment | None:
+        from laboneq.dsl.serialization import Serializer
+
+        data = self._read(key)
+        if data is None:
+            self._count(misses=1)
+            return None
+        try:
+            scheduled_experiment = Serializer.from_json(
+                data.decode(), ScheduledExperiment
+            )
+        except Exception as exc:
+            _logger.warning("Ignoring invalid compilation cache entry %s: %s", key, exc)
+            self._discard(key)
+            self._count(misses=1)
+            return None
+        self._count(hits=1)
+        return scheduled_experiment
+
+    def put(self, key: str, scheduled_experiment: ScheduledExperiment):
+        from laboneq.dsl.serialization import Serializer
+
+        try:
+            json_string = Serializer.to_json(scheduled_experiment)
+        except Exception as exc:
+            _logger.warning("Failed to store compilation result in cache: %s", exc)
+            return
+        super().put(key, json_string.encode())
+
+
+_compilation_cache: CompilationCache | None = None
+_compilation_cache_lock = threading.Lock()
+
+
+def set_compilation_cache(cache: CompilationCache | None):
+    """Sets the cache used by all compilations, or disables caching if None."""
+    global _compilation_cache
+    with _compilation_cache_lock:
+        _compilation_cache = cache
+
+
+def get_compilation_cache() -> CompilationCache | None:
+    """The cache used by all compilations.
+
+    Unless set via `set_compilation_cache`, the cache is configured by the
+    environment variables LABONEQ_COMPILATION_CACHE_DIR (disabled if not set),
+    LABONEQ_COMPILATION_CACHE_MAX_SIZE (bytes) and LABONEQ_COMPILATION_CACHE_MAX_AGE
+    (seconds).
+    """
+    global _compilation_cache
+    with _compilation_cache_lock:
+        directory = os.environ.get("LABONEQ_COMPILATION_CACHE_DIR")
+        if _compilation_cache is None and directory is not None:
+            max_size = os.environ.get("LABONEQ_COMPILATION_CACHE_MAX_SIZE")
+            max_age = os.environ.get("LABONEQ_COMPILATION_CACHE_MAX_AGE")
+            _compilation_cache = CompilationCache(
+                directory,
+                max_size=DEFAULT_COMPILATION_CACHE_MAX_SIZE
+                if max_size is None
+                else int(max_size),
+                max_age=None if max_age is None else float(max_age),
+            )
+        return _compilation_cache
@@ -18,6 +18,11 @@ from laboneq.compiler.code_generator.measurement_calculator import (
     IntegrationTimes,
     SignalDelays,
 )
+from laboneq.compiler.code_generator.pulse_sampling_cache import (
+    PulseSamplingCache,
+    get_pulse_sampling_cache,
+)
+from laboneq.compiler.code_generator.waveform_pool import WaveformPool
 from laboneq.compiler.common import compiler_settings
 from laboneq.compiler.common.awg_info import AWGInfo, AwgKey
 from laboneq.compiler.common.awg_signal_type import AWGSignalType
@@ -32,10 +37,17 @@ from laboneq.compiler.feedback_router.feedback_router import compute_feedback_ro
 from laboneq.compiler.scheduler.sampling_rate_tracker import SamplingRateTracker
 from laboneq.compiler.scheduler.scheduler import Scheduler
 from laboneq.compiler.workflow import rt_linker
+from laboneq.compiler.workflow.compilation_cache import (
+    CompilationCache,
+    get_compilation_cache,
+)
 from laboneq.compiler.workflow.compiler_output import (
     CombinedRealtimeCompilerOutputCode,
     CombinedRealtimeCompilerOutputPrettyPrinter,
 )
+from laboneq.compiler.workflow.incremental_compilation import (
+    get_incremental_compilation_store,
+)
 from laboneq.compiler.workflow.neartime_execution import (
     NtCompilerExecutor,
     legacy_execution_program,
@@ -101,6 +113,7 @@ class Compiler:
         self._delays_by_signal: dict[str, OnDeviceDelayCompensation] = {}
         self._precompensations: dict[str, PrecompensationInfo] | None = None
         self._signal_objects: Dict[str, SignalObj] = {}
+        self._compilation_cache: CompilationCache | None = None
 
         _logger.info("Starting LabOne Q Compiler run...")
         self._check_tinysamples()
@@ -261,6 +274,9 @@ class Compiler:
         )
         self._signal_objects = self._generate_signal_objects()
 
+    def _compile_realtime(self):
+        pulse_sampling_cache = get_pulse_sampling_cache() or PulseSamplingCache()
+        waveform_pool = WaveformPool()
         rt_compiler = RealtimeCompiler(
             self._experiment_dao,
             Scheduler(
@@ -272,8 +288,12 @@ class Compiler:
             self._sampling_rate_tracker,
             self._signal_objects,
             self._settings,
+            pulse_sampling_cache=pulse_sampling_cache,
+            waveform_pool=waveform_pool,
+        )
+        executor = NtCompilerExecutor(
+            rt_compiler, max_workers=self._settings.RT_COMPILER_MAX_WORKERS
         )
-        executor = NtCompilerExecutor(rt_compiler)
         executor.run(self._execution)
         self._combined_compiler_output = executor.combined_compiler_output()
         if self._combined_compiler_output is None:
@@ -293,7 +313,13 @@ class Compiler:
         )
 
         if self._settings.LOG_REPORT:
-            executor.report()
+            executor.report(
+                cache_stats=None
+                if self._compilation_cache is None
+                else self._compilation_cache.stats,
+                sampling_cache_stats=pulse_sampling_cache.stats,
+                waveform_pool_stats=waveform_pool.stats,
+            )
 
     @staticmethod
     def _get_total_rounded_delay(delay, signal_id, device_type, sampling_rate):
@@ -1150,13 +1176,40 @@ class Compiler:
     def run(self, data) -> CompiledExperiment:
         _logger.debug("ES Compiler run")
 
+        cache_key = None
+        if isinstance(data, CompilationJob):
+            self._compilation_cache = get_compilation_cache()
+        if self._compilation_cache is not None:
+            cache_key = self._compilation_cache.make_key(data, self._settings)
+            scheduled_experiment = self._compilation_cache.get(cache_key)
+            if scheduled_experiment is not None:
+                _logger.info(
+                    "Using the cached compilation result (compilation cache: %s).",
+                    self._compilation_cache.stats,
+                )
+                return CompiledExperiment(scheduled_experiment=scheduled_experiment)
+
         self.use_experiment(data)
         self._analyze_setup()
         self._process_experiment()
 
+        incremental_key = None
+        if self._settings.INCREMENTAL_COMPILATION and isinstance(data, CompilationJob):
+            incremental_store = get_incremental_compilation_store()
+            incremental_key = incremental_store.make_key(data, self._settings)
+            self._combined_compiler_output = incremental_store.recompile(
+                incremental_key, data
+            )
+        if self._combined_compiler_output is None:
+            self._compile_realtime()
+        if incremental_key is not None:
+            incremental_store.put(incremental_key, data, self._combined_compiler_output)
+
         self._generate_recipe()
 
         retval = self.compiler_output()
+        if cache_key is not None:
+            self._compilation_cache.put(cache_key, retval.scheduled_experiment)
 
         _logger.info("Finished LabOne Q Compiler run.")
 
@@ -0,0 +1,320 @@
+# Copyright 2023 Zurich Instruments AG
+# SPDX-License-Identifier: Apache-2.0
+
+"""Incremental recompilation of experiments which only differ in calibration values.
+
+The output of a compilation is remembered under a digest of the compilation job
+in which those calibration values are masked that neither affect the timing nor
+the generated sequencer code: the frequencies of hardware oscillators, and the
+LO frequencies, voltage offsets, mixer calibrations, ranges, thresholds,
+amplifier pump settings and amplitudes of the signals, which all end up in the
+node settings of the recipe, as well as the amplitudes and samples of the
+pulses. When a job with the same digest is compiled again, the SeqC programs,
+command tables and wave indices of the previous compilation are reused, and only
+the waveforms containing a changed pulse are re-sampled. The recipe is always
+generated from scratch.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import threading
+from collections import defaultdict
+
+import numpy as np
+
+from laboneq.compiler.common.compiler_settings import CompilerSettings
+from laboneq.compiler.workflow.compilation_cache import (
+    _Digest,
+    _used_pulse_functions,
+)
+from laboneq.compiler.workflow.compiler_output import (
+    CombinedRealtimeCompilerOutput,
+    CombinedRealtimeCompilerOutputCode,
+)
+from laboneq.core.exceptions import LabOneQException
+from laboneq.core.utilities.caching import CacheStats, LruCache
+from laboneq.data.compilation_job import (
+    CompilationJob,
+    OscillatorInfo,
+    ParameterInfo,
+    PulseDef,
+    SignalInfo,
+)
+from laboneq.data.scheduled_experiment import ArtifactsCodegen, ScheduledExperiment
+
+_logger = logging.getLogger(__name__)
+
+# Default number of remembered compilations
+DEFAULT_INCREMENTAL_COMPILATION_MAX_ENTRIES = 4
+
+# Signal properties which only enter the node settings of the recipe
+_NODE_SETTING_FIELDS = (
+    "lo_frequency",
+    "voltage_offset",
+    "mixer_calibration",
+    "signal_range",
+    "threshold",
+    "amplifier_pump",
+    "amplitude",
+)
+
+_WAVE_SUFFIXES = ("", "_i", "_q", "_marker1", "_marker2")
+
+
+@dataclasses.dataclass
+class IncrementalCompilationStats(CacheStats):
+    """Hits are the incremental compilations, misses the full compilations."""
+
+    def __str__(self):
+        return (
+            f"{self.hits} incremental, {self.misses} full,"
+            f" {self.evictions} evictions"
+        )
+
+
+def _is_calibration_value(value) -> bool:
+    """Whether the value is fixed, i.e. not (partially) swept by a parameter."""
+    if isinstance(value, ParameterInfo):
+        return False
+    if dataclasses.is_dataclass(value):
+        return all(
+            not isinstance(getattr(value, f.name), ParameterInfo)
+            for f in dataclasses.fields(value)
+        )
+    return True
+
+
+class _StructureDigest(_Digest):
+    """Digest of a compilation job, ignoring the calibration values which can be
+    applied without a full recompilation."""
+
+    def _object_state(self, obj) -> dict:
+        if isinstance(obj, SignalInfo):
+            masked = _NODE_SETTING_FIELDS
+        elif isinstance(obj, OscillatorInfo) and obj.is_hardware:
+            masked = ("frequency",)
+        elif isinstance(obj, PulseDef):
+            masked = ("amplitude",)
+        else:
+            return vars(obj)
+        state = dict(vars(obj))
+        for name in masked:
+            if _is_calibration_value(state[name]):
+                state[name] = "<calibration>"
+        if isinstance(obj, PulseDef) and obj.samples is not None:
+            state["samples"] = ("<calibration>", np.shape(obj.samples))
+        return state
+
+
+def _copy_output(
+    combined_output: CombinedRealtimeCompilerOutput,
+) -> CombinedRealtimeCompilerOutput:
+    """Copies the output, such that its waveforms can be replaced without
+    affecting the original."""
+    return dataclasses.replace(
+        combined_output,
+        combined_output={
+            device_class: dataclasses.replace(
+                output, waves={name: dict(wave) for name, wave in output.waves.items()}
+            )
+            if isinstance(output, CombinedRealtimeCompilerOutputCode)
+            else output
+            for device_class, output in combined_output.combined_output.items()
+        },
+    )
+
+
+def _changed_pulses(
+    previous: dict[str, PulseDef], current: list[PulseDef]
+) -> list[PulseDef]:
+    changed = []
+    for pulse_def in current:
+        previous_def = previous[pulse_def.uid]
+        if pulse_def.amplitude != previous_def.amplitude or (
+            (pulse_def.samples is None) != (previous_def.samples is None)
+            or pulse_def.samples is not None
+            and not np.array_equal(pulse_def.samples, previous_def.samples)
+        ):
+            changed.append(pulse_def)
+    return changed
+
+
+def _resample_pulses(
+    output: CombinedRealtimeCompilerOutputCode,
+    pulse_defs: list[PulseDef],
+    previous_pulse_defs: dict[str, PulseDef],
+) -> bool:
+    """Replaces the changed pulses in the waveforms of the output.
+
+    Returns False if the changes cannot be applied to the existing waveforms.
+    """
+    from laboneq.core.utilities.replace_pulse import calc_wave_replacements
+
+    kernels = {
+        uid for weights in output.integration_weights.values() for uid in weights
+    }
+    covered_waves = {
+        f"{weight['basename']}{suffix}.wave"
+        for weights in output.integration_weights.values()
+        for weight in weights.values()
+        for suffix in ("", "_i", "_q")
+    }
+    instances_by_wave = defaultdict(list)
+    for pulse_id, entry in output.pulse_map.items():
+        for sig_string, waveform_map in entry.waveforms.items():
+            covered_waves.update(f"{sig_string}{s}.wave" for s in _WAVE_SUFFIXES)
+            instances_by_wave[sig_string].extend(
+                (pulse_id, instance) for instance in waveform_map.instances
+            )
+    if not covered_waves.issuperset(output.waves):
+        # Waves of later near-time steps are not in the pulse map
+        return False
+
+    for pulse_def in pulse_defs:
+        amplitudes = (pulse_def.amplitude, previous_pulse_defs[pulse_def.uid].amplitude)
+        if (
+            pulse_def.uid in kernels
+            # The waveforms only store the amplitude relative to the pulse amplitude
+            or amplitudes[1] == 0
+            or any(isinstance(a, ParameterInfo) for a in amplitudes)
+        ):
+            return False
+        entry = output.pulse_map.get(pulse_def.uid)
+        if entry is None:
+            continue
+        for sig_string, waveform_map in entry.waveforms.items():
+            for instance in waveform_map.instances:
+                if instance.can_compress:
+                    return False
+                start = instance.offset_samples
+                end = start + (instance.length or waveform_map.length_samples)
+                for other_id, other in instances_by_wave[sig_string]:
+                    if other is instance:
+                        continue
+                    other_start = other.offset_samples
+                    other_end = other_start + (
+                        other.length
+                        or output.pulse_map[other_id]
+                        .waveforms[sig_string]
+                        .length_samples
+                    )
+                    if other_start < end and start < other_end:
+                        # Overlapping pulses are summed up, not replaced
+                        return False
+
+    scheduled_experiment = ScheduledExperiment(
+        artifacts=ArtifactsCodegen(
+            waves=list(output.waves.values()),
+            wave_indices=output.wave_indices,
+            pulse_map=output.pulse_map,
+        )
+    )
+    current_waves = []
+    for pulse_def in pulse_defs:
+        if pulse_def.amplitude is None:
+            pulse_def = dataclasses.replace(pulse_def, amplitude=1.0)
+        calc_wave_replacements(
+            scheduled_experiment, pulse_def.uid, pulse_def, current_waves
+        )
+    for wave in current_waves:
+        output.waves[wave["filename"]]["samples"] = wave["samples"]
+    return True
+
+
+@dataclasses.dataclass
+class _Entry:
+    pulse_defs: dict[str, PulseDef]
+    combined_output: CombinedRealtimeCompilerOutput
+
+
+class IncrementalCompilationStore:
+    """Remembers the outputs of the last compilations, to recompile experiments
+    which only differ in calibration values incrementally.
+
+    At most ``max_entries`` outputs are kept in memory, the least recently used
+    ones are dropped first.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_INCREMENTAL_COMPILATION_MAX_ENTRIES):
+        self.stats = IncrementalCompilationStats()
+        self._entries: LruCache[str, _Entry] = LruCache(max_entries, stats=self.stats)
+
+    @staticmethod
+    def make_key(job: CompilationJob, settings: CompilerSettings) -> str:
+        digest = _StructureDigest()
+        digest.update(dataclasses.asdict(settings))
+        digest.update(_used_pulse_functions(job))
+        digest.update(job.experiment_info)
+        digest.update(job.execution)
+        return digest.hexdigest()
+
+    def recompile(
+        self, key: str, job: CompilationJob
+    ) -> CombinedRealtimeCompilerOutput | None:
+        """Returns the output of the previous compilation with the same key, with
+        the changed pulses re-sampled, or None if a full compilation is required."""
+        entry = self._entries.peek(key)
+        if entry is None:
+            self._entries.count(misses=1)
+            return None
+        pulse_defs = _changed_pulses(entry.pulse_defs, job.experiment_info.pulse_defs)
+        combined_output = _copy_output(entry.combined_output)
+        try:
+            applicable = all(
+                _resample_pulses(output, pulse_defs, entry.pulse_defs)
+                for output in combined_output.combined_output.values()
+                if isinstance(output, CombinedRealtimeCompilerOutputCode)
+            )
+        except LabOneQException as exc:
+            # Let the full compilation report the error
+            _logger.debug("Cannot re-sample the changed pulses: %s", exc)
+            applicable = False
+        if not applicable:
+            self._entries.count(misses=1)
+            return None
+        self._entries.count(hits=1)
+        _logger.info(
+            "Recompiling incrementally, re-sampled %d changed pulse(s).",
+            len(pulse_defs),
+        )
+        return combined_output
+
+    def put(
+        self,
+        key: str,
+        job: CompilationJob,
+        combined_output: CombinedRealtimeCompilerOutput,
+    ):
+        entry = _Entry(
+            pulse_defs={p.uid: p for p in job.experiment_info.pulse_defs},
+            # The waves of the returned result may be replaced by the user
+            combined_output=_copy_output(combined_output),
+        )
+        self._entries.put(key, entry)
+
+    def clear(self):
+        self._entries.clear()
+
+
+_incremental_compilation_store: IncrementalCompilationStore | None = None
+_incremental_compilation_store_lock = threading.Lock()
+
+
+def set_incremental_compilation_store(store: IncrementalCompilationStore | None):
+    """Sets the store used by compilations with `INCREMENTAL_COMPILATION` enabled.
+
+    If None, a default store is created on first use.
+    """
+    global _incremental_compilation_store
+    with _incremental_compilation_store_lock:
+        _incremental_compilation_store = store
+
+
+def get_incremental_compilation_store() -> IncrementalCompilationStore:
+    global _incremental_compilation_store
+    with _incremental_compilation_store_lock:
+        if _incremental_compilation_store is None:
+            _incremental_compilation_store = IncrementalCompilationStore()
+        return _incremental_compilation_store
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 from builtins import frozenset
+import logging
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Set
 
@@ -10,18 +11,25 @@ from numpy.typing import ArrayLike
 
 from laboneq.compiler.scheduler.parameter_store import ParameterStore
 from laboneq.compiler.workflow import rt_linker
-from laboneq.compiler.workflow.compiler_output import CodegenOutput
+from laboneq.compiler.workflow.compiler_output import (
+    CodegenOutput,
+    RealtimeCompilerOutput,
+)
 from laboneq.compiler.workflow.realtime_compiler import RealtimeCompiler
 from laboneq.compiler.workflow.reporter import CompilationReportGenerator
 from laboneq.compiler.workflow.rt_linker import CombinedRealtimeCompilerOutput
+from laboneq.core.utilities.forked_pool import run_forked
 from laboneq.executor.executor import (
     ExecRT,
     ExecutorBase,
     LoopFlags,
     LoopingMode,
     Sequence,
+    Statement,
 )
 
+_logger = logging.getLogger(__name__)
+
 
 @dataclass
 class IterationStep:
@@ -65,11 +73,37 @@ def legacy_execution_program():
     )
 
 
+def _compile_in_worker(
+    rt_compiler: RealtimeCompiler, nt_parameter_values: Dict[str, Any]
+) -> tuple[RealtimeCompilerOutput, Set[str]]:
+    parameter_store = ParameterStore(nt_parameter_values)
+    tracker = parameter_store.create_tracker()
+    compiler_output = rt_compiler.run(parameter_store)
+    return compiler_output, tracker.queries()
+
+
+@dataclass
+class _DeferredStep:
+    nt_step_indices: List[int]
+    requested_values: frozenset
+    nt_parameter_values: Dict[str, Any]
+
+
 class NtCompilerExecutor(ExecutorBase):
-    def __init__(self, rt_compiler: RealtimeCompiler):
+    """Compiles the real-time program for every near-time step.
+
+    With `max_workers` > 1, only the first step is compiled while walking the
+    near-time loops. The distinct parameter states of the remaining steps are then
+    compiled in a pool of forked worker processes, and the outputs are merged in
+    step order, exactly as if they had been compiled one after another.
+    """
+
+    def __init__(self, rt_compiler: RealtimeCompiler, max_workers: int = 1):
         super().__init__(looping_mode=LoopingMode.NEAR_TIME_ONLY)
         self._rt_compiler = rt_compiler
+        self._max_workers = max_workers
         self._iteration_stack = IterationStack()
+        self._deferred_steps: List[_DeferredStep] = []
 
         self._compiler_output_by_param_values: Dict[frozenset, CodegenOutput] = {}
         self._last_compiler_output: Optional[CodegenOutput] = None
@@ -103,21 +137,24 @@ class NtCompilerExecutor(ExecutorBase):
         averaging_mode,
         acquisition_type,
     ):
+        nt_step_indices = list(self._iteration_stack.nt_loop_indices())
         if self._required_parameters is not None:
             # We already know what subset of the near-time parameters are required
             # by the real-time sequence. If we already have a compiler output for
             # that state, we can skip the compilation.
             requested_values = self._frozen_required_parameters()
-            if requested_values in self._compiler_output_by_param_values:
-                new_compiler_output = self._compiler_output_by_param_values[
-                    requested_values
-                ]
-
-                self._last_compiler_output = new_compiler_output
-                self._combined_compiler_output.add_total_execution_time(
-                    new_compiler_output
+            if self._max_workers > 1:
+                self._deferred_steps.append(
+                    _DeferredStep(
+                        nt_step_indices,
+                        requested_values,
+                        self._iteration_stack.nt_parameter_values(),
+                    )
                 )
                 return
+            if requested_values in self._compiler_output_by_param_values:
+                self._reuse_compiler_output(requested_values)
+                return
 
         # We don't have a compiler output for this state yet, so we need to compile
         parameter_store = ParameterStore(self._iteration_stack.nt_parameter_values())
@@ -130,10 +167,23 @@ class NtCompilerExecutor(ExecutorBase):
             assert self._required_parameters == tracker.queries()
 
         requested_values = self._frozen_required_parameters()
+        self._add_compiler_output(
+            new_compiler_output, requested_values, nt_step_indices
+        )
 
-        self._compiler_output_by_param_values[requested_values] = new_compiler_output
+    def _reuse_compiler_output(self, requested_values: frozenset):
+        new_compiler_output = self._compiler_output_by_param_values[requested_values]
 
-        nt_step_indices = list(self._iteration_stack.nt_loop_indices())
+        self._last_compiler_output = new_compiler_output
+        self._combined_compiler_output.add_total_execution_time(new_compiler_output)
+
+    def _add_compiler_output(
+        self,
+        new_compiler_output: RealtimeCompilerOutput,
+        requested_values: frozenset,
+        nt_step_indices: List[int],
+    ):
+        self._compiler_output_by_param_values[requested_values] = new_compiler_output
 
         # Assemble the combined compiler output
         if self._combined_compiler_output is None:
@@ -152,6 +202,46 @@ class NtCompilerExecutor(ExecutorBase):
         self._compiler_report_generator.update(new_compiler_output, nt_step_indices)
         self._last_compiler_output = new_compiler_output
 
+    def run(self, root_sequence: Statement):
+        super().run(root_sequence)
+        self._compile_deferred_steps()
+
+    def _compile_deferred_steps(self):
+        deferred_steps, self._deferred_steps = self._deferred_steps, []
+        # Parameter states still to compile, in the order of their first occurrence
+        pending: Dict[frozenset, Dict[str, Any]] = {}
+        for step in deferred_steps:
+            if step.requested_values not in self._compiler_output_by_param_values:
+                pending.setdefault(step.requested_values, step.nt_parameter_values)
+
+        compiled = dict(zip(pending, self._compile_parallel(list(pending.values()))))
+
+        for step in deferred_steps:
+            if step.requested_values in self._compiler_output_by_param_values:
+                self._reuse_compiler_output(step.requested_values)
+                continue
+            new_compiler_output, queries = compiled[step.requested_values]
+            assert self._required_parameters == queries
+            self._add_compiler_output(
+                new_compiler_output, step.requested_values, step.nt_step_indices
+            )
+
+    def _compile_parallel(
+        self, nt_parameter_values: List[Dict[str, Any]]
+    ) -> List[tuple[RealtimeCompilerOutput, Set[str]]]:
+        _logger.debug(
+            "Compiling %d near-time steps in up to %d processes",
+            len(nt_parameter_values),
+            self._max_workers,
+        )
+        # The worker processes inherit the state of the compiler
+        return run_forked(
+            _compile_in_worker,
+            self._rt_compiler,
+            nt_parameter_values,
+            self._max_workers,
+        )
+
     def _frozen_required_parameters(self):
         return frozenset(
             (k, v)
@@ -162,9 +252,14 @@ class NtCompilerExecutor(ExecutorBase):
     def combined_compiler_output(self):
         return self._combined_compiler_output
 
-    def report(self):
+    def report(
+        self, cache_stats=None, sampling_cache_stats=None, waveform_pool_stats=None
+    ):
         if self._combined_compiler_output is not None:
             self._compiler_report_generator.calculate_total(
                 self._combined_compiler_output
             )
+        self._compiler_report_generator.set_cache_stats(
+            cache_stats, sampling_cache_stats, waveform_pool_stats
+        )
         return self._compiler_report_generator.log_report()
@@ -12,6 +12,8 @@ from laboneq._observability.tracing import trace
 from laboneq.compiler import CodeGenerator, CompilerSettings
 from laboneq.compiler.code_generator.ir_to_event_list import generate_event_list_from_ir
 from laboneq.compiler.code_generator.code_generator_pretty_printer import PrettyPrinter
+from laboneq.compiler.code_generator.pulse_sampling_cache import PulseSamplingCache
+from laboneq.compiler.code_generator.waveform_pool import WaveformPool
 from laboneq.compiler.common.signal_obj import SignalObj
 from laboneq.compiler.experiment_access import ExperimentDAO
 from laboneq.compiler.ir.ir import IR
@@ -52,6 +54,8 @@ class RealtimeCompiler:
         sampling_rate_tracker: SamplingRateTracker,
         signal_objects: Dict[str, SignalObj],
         settings: CompilerSettings | None = None,
+        pulse_sampling_cache: PulseSamplingCache | None = None,
+        waveform_pool: WaveformPool | None = None,
     ):
         self._experiment_dao = experiment_dao
         self._ir = None
@@ -59,6 +63,8 @@ class RealtimeCompiler:
         self._sampling_rate_tracker = sampling_rate_tracker
         self._signal_objects = signal_objects
         self._settings = settings
+        self._pulse_sampling_cache = pulse_sampling_cache
+        self._waveform_pool = waveform_pool
 
         self._code_generators = {}
 
@@ -67,7 +73,12 @@ class RealtimeCompiler:
 
     def _lower_ir_to_code(self, ir: IR):
         if len(self._signal_objects) == 0:
-            self._code_generators[0] = CodeGenerator(settings=self._settings, ir=ir)
+            self._code_generators[0] = CodeGenerator(
+                settings=self._settings,
+                ir=ir,
+                pulse_sampling_cache=self._pulse_sampling_cache,
+                waveform_pool=self._waveform_pool,
+            )
             self._code_generators[0].generate_code(self._signal_objects)
             return
 
@@ -81,9 +92,18 @@ class RealtimeCompiler:
             raise Exception("Invalid device class encountered")
 
         for device_class in device_classes:
-            self._code_generators[device_class] = _registered_codegens[device_class](
-                ir, settings=self._settings
-            )
+            codegen_class = _registered_codegens[device_class]
+            if codegen_class is CodeGenerator:
+                self._code_generators[device_class] = CodeGenerator(
+                    ir,
+                    settings=self._settings,
+                    pulse_sampling_cache=self._pulse_sampling_cache,
+                    waveform_pool=self._waveform_pool,
+                )
+            else:
+                self._code_generators[device_class] = codegen_class(
+                    ir, settings=self._settings
+                )
             self._code_generators[device_class].generate_code(
                 [
                     s
@@ -148,6 +148,9 @@ class CompilationReportGenerator:
     def __init__(self):
         self._data: list[ReportEntry] = []
         self._total: ReportEntry | None = None
+        self._cache_stats = None
+        self._sampling_cache_stats = None
+        self._waveform_pool_stats = None
 
     def update(
         self, rt_compiler_output: RealtimeCompilerOutput, step_indices: list[int]
@@ -175,6 +178,13 @@ class CompilationReportGenerator:
             tot.waveform_samples += t.waveform_samples
         self._total = tot
 
+    def set_cache_stats(
+        self, cache_stats, sampling_cache_stats=None, waveform_pool_stats=None
+    ):
+        self._cache_stats = cache_stats
+        self._sampling_cache_stats = sampling_cache_stats
+        self._waveform_pool_stats = waveform_pool_stats
+
     def create_table(self) -> Table:
         entries = sorted(self._data)
         all_nt_steps = set(e.nt_step_indices for e in entries)
@@ -240,6 +250,16 @@ class CompilationReportGenerator:
             for column, cell in zip(table.columns, cells):
                 column.footer = cell
 
+        captions = []
+        if self._cache_stats is not None:
+            captions.append(f"Compilation cache: {self._cache_stats}")
+        if self._sampling_cache_stats is not None:
+            captions.append(f"Pulse sampling cache: {self._sampling_cache_stats}")
+        if self._waveform_pool_stats is not None:
+            captions.append(f"Waveform pool: {self._waveform_pool_stats}")
+        if captions:
+            table.caption = "\n".join(captions)
+
         return table
 
     def __str__(self):
@@ -21,6 +21,9 @@ from laboneq.core.exceptions.laboneq_exception import LabOneQException
 
 
 def _deep_compare(a: Any, b: Any) -> bool:
+    if a is b:
+        # E.g. waveforms shared via the waveform pool
+        return True
     if type(a) != type(b):
         return False
     if isinstance(a, list):
@@ -0,0 +1,40 @@
+# Copyright 2023 Zurich Instruments AG
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+
+from laboneq.core.utilities.caching import DiskCache
+
+# Default upper bound for the total size of the cached ELF files
+DEFAULT_AWG_COMPILE_CACHE_MAX_SIZE = 256 * 1024 * 1024  # bytes
+
+
+class AwgCompileCache(DiskCache):
+    """On-disk, content-addressed cache of compiled AWG ELF binaries.
+
+    Entries are keyed by a digest of the SeqC source and all inputs that affect
+    the output of the AWG compiler. The least recently used entries are evicted
+    once the total size of the cache exceeds ``max_size`` bytes. The access time
+    of an entry is tracked via the modification time of its file, so the LRU
+    order survives across sessions.
+    """
+
+    SUFFIX = ".elf"
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        max_size: int = DEFAULT_AWG_COMPILE_CACHE_MAX_SIZE,
+    ):
+        super().__init__(directory, max_size=max_size)
+
+    @staticmethod
+    def make_key(code: str, **compile_options) -> str:
+        hasher = hashlib.sha256()
+        hasher.update(code.encode())
+        hasher.update(json.dumps(compile_options, sort_keys=True, default=str).encode())
+        return hasher.hexdigest()
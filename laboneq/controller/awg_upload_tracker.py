@@ -0,0 +1,72 @@
+# Copyright 2023 Zurich Instruments AG
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import hashlib
+from collections import defaultdict
+
+import numpy as np
+
+from laboneq.controller.communication import DaqNodeSetAction
+from laboneq.controller.recipe_processor import AwgKey
+
+
+def _digest(value) -> str:
+    hasher = hashlib.sha1()
+    if isinstance(value, np.ndarray):
+        hasher.update(str((value.dtype.str, value.shape)).encode())
+        hasher.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, bytes):
+        hasher.update(value)
+    else:
+        hasher.update(repr(value).encode())
+    return hasher.hexdigest()
+
+
+class AwgUploadTracker:
+    """Keeps track of the AWG content resident on the devices.
+
+    For every AWG, the digest of the loaded SeqC program and the digests of the
+    values of the uploaded waveform and command table nodes are recorded, so that
+    subsequent uploads of identical content can be skipped. Uploading a new program
+    invalidates the waveforms and the command table of the respective AWG, as they
+    have to be reloaded together with the ELF.
+    """
+
+    def __init__(self):
+        self._seqc_digests: dict[AwgKey, str] = {}
+        self._node_digests: dict[AwgKey, dict[str, str]] = defaultdict(dict)
+
+    def is_seqc_resident(self, awg_key: AwgKey, seqc_code: str) -> bool:
+        return self._seqc_digests.get(awg_key) == _digest(seqc_code)
+
+    def set_seqc_resident(self, awg_key: AwgKey, seqc_code: str):
+        self._seqc_digests[awg_key] = _digest(seqc_code)
+        self._node_digests.pop(awg_key, None)
+
+    def filter_changed(
+        self, awg_key: AwgKey, actions: list[DaqNodeSetAction]
+    ) -> list[DaqNodeSetAction]:
+        """Returns only the actions whose values differ from the resident ones, and
+        records the new values as resident."""
+        node_digests = self._node_digests[awg_key]
+        changed: list[DaqNodeSetAction] = []
+        for action in actions:
+            digest = _digest(action.value)
+            if node_digests.get(action.path) == digest:
+                continue
+            node_digests[action.path] = digest
+            changed.append(action)
+        return changed
+
+    def invalidate(self, awg_key: AwgKey | None = None):
+        if awg_key is None:
+            self._seqc_digests.clear()
+            self._node_digests.clear()
+        else:
+            self._seqc_digests.pop(awg_key, None)
+            self._node_digests.pop(awg_key, None)
+
+    def invalidate_nodes(self, awg_key: AwgKey):
+        self._node_digests.pop(awg_key, None)
@@ -7,6 +7,7 @@ import concurrent.futures
 import itertools
 import logging
 import os
+import tempfile
 import time
 from collections import defaultdict
 from copy import deepcopy
@@ -19,6 +20,11 @@ from numpy import typing as npt
 
 from laboneq import __version__
 from laboneq._observability import tracing
+from laboneq.controller.awg_compile_cache import (
+    DEFAULT_AWG_COMPILE_CACHE_MAX_SIZE,
+    AwgCompileCache,
+)
+from laboneq.controller.awg_upload_tracker import AwgUploadTracker
 from laboneq.controller.communication import (
     DaqNodeAction,
     DaqNodeSetAction,
@@ -37,7 +43,16 @@ from laboneq.controller.recipe_processor import (
     RtExecutionInfo,
     pre_process_compiled,
 )
-from laboneq.controller.results import build_partial_result, make_acquired_result
+from laboneq.controller.results import (
+    allocate_result_data,
+    AwgReadout,
+    HandleReadout,
+    ReadoutPlan,
+    SignalReadout,
+    build_partial_result,
+    make_acquired_result,
+    make_result_indices,
+)
 from laboneq.controller.util import LabOneQControllerException, SweepParamsTracker
 from laboneq.controller.versioning import LabOneVersion
 from laboneq.core.exceptions import AbortExecution
@@ -45,8 +60,9 @@ from laboneq.core.types.enums.acquisition_type import AcquisitionType
 from laboneq.core.types.enums.averaging_mode import AveragingMode
 from laboneq.core.utilities.async_helpers import run_async
 from laboneq.core.utilities.replace_pulse import ReplacementType, calc_wave_replacements
+from laboneq.core.utilities.string_sanitize import string_sanitize
 from laboneq.data.execution_payload import TargetSetup
-from laboneq.data.experiment_results import ExperimentResults
+from laboneq.data.experiment_results import AcquiredResult, ExperimentResults
 from laboneq.data.recipe import NtStepKey
 from laboneq.executor.execution_from_experiment import ExecutionFactoryFromExperiment
 from laboneq.executor.executor import Statement
@@ -56,6 +72,7 @@ if TYPE_CHECKING:
     from laboneq.core.types import CompiledExperiment
     from laboneq.data.execution_payload import ExecutionPayload
     from laboneq.dsl.experiment.pulse import Pulse
+    from laboneq.dsl.result.result_sinks import ResultSink
     from laboneq.dsl.session import Session
 
 
@@ -77,6 +94,25 @@ class ControllerRunParameters:
     servers_filename = None
     ignore_version_mismatch = False
     reset_devices = False
+    # Directory of the persistent AWG compilation cache, disabled if None. Falls back
+    # to the environment variable LABONEQ_AWG_COMPILE_CACHE_DIR.
+    awg_compile_cache_dir: str | None = None
+    awg_compile_cache_max_size: int = DEFAULT_AWG_COMPILE_CACHE_MAX_SIZE
+    # Skip the upload of AWG programs, waveforms and command tables identical to
+    # the ones uploaded by this controller before. Only enable if no other client
+    # modifies the devices, and the devices are not restarted while connected, as
+    # the device state is not checked.
+    skip_unchanged_awg_uploads = False
+    # Overlap the result readout of a near-time step with the preparation of the
+    # next step, see NearTimeRunner.
+    overlapped_nt_execution = False
+    # Directory for memory-mapped result arrays, results are kept in process memory
+    # if None. Falls back to the environment variable LABONEQ_RESULT_MEMMAP_DIR. Every
+    # execution creates a new subdirectory, which is not deleted automatically.
+    result_memmap_dir: str | None = None
+    # Results smaller than this are kept in process memory also if memory-mapping
+    # is enabled.
+    result_memmap_min_size: int = 1024 * 1024  # bytes
 
 
 # atexit hook
@@ -94,6 +130,7 @@ class _SeqCCompileItem:
 
 @dataclass
 class _UploadItem:
+    awg_key: AwgKey
     seqc_item: _SeqCCompileItem | None
     waves: Waveforms | None
     command_table: dict[Any] | None
@@ -105,6 +142,7 @@ class Controller:
         run_parameters: ControllerRunParameters | None = None,
         target_setup: TargetSetup | None = None,
         neartime_callbacks: dict[str, Callable] | None = None,
+        result_sinks: list[ResultSink] | None = None,
     ):
         self._run_parameters = run_parameters or ControllerRunParameters()
         self._devices = DeviceCollection(
@@ -121,11 +159,31 @@ class Controller:
         # Waves which are uploaded to the devices via pulse replacements
         self._current_waves = []
         self._neartime_callbacks: dict[str, Callable] = neartime_callbacks
+        self._result_sinks: list[ResultSink] = (
+            [] if result_sinks is None else result_sinks
+        )
         self._nodes_from_neartime_callbacks: list[DaqNodeAction] = []
         self._recipe_data: RecipeData = None
         self._session: Any = None
         self._results = ExperimentResults()
+        self._readout_plans: dict[str, ReadoutPlan] = {}
+        self._result_dtype: npt.DTypeLike | dict[str, npt.DTypeLike] | None = None
+        # Handle -> dtype of the results, if other than the default complex128
+        self._result_dtypes: dict[str, np.dtype] = {}
         self._pipeliner_reload_tracker = PipelinerReloadTracker()
+        self._awg_upload_tracker = AwgUploadTracker()
+
+        awg_compile_cache_dir = self._run_parameters.awg_compile_cache_dir
+        if awg_compile_cache_dir is None:
+            awg_compile_cache_dir = os.environ.get("LABONEQ_AWG_COMPILE_CACHE_DIR")
+        self._awg_compile_cache: AwgCompileCache | None = (
+            None
+            if awg_compile_cache_dir is None
+            else AwgCompileCache(
+                awg_compile_cache_dir,
+                max_size=self._run_parameters.awg_compile_cache_max_size,
+            )
+        )
 
         _logger.debug("Controller created")
         _logger.debug("Controller debug logging is on")
@@ -180,6 +238,13 @@ class Controller:
         rt_execution_info = recipe_data.rt_execution_infos.get(rt_section_uid)
         with_pipeliner = rt_execution_info.pipeliner_chunk_count is not None
         acquisition_type = RtExecutionInfo.get_acquisition_type_def(rt_execution_info)
+        # With pipeliner, the content of all pipeliner jobs is uploaded at once,
+        # which is not tracked - always upload everything.
+        track_uploads = self._run_parameters.skip_unchanged_awg_uploads and (
+            not with_pipeliner
+        )
+        if not track_uploads:
+            self._awg_upload_tracker.invalidate()
         for initialization in recipe_data.initializations:
             if not initialization.awgs:
                 continue
@@ -192,6 +257,10 @@ class Controller:
 
             for awg_obj in initialization.awgs:
                 awg_index = awg_obj.awg
+                awg_key = AwgKey(
+                    device_uid=initialization.device_uid,
+                    awg_index=awg_index,
+                )
                 awgs_used[device].add(awg_index)
                 for pipeline_chunk in range(
                     rt_execution_info.pipeliner_chunk_count or 1
@@ -222,10 +291,7 @@ class Controller:
                             rt_exec_step,
                             seqc_filename,
                         ) = self._pipeliner_reload_tracker.calc_next_step(
-                            awg_key=AwgKey(
-                                device_uid=initialization.device_uid,
-                                awg_index=awg_index,
-                            ),
+                            awg_key=awg_key,
                             pipeline_chunk=pipeline_chunk,
                             rt_exec_step=rt_exec_step,
                         )
@@ -250,13 +316,19 @@ class Controller:
                         awg_index=awg_index,
                     )
 
-                    if seqc_code is not None:
+                    if seqc_code is not None and not (
+                        track_uploads
+                        and self._awg_upload_tracker.is_seqc_resident(
+                            awg_key, seqc_code
+                        )
+                    ):
                         seqc_item.seqc_code = seqc_code
                         seqc_item.seqc_filename = seqc_filename
                         compile_data[device].append(seqc_item)
 
                     awg_data[device].append(
                         _UploadItem(
+                            awg_key=awg_key,
                             seqc_item=seqc_item,
                             waves=waves,
                             command_table=command_table,
@@ -279,6 +351,10 @@ class Controller:
             for item in items:
                 seqc_item = item.seqc_item
                 if seqc_item.elf is not None:
+                    if track_uploads:
+                        self._awg_upload_tracker.set_seqc_resident(
+                            item.awg_key, seqc_item.seqc_code
+                        )
                     set_action = device.prepare_upload_elf(
                         seqc_item.elf, seqc_item.awg_index, seqc_item.seqc_filename
                     )
@@ -298,8 +374,9 @@ class Controller:
                 else:
                     wf_dev_nodes = elf_node_settings[device.daq]
 
+                awg_upload_nodes: list[DaqNodeSetAction] = []
                 if item.waves is not None:
-                    wf_dev_nodes += device.prepare_upload_all_binary_waves(
+                    awg_upload_nodes += device.prepare_upload_all_binary_waves(
                         seqc_item.awg_index, item.waves, acquisition_type
                     )
 
@@ -307,7 +384,13 @@ class Controller:
                     set_action = device.prepare_upload_command_table(
                         seqc_item.awg_index, item.command_table
                     )
-                    wf_dev_nodes.append(set_action)
+                    awg_upload_nodes.append(set_action)
+
+                if track_uploads:
+                    awg_upload_nodes = self._awg_upload_tracker.filter_changed(
+                        item.awg_key, awg_upload_nodes
+                    )
+                wf_dev_nodes += awg_upload_nodes
 
                 if with_pipeliner:
                     # For devices with pipeliner, wf_dev_nodes == elf_node_settings
@@ -349,13 +432,20 @@ class Controller:
                         await daq.batch_set(nodes)
         _logger.debug("Finished upload.")
 
-    @classmethod
-    def _awg_compile(cls, awg_data: dict[DeviceZI, list[_SeqCCompileItem]]):
+    def invalidate_awg_uploads(self):
+        """Forces a full reload of AWG programs, waveforms and command tables on the
+        next execution, e.g. after the devices were modified by another client."""
+        self._awg_upload_tracker.invalidate()
+
+    def _awg_compile(self, awg_data: dict[DeviceZI, list[_SeqCCompileItem]]):
         # Compile in parallel:
         def worker(device: DeviceZI, item: _SeqCCompileItem, span: tracing.Span):
             with tracing.get_tracer().start_span("compile-awg-thread", span) as _:
                 item.elf = device.compile_seqc(
-                    item.seqc_code, item.awg_index, item.seqc_filename
+                    item.seqc_code,
+                    item.awg_index,
+                    item.seqc_filename,
+                    compile_cache=self._awg_compile_cache,
                 )
 
         _logger.debug("Started compilation of AWG programs...")
@@ -380,6 +470,14 @@ class Controller:
                     raise LabOneQControllerException(
                         "Compilation failed. See log output for details."
                     )
+        if self._awg_compile_cache is not None:
+            stats = self._awg_compile_cache.stats
+            _logger.debug(
+                "AWG compilation cache: %d hits, %d misses, %d evictions.",
+                stats.hits,
+                stats.misses,
+                stats.evictions,
+            )
         _logger.debug("Finished compilation.")
 
     async def _set_nodes_after_awg_program_upload(self):
@@ -394,7 +492,14 @@ class Controller:
 
     async def _initialize_awgs(self, nt_step: NtStepKey, rt_section_uid: str):
         await self._set_nodes_before_awg_program_upload()
-        await self._upload_awg_programs(nt_step=nt_step, rt_section_uid=rt_section_uid)
+        try:
+            await self._upload_awg_programs(
+                nt_step=nt_step, rt_section_uid=rt_section_uid
+            )
+        except Exception:
+            # The content resident on the devices is unknown after a failed upload
+            self._awg_upload_tracker.invalidate()
+            raise
         await self._set_nodes_after_awg_program_upload()
 
     async def _configure_triggers(self):
@@ -571,6 +676,9 @@ class Controller:
             or now - self._last_connect_check_ts > CONNECT_CHECK_HOLDOFF
         ):
             await self._devices.connect()
+            if self._run_parameters.reset_devices:
+                # Factory preset was loaded, AWG content is gone
+                self._awg_upload_tracker.invalidate()
 
         try:
             self._dataserver_version = next(self._devices.leaders)[
@@ -613,17 +721,28 @@ class Controller:
     async def disconnect_async(self):
         _logger.info("Disconnecting from all devices and servers...")
         self._devices.disconnect()
+        self._awg_upload_tracker.invalidate()
         self._last_connect_check_ts = None
         _logger.info("Successfully disconnected from all devices and servers.")
 
     # TODO(2K): remove legacy code
     def execute_compiled_legacy(
-        self, compiled_experiment: CompiledExperiment, session: Session | None = None
+        self,
+        compiled_experiment: CompiledExperiment,
+        session: Session | None = None,
+        result_dtype: npt.DTypeLike | dict[str, npt.DTypeLike] | None = None,
     ):
-        run_async(self.execute_compiled_legacy_async(compiled_experiment, session))
+        run_async(
+            self.execute_compiled_legacy_async(
+                compiled_experiment, session, result_dtype
+            )
+        )
 
     async def execute_compiled_legacy_async(
-        self, compiled_experiment: CompiledExperiment, session: Session | None = None
+        self,
+        compiled_experiment: CompiledExperiment,
+        session: Session | None = None,
+        result_dtype: npt.DTypeLike | dict[str, npt.DTypeLike] | None = None,
     ):
         execution: Statement
         if hasattr(compiled_experiment.scheduled_experiment, "execution"):
@@ -640,6 +759,7 @@ class Controller:
         )
 
         self._session = session
+        self._result_dtype = result_dtype
         await self._execute_compiled_impl()
         if session and session._last_results:
             session._last_results.acquired_results = self._results.acquired_results
@@ -658,11 +778,14 @@ class Controller:
             job.scheduled_experiment.execution,
         )
         self._session = None
+        self._result_dtype = None
         await self._execute_compiled_impl()
 
     async def _execute_compiled_impl(self):
         await self.connect_async()  # Ensure all connect configurations are still valid!
         self._prepare_result_shapes()
+        for sink in self._result_sinks:
+            sink.open(self._results.acquired_results)
         try:
             await self._initialize_devices()
 
@@ -672,9 +795,10 @@ class Controller:
             _logger.info("Starting near-time execution...")
             try:
                 with tracing.get_tracer().start_span("near-time-execution"):
-                    await NearTimeRunner(controller=self).run(
-                        self._recipe_data.execution
-                    )
+                    await NearTimeRunner(
+                        controller=self,
+                        overlapped=self._run_parameters.overlapped_nt_execution,
+                    ).run(self._recipe_data.execution)
             except AbortExecution:
                 # eat the exception
                 pass
@@ -689,6 +813,11 @@ class Controller:
         finally:
             # Ensure that the experiment run time is not included in the idle timeout for the connection check.
             self._last_connect_check_ts = time.monotonic()
+            for acquired_result in self._results.acquired_results.values():
+                if isinstance(acquired_result.data, np.memmap):
+                    acquired_result.data.flush()
+            for sink in self._result_sinks:
+                sink.close()
 
         await self._devices.on_experiment_end()
 
@@ -756,6 +885,10 @@ class Controller:
             seqc_name = repl.awg_id
             awg = self._find_awg(seqc_name)
             device = self._devices.find_by_uid(awg[0])
+            # The replaced wave must be restored by the next regular upload
+            self._awg_upload_tracker.invalidate_nodes(
+                AwgKey(device_uid=awg[0], awg_index=awg[1])
+            )
 
             if repl.replacement_type == ReplacementType.I_Q:
                 clipped = np.clip(repl.samples, -1.0, 1.0)
@@ -812,8 +945,66 @@ class Controller:
             )
         return nodes_to_prepare_rt
 
+    def _result_memmap_dir(self) -> str | None:
+        result_memmap_dir = self._run_parameters.result_memmap_dir
+        if result_memmap_dir is None:
+            result_memmap_dir = os.environ.get("LABONEQ_RESULT_MEMMAP_DIR")
+        if result_memmap_dir is None:
+            return None
+        os.makedirs(result_memmap_dir, exist_ok=True)
+        return tempfile.mkdtemp(
+            prefix=time.strftime("results_%Y%m%d_%H%M%S_"), dir=result_memmap_dir
+        )
+
+    def _resolve_result_dtypes(self, rt_info: RtExecutionInfo) -> dict[str, np.dtype]:
+        if self._result_dtype is None:
+            return {}
+        if isinstance(self._result_dtype, dict):
+            requested = self._result_dtype
+            unknown = set(requested) - set(self._recipe_data.result_shapes)
+            if unknown:
+                raise LabOneQControllerException(
+                    f"Result dtype specified for unknown handle(s): {sorted(unknown)}"
+                )
+        else:
+            requested = dict.fromkeys(
+                self._recipe_data.result_shapes, self._result_dtype
+            )
+        is_discrimination = rt_info.acquisition_type == AcquisitionType.DISCRIMINATION
+        result_dtypes: dict[str, np.dtype] = {}
+        for handle, requested_dtype in requested.items():
+            dtype = np.dtype(requested_dtype)
+            if dtype.kind == "c":
+                pass
+            elif dtype.kind == "f" and is_discrimination:
+                pass
+            elif (
+                dtype.kind == "i"
+                and is_discrimination
+                and rt_info.averaging_mode == AveragingMode.SINGLE_SHOT
+            ):
+                pass
+            else:
+                raise LabOneQControllerException(
+                    f"Result dtype '{dtype}' of handle '{handle}' is not supported for "
+                    f"acquisition type {rt_info.acquisition_type} and averaging mode "
+                    f"{rt_info.averaging_mode}. Complex dtypes are supported for all "
+                    f"acquisitions, real dtypes only for discrimination, and integer "
+                    f"dtypes only for single-shot discrimination."
+                )
+            if dtype != np.complex128:
+                result_dtypes[handle] = dtype
+        return result_dtypes
+
     def _prepare_result_shapes(self):
         self._results = ExperimentResults()
+        self._result_dtypes = {}
+        self._readout_plans = {
+            rt_section_uid: self._make_readout_plan(rt_execution_info)
+            for rt_section_uid, rt_execution_info in (
+                self._recipe_data.rt_execution_infos.items()
+            )
+        }
         if len(self._recipe_data.rt_execution_infos) == 0:
             return
         if len(self._recipe_data.rt_execution_infos) > 1:
@@ -821,6 +1012,9 @@ class Controller:
                 "Multiple 'acquire_loop_rt' sections per experiment is not supported."
             )
         rt_info = next(iter(self._recipe_data.rt_execution_infos.values()))
+        self._result_dtypes = self._resolve_result_dtypes(rt_info)
+        memmap_dir = self._result_memmap_dir()
+        memmap_min_size = self._run_parameters.result_memmap_min_size
         for handle, shape_info in self._recipe_data.result_shapes.items():
             if rt_info.acquisition_type == AcquisitionType.RAW:
                 signal_id = rt_info.signal_by_handle(handle)
@@ -830,12 +1024,17 @@ class Controller:
                     4096 if awg_config is None else awg_config.raw_acquire_length
                 )
                 empty_res = make_acquired_result(
-                    data=np.empty(shape=[raw_acquire_length], dtype=np.complex128),
+                    data=allocate_result_data(
+                        (raw_acquire_length,),
+                        self._result_dtypes.get(handle, np.complex128),
+                        memmap_dir,
+                        memmap_min_size,
+                        string_sanitize(handle),
+                    ),
                     axis_name=["samples"],
                     axis=[np.arange(raw_acquire_length)],
                     handle=handle,
                 )
-                empty_res.data[:] = np.nan
                 self._results.acquired_results[handle] = empty_res
             else:
                 axis_name = deepcopy(shape_info.base_axis_name)
@@ -852,47 +1051,32 @@ class Controller:
                     )
                     shape.append(shape_info.additional_axis)
                 empty_res = make_acquired_result(
-                    data=np.empty(shape=tuple(shape), dtype=np.complex128),
+                    data=allocate_result_data(
+                        tuple(shape),
+                        self._result_dtypes.get(handle, np.complex128),
+                        memmap_dir,
+                        memmap_min_size,
+                        string_sanitize(handle),
+                    ),
                     axis_name=axis_name,
                     axis=axis,
                     handle=handle,
                 )
                 if len(shape) == 0:
-                    empty_res.data = np.nan
-                else:
-                    empty_res.data[:] = np.nan
+                    empty_res.data = (
+                        empty_res.data[()] if handle in self._result_dtypes else np.nan
+                    )
                 self._results.acquired_results[handle] = empty_res
 
-    async def _read_one_step_results(self, nt_step: NtStepKey, rt_section_uid: str):
-        rt_execution_info = self._recipe_data.rt_execution_infos[rt_section_uid]
+    def _make_readout_plan(self, rt_execution_info: RtExecutionInfo) -> ReadoutPlan:
+        is_raw = rt_execution_info.acquisition_type == AcquisitionType.RAW
+        awgs: list[AwgReadout] = []
         for awg_key, awg_config in self._recipe_data.awgs_producing_results():
             device = self._devices.find_by_uid(awg_key.device_uid)
-            if rt_execution_info.acquisition_type == AcquisitionType.RAW:
-                raw_results = device.get_input_monitor_data(
-                    awg_key.awg_index, awg_config.raw_acquire_length
-                )
-                # Copy to all result handles, but actually only one handle is supported for now
-                for signal in awg_config.acquire_signals:
-                    mapping = rt_execution_info.signal_result_map.get(signal, [])
-                    unique_handles = set(mapping)
-                    for handle in unique_handles:
-                        if handle is None:
-                            continue  # Ignore unused acquire signal if any
-                        result = self._results.acquired_results[handle]
-                        for raw_result_idx, raw_result in enumerate(raw_results):
-                            result.data[raw_result_idx] = raw_result
-            else:
-                if rt_execution_info.averaging_mode == AveragingMode.SINGLE_SHOT:
-                    effective_averages = 1
-                else:
-                    effective_averages = rt_execution_info.averages
-                await device.check_results_acquired_status(
-                    awg_key.awg_index,
-                    rt_execution_info.acquisition_type,
-                    awg_config.result_length,
-                    effective_averages,
-                )
-                for signal in awg_config.acquire_signals:
+            signals: list[SignalReadout] = []
+            for signal in awg_config.acquire_signals:
+                integrator_indices = []
+                if not is_raw:
                     integrator_allocation = next(
                         (
                             i
@@ -911,27 +1095,143 @@ class Controller:
                     is_multistate = not isinstance(integrator_allocation.signal_id, str)
                     assert integrator_allocation.device_id == awg_key.device_uid
                     assert integrator_allocation.awg == awg_key.awg_index
-                    result_indices = (
+                    integrator_indices = (
                         integrator_allocation.channels[0]
                         if is_multistate
                         else integrator_allocation.channels
                     )
+                mapping = rt_execution_info.signal_result_map.get(signal, [])
+                handles = tuple(
+                    HandleReadout(
+                        handle=handle,
+                        result_indices=make_result_indices(
+                            mapping, handle, awg_config.result_length
+                        ),
+                    )
+                    # unused entries in sparse result vector map to None handle
+                    for handle in dict.fromkeys(mapping)
+                    if handle is not None
+                )
+                signals.append(
+                    SignalReadout(
+                        signal=signal,
+                        integrator_indices=integrator_indices,
+                        handles=handles,
+                    )
+                )
+            awgs.append(
+                AwgReadout(
+                    awg_key=awg_key,
+                    awg_config=awg_config,
+                    device=device,
+                    signals=tuple(signals),
+                )
+            )
+        return ReadoutPlan(
+            effective_averages=1
+            if rt_execution_info.averaging_mode == AveragingMode.SINGLE_SHOT
+            else rt_execution_info.averages,
+            awgs=tuple(awgs),
+        )
+
+    async def _read_one_step_results(self, nt_step: NtStepKey, rt_section_uid: str):
+        fetched = await self._fetch_one_step_results(rt_section_uid)
+        self._stream_step_results(
+            nt_step, self._demux_one_step_results(nt_step, rt_section_uid, fetched)
+        )
+
+    async def _fetch_one_step_results(
+        self, rt_section_uid: str
+    ) -> list[tuple[SignalReadout, Any]]:
+        """Fetches the raw results of a step from the devices.
+
+        Returns the raw results of every signal, or of every AWG for RAW
+        acquisition.
+        """
+        rt_execution_info = self._recipe_data.rt_execution_infos[rt_section_uid]
+        readout_plan = self._readout_plans[rt_section_uid]
+        fetched: list[tuple[SignalReadout, Any]] = []
+        for awg_readout in readout_plan.awgs:
+            device = awg_readout.device
+            awg_index = awg_readout.awg_key.awg_index
+            awg_config = awg_readout.awg_config
+            if rt_execution_info.acquisition_type == AcquisitionType.RAW:
+                raw_results = device.get_input_monitor_data(
+                    awg_index, awg_config.raw_acquire_length
+                )
+                fetched.extend((s, raw_results) for s in awg_readout.signals)
+            else:
+                await device.check_results_acquired_status(
+                    awg_index,
+                    rt_execution_info.acquisition_type,
+                    awg_config.result_length,
+                    readout_plan.effective_averages,
+                )
+                for signal_readout in awg_readout.signals:
                     raw_results = device.get_measurement_data(
-                        awg_key.awg_index,
+                        awg_index,
                         rt_execution_info.acquisition_type,
-                        result_indices,
+                        signal_readout.integrator_indices,
                         awg_config.result_length,
-                        effective_averages,
+                        readout_plan.effective_averages,
                     )
-                    mapping = rt_execution_info.signal_result_map.get(signal, [])
-                    unique_handles = set(mapping)
-                    for handle in unique_handles:
-                        if handle is None:
-                            continue  # unused entries in sparse result vector map to None handle
-                        result = self._results.acquired_results[handle]
-                        build_partial_result(
-                            result, nt_step, raw_results, mapping, handle
-                        )
+                    fetched.append((signal_readout, raw_results))
+        return fetched
+
+    def _demux_one_step_results(
+        self,
+        nt_step: NtStepKey,
+        rt_section_uid: str,
+        fetched: list[tuple[SignalReadout, Any]],
+    ) -> list[tuple[AcquiredResult, int]]:
+        """Writes the fetched raw results of a step into the acquired results.
+
+        Does not access the devices, and may run in a worker thread. Returns the
+        updated results with their number of near-time dimensions.
+        """
+        rt_execution_info = self._recipe_data.rt_execution_infos[rt_section_uid]
+        updated: list[tuple[AcquiredResult, int]] = []
+        for signal_readout, raw_results in fetched:
+            for handle_readout in signal_readout.handles:
+                result = self._results.acquired_results[handle_readout.handle]
+                if rt_execution_info.acquisition_type == AcquisitionType.RAW:
+                    # RAW acquisition: copy to all result handles, but actually only
+                    # one handle is supported for now
+                    result.data[: len(raw_results)] = raw_results
+                    # RAW results have no near-time dimensions
+                    updated.append((result, 0))
+                else:
+                    build_partial_result(
+                        result,
+                        nt_step,
+                        raw_results,
+                        handle_readout.result_indices,
+                        self._result_dtypes.get(handle_readout.handle),
+                    )
+                    updated.append((result, len(nt_step.indices)))
+        return updated
+
+    def _stream_step_results(
+        self, nt_step: NtStepKey, updated: list[tuple[AcquiredResult, int]]
+    ):
+        for result, nt_depth in updated:
+            self._stream_step_result(nt_step, result, nt_depth)
+
+    def _stream_step_result(
+        self, nt_step: NtStepKey, result: AcquiredResult, nt_depth: int
+    ):
+        if not self._result_sinks:
+            return
+        data = np.asarray(result.data)
+        step_result = AcquiredResult(
+            data=np.array(data[nt_step.indices[:nt_depth]]),
+            axis_name=result.axis_name[nt_depth:],
+            axis=result.axis[nt_depth:],
+            last_nt_step=list(nt_step.indices),
+            handle=result.handle,
+        )
+        for sink in self._result_sinks:
+            sink.append(step_result)
 
     def _report_step_error(self, nt_step: NtStepKey, rt_section_uid: str, message: str):
         self._results.execution_errors.append(
@@ -721,7 +721,7 @@ class DeviceUHFQA(DeviceZI):
             quadrature = self._get_integrator_measurement_data(
                 result_indices[1], num_results, averages_divider
             )
-            return [complex(real, imag) for real, imag in zip(in_phase, quadrature)]
+            return np.asarray(in_phase) + 1j * np.asarray(quadrature)
 
     def get_input_monitor_data(self, channel: int, num_results: int):
         result_path_ch0 = f"/{self.serial}/qas/0/monitor/inputs/0/wave".lower()
@@ -24,6 +24,7 @@ from laboneq.controller.attribute_value_tracker import (  # pylint: disable=E040
     DeviceAttribute,
     DeviceAttributesView,
 )
+from laboneq.controller.awg_compile_cache import AwgCompileCache
 from laboneq.controller.communication import (
     CachingStrategy,
     DaqNodeAction,
@@ -825,15 +826,41 @@ class DeviceZI:
             caching_strategy=CachingStrategy.NO_CACHE,
         )
 
-    def compile_seqc(self, code: str, awg_index: int, filename_hint: str | None = None):
+    def compile_seqc(
+        self,
+        code: str,
+        awg_index: int,
+        filename_hint: str | None = None,
+        compile_cache: AwgCompileCache | None = None,
+    ):
+        sequencer = self._get_sequencer_type()
+        sequencer = "auto" if sequencer == "auto-detect" else sequencer
+
+        cache_key = None
+        if compile_cache is not None:
+            cache_key = compile_cache.make_key(
+                code,
+                compiler_version=zhinst.core.__version__,
+                dev_type=self.dev_type,
+                dev_opts=self.dev_opts,
+                index=awg_index,
+                sequencer=sequencer,
+                samplerate=self._sampling_rate,
+            )
+            elf = compile_cache.get(cache_key)
+            if elf is not None:
+                _logger.debug(
+                    "%s: Using cached compilation result for AWG #%d.",
+                    self.dev_repr,
+                    awg_index,
+                )
+                return elf
+
         _logger.debug(
             "%s: Compiling sequence for AWG #%d...",
             self.dev_repr,
             awg_index,
         )
-        sequencer = self._get_sequencer_type()
-        sequencer = "auto" if sequencer == "auto-detect" else sequencer
-
         try:
             elf, extra = zhinst.core.compile_seqc(
                 code,
@@ -862,6 +889,9 @@ class DeviceZI:
             awg_index,
         )
 
+        if compile_cache is not None:
+            compile_cache.put(cache_key, elf)
+
         return elf
 
     def pipeliner_prepare_for_upload(self, index: int) -> list[DaqNodeAction]:
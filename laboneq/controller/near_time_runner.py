@@ -3,8 +3,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from inspect import iscoroutinefunction
 from typing import TYPE_CHECKING, Any
 
@@ -25,22 +27,88 @@ from laboneq.executor.executor import AsyncExecutorBase, LoopFlags, LoopingMode
 
 if TYPE_CHECKING:
     from laboneq.controller.controller import Controller
+    from laboneq.data.experiment_results import AcquiredResult
 
 _logger = logging.getLogger(__name__)
 
 
 class NearTimeRunner(AsyncExecutorBase):
-    def __init__(self, controller: Controller):
+    """Executes the near-time part of the experiment.
+
+    In the overlapped mode, the results of an RT step are read out in a
+    concurrent task, while the AWG programs and waveforms for the next step are
+    compiled and uploaded, and its near-time nodes are set. The task fetches the
+    raw results from the devices on the event loop, interleaved with the
+    preparation of the next step, and demultiplexes them into the acquired results
+    in a worker thread, which does not access the devices. The readout is always
+    completed before the acquisition for the next step is configured, and before
+    any near-time callback is invoked, so that the results are complete and
+    ordered. The results are passed to the result sinks on the main thread, when
+    the readout is completed. A failing readout is reported for the step it
+    belongs to.
+    """
+
+    def __init__(self, controller: Controller, overlapped: bool = False):
         super().__init__(looping_mode=LoopingMode.NEAR_TIME_ONLY)
         self.controller = controller
         self.user_set_nodes = []
         self.nt_loop_indices: list[int] = []
         self.pipeline_chunk: int = 0
         self.sweep_params_tracker = SweepParamsTracker()
+        self._overlapped = overlapped
+        self._readout_executor: ThreadPoolExecutor | None = None
+        self._pending_readout: tuple[NtStepKey, str, asyncio.Task] | None = None
 
     def nt_step(self) -> NtStepKey:
         return NtStepKey(indices=tuple(self.nt_loop_indices))
 
+    async def run(self, root_sequence):
+        if not self._overlapped:
+            await super().run(root_sequence)
+            return
+        with ThreadPoolExecutor(max_workers=1) as readout_executor:
+            self._readout_executor = readout_executor
+            try:
+                await super().run(root_sequence)
+            finally:
+                await self._complete_pending_readout()
+                self._readout_executor = None
+
+    async def _start_readout(self, nt_step: NtStepKey, rt_section_uid: str):
+        assert self._pending_readout is None
+        task = asyncio.create_task(self._read_out(nt_step, rt_section_uid))
+        self._pending_readout = (nt_step, rt_section_uid, task)
+
+    async def _read_out(
+        self, nt_step: NtStepKey, rt_section_uid: str
+    ) -> list[tuple[AcquiredResult, int]]:
+        fetched = await self.controller._fetch_one_step_results(rt_section_uid)
+        return await asyncio.get_running_loop().run_in_executor(
+            self._readout_executor,
+            self.controller._demux_one_step_results,
+            nt_step,
+            rt_section_uid,
+            fetched,
+        )
+
+    async def _complete_pending_readout(self):
+        if self._pending_readout is None:
+            return
+        nt_step, rt_section_uid, task = self._pending_readout
+        self._pending_readout = None
+        try:
+            updated = await task
+        except Exception as e:
+            self.controller._report_step_error(
+                nt_step=nt_step,
+                rt_section_uid=rt_section_uid,
+                message=traceback.format_exc(),
+            )
+            if not isinstance(e, LabOneQControllerException):
+                raise
+            return
+        self.controller._stream_step_results(nt_step, updated)
+
     async def set_handler(self, path: str, value):
         dev = self.controller._devices.find_by_node_path(path)
         self.user_set_nodes.append(
@@ -55,6 +123,8 @@ class NearTimeRunner(AsyncExecutorBase):
             raise LabOneQControllerException(
                 f"Near-time callback '{func_name}' is not registered."
             )
+        # The callback may access the results of the preceding steps
+        await self._complete_pending_readout()
         try:
             if iscoroutinefunction(func):
                 res = await func(
@@ -122,7 +192,15 @@ class NearTimeRunner(AsyncExecutorBase):
         nt_sweep_nodes = self.controller._prepare_nt_step(self.sweep_params_tracker)
         step_prepare_nodes = self.controller._prepare_rt_execution(rt_section_uid=uid)
 
-        await batch_set([*self.user_set_nodes, *nt_sweep_nodes, *step_prepare_nodes])
+        if self._overlapped:
+            await batch_set([*self.user_set_nodes, *nt_sweep_nodes])
+            # Acquisition setup resets the result buffers of the previous step
+            await self._complete_pending_readout()
+            await batch_set(step_prepare_nodes)
+        else:
+            await batch_set(
+                [*self.user_set_nodes, *nt_sweep_nodes, *step_prepare_nodes]
+            )
         self.user_set_nodes.clear()
         self.sweep_params_tracker.clear_for_next_step()
 
@@ -134,9 +212,14 @@ class NearTimeRunner(AsyncExecutorBase):
                 await self.controller._execute_one_step(
                     acquisition_type, rt_section_uid=uid
                 )
-                await self.controller._read_one_step_results(
-                    nt_step=self.nt_step(), rt_section_uid=uid
-                )
+                if self._overlapped:
+                    await self._start_readout(
+                        nt_step=self.nt_step(), rt_section_uid=uid
+                    )
+                else:
+                    await self.controller._read_one_step_results(
+                        nt_step=self.nt_step(), rt_section_uid=uid
+                    )
                 break
             except LabOneQControllerException:
                 # TODO(2K): introduce "hard" controller exceptions
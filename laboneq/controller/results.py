@@ -3,48 +3,134 @@
 
 from __future__ import annotations
 
-from typing import Any
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-from numpy.typing import ArrayLike
+from numpy import typing as npt
 
+from laboneq.controller.recipe_processor import AwgConfig, AwgKey
 from laboneq.data.experiment_results import AcquiredResult
 from laboneq.data.recipe import NtStepKey
 
+if TYPE_CHECKING:
+    from laboneq.controller.devices.device_zi import DeviceZI
+
+
+@dataclass(frozen=True)
+class HandleReadout:
+    handle: str
+    # Indices of the raw result vector entries belonging to the handle
+    result_indices: npt.NDArray[np.intp]
+
+
+@dataclass(frozen=True)
+class SignalReadout:
+    signal: str
+    # Integrator (result) indices on the device
+    integrator_indices: list[int]
+    handles: tuple[HandleReadout, ...]
+
+
+@dataclass(frozen=True)
+class AwgReadout:
+    awg_key: AwgKey
+    awg_config: AwgConfig
+    device: DeviceZI
+    signals: tuple[SignalReadout, ...]
+
+
+@dataclass(frozen=True)
+class ReadoutPlan:
+    """Precomputed steps to fetch and demultiplex the results of one RT section."""
+
+    effective_averages: int
+    awgs: tuple[AwgReadout, ...]
+
 
 def make_acquired_result(
-    data: ArrayLike,
+    data: npt.ArrayLike,
     axis_name: list[str | list[str]],
-    axis: list[ArrayLike | list[ArrayLike]],
+    axis: list[npt.ArrayLike | list[npt.ArrayLike]],
     handle: str,
 ) -> AcquiredResult:
     return AcquiredResult(data, axis_name, axis, handle=handle)
 
 
+def allocate_result_data(
+    shape: tuple[int, ...],
+    dtype: npt.DTypeLike,
+    memmap_dir: str | os.PathLike | None = None,
+    memmap_min_size: int = 0,
+    name: str = "result",
+) -> npt.NDArray[Any]:
+    """Allocates the result array, filled with NaN, or -1 for integer dtypes.
+
+    If a directory is given and the array is not smaller than `memmap_min_size`
+    bytes, the array is backed by an NPY file in that directory instead of the
+    process memory. The file is not deleted when the array is released.
+    """
+    dtype = np.dtype(dtype)
+    if (
+        memmap_dir is None
+        or len(shape) == 0
+        or int(np.prod(shape)) * dtype.itemsize < memmap_min_size
+    ):
+        data = np.empty(shape=shape, dtype=dtype)
+    else:
+        data = np.lib.format.open_memmap(
+            Path(memmap_dir) / f"{name}.npy", mode="w+", dtype=dtype, shape=shape
+        )
+    data[...] = np.nan if dtype.kind in "fc" else -1
+    return data
+
+
+def make_result_indices(
+    mapping: list[str | None], handle: str, raw_result_length: int
+) -> npt.NDArray[np.intp]:
+    """Indices of the raw result vector entries belonging to the given handle.
+
+    The mapping describes one RT iteration and repeats over the raw result vector.
+    """
+    handle_positions = np.array(
+        [i for i, h in enumerate(mapping) if h == handle], dtype=np.intp
+    )
+    if len(handle_positions) == 0:
+        return handle_positions
+    repetitions = -(-raw_result_length // len(mapping))
+    indices = (
+        np.arange(repetitions, dtype=np.intp)[:, np.newaxis] * len(mapping)
+        + handle_positions
+    ).ravel()
+    return indices[indices < raw_result_length]
+
+
 def build_partial_result(
     result: AcquiredResult,
     nt_step: NtStepKey,
     raw_result: Any,
-    mapping: list[str],
-    handle: str,
+    result_indices: npt.NDArray[np.intp],
+    dtype: np.dtype | None = None,
 ):
     result.last_nt_step = list(nt_step.indices)
+    if len(result_indices) == 0:
+        return
+    raw_result = np.asarray(raw_result)
+    if dtype is not None:
+        if dtype.kind != "c":
+            raw_result = raw_result.real
+        raw_result = raw_result.astype(dtype, copy=False)
     if len(np.shape(result.data)) == len(nt_step.indices):
         # No loops in RT, just a single value produced
-        for raw_result_idx in range(len(raw_result)):
-            if mapping[raw_result_idx % len(mapping)] == handle:
-                if len(nt_step.indices) == 0:
-                    result.data = raw_result[raw_result_idx]
-                else:
-                    result.data[nt_step.indices] = raw_result[raw_result_idx]
-                break
+        if len(nt_step.indices) == 0:
+            result.data = raw_result[result_indices[0]]
+        else:
+            result.data[nt_step.indices] = raw_result[result_indices[0]]
     else:
         inner_res = result.data
         for index in nt_step.indices:
             inner_res = inner_res[index]
         res_flat = np.ravel(inner_res)
-        res_flat_idx = 0
-        for raw_result_idx in range(len(raw_result)):
-            if mapping[raw_result_idx % len(mapping)] == handle:
-                res_flat[res_flat_idx] = raw_result[raw_result_idx]
-                res_flat_idx += 1
+        res_flat[: len(result_indices)] = raw_result[result_indices]
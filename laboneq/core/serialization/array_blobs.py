@@ -0,0 +1,134 @@
+# Copyright 2023 Zurich Instruments AG
+# SPDX-License-Identifier: Apache-2.0
+
+"""Binary storage of the arrays of serialized objects.
+
+Instead of embedding the arrays into the JSON document, the serializer may write
+them as raw, aligned blobs into a separate binary file, and only reference them
+by offset, dtype and shape. Arrays with identical content are written only once,
+and share the same blob. When loading, the binary file is memory-mapped and the
+arrays are views into it, so that nothing is copied, and the data is only read
+from the disk on first access. Only the first array read from a shared blob is a
+view, the others are copies, so that the loaded arrays are independent, like the
+arrays before saving.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import hashlib
+import os
+from typing import BinaryIO, Iterator
+
+import numpy as np
+
+# Alignment of the array blobs, suitable for all dtypes and vectorized access
+BLOB_ALIGNMENT = 64
+
+_writer: contextvars.ContextVar[ArrayBlobWriter | None] = contextvars.ContextVar(
+    "array_blob_writer", default=None
+)
+_reader: contextvars.ContextVar[ArrayBlobReader | None] = contextvars.ContextVar(
+    "array_blob_reader", default=None
+)
+
+
+class ArrayBlobWriter:
+    def __init__(self, file: BinaryIO, name: str | None = None):
+        self._file = file
+        # File name recorded in the references, if not the default one
+        self._name = name
+        self._offset = 0
+        # Offsets of the written blobs, by content
+        self._offsets: dict[tuple, int] = {}
+
+    def write(self, array: np.ndarray) -> dict:
+        """Appends the array to the file, unless an array with the same content
+        was written before, and returns its reference."""
+        array = np.asarray(array, order="C")
+        data = array.reshape(-1).view(np.uint8).data
+        key = (
+            array.dtype.str,
+            array.shape,
+            hashlib.blake2b(data, digest_size=16).digest(),
+        )
+        offset = self._offsets.get(key)
+        if offset is None:
+            padding = -self._offset % BLOB_ALIGNMENT
+            if padding:
+                self._file.write(bytes(padding))
+                self._offset += padding
+            offset = self._offsets[key] = self._offset
+            self._file.write(data)
+            self._offset += array.nbytes
+        blob = {
+            "offset": offset,
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+        }
+        if self._name is not None:
+            blob["file"] = self._name
+        return blob
+
+
+class ArrayBlobReader:
+    def __init__(self, directory: str | os.PathLike, default_name: str):
+        self._directory = directory
+        self._default_name = default_name
+        self._files: dict[str, np.ndarray] = {}
+        # The blobs read so far, by file name and offset
+        self._read_blobs: set[tuple[str, int]] = set()
+
+    def _data(self, name: str) -> np.ndarray:
+        data = self._files.get(name)
+        if data is None:
+            path = os.path.join(self._directory, name)
+            if os.path.getsize(path) == 0:
+                data = np.empty(0, dtype=np.uint8)
+            else:
+                # Copy-on-write, changes to the loaded arrays don't affect the file
+                data = np.memmap(path, dtype=np.uint8, mode="c")
+            self._files[name] = data
+        return data
+
+    def read(self, blob: dict) -> np.ndarray:
+        """Returns a view of the referenced array, or a copy if the blob was read
+        before."""
+        dtype = np.dtype(blob["dtype"])
+        shape = tuple(blob["shape"])
+        offset = blob["offset"]
+        nbytes = dtype.itemsize * int(np.prod(shape))
+        name = blob.get("file", self._default_name)
+        array = self._data(name)[offset : offset + nbytes].view(dtype).reshape(shape)
+        if (name, offset) in self._read_blobs:
+            # Modifying one of the arrays of a shared blob must not affect the others
+            return array.copy()
+        self._read_blobs.add((name, offset))
+        return array
+
+
+@contextlib.contextmanager
+def writing_array_blobs(writer: ArrayBlobWriter) -> Iterator[ArrayBlobWriter]:
+    token = _writer.set(writer)
+    try:
+        yield writer
+    finally:
+        _writer.reset(token)
+
+
+@contextlib.contextmanager
+def reading_array_blobs(reader: ArrayBlobReader) -> Iterator[ArrayBlobReader]:
+    token = _reader.set(reader)
+    try:
+        yield reader
+    finally:
+        _reader.reset(token)
+
+
+def current_writer() -> ArrayBlobWriter | None:
+    return _writer.get()
+
+
+def current_reader() -> ArrayBlobReader | None:
+    return _reader.get()
@@ -3,25 +3,31 @@
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
 import functools
 import importlib
 import inspect
 import logging
+import mmap
+import os
 from collections.abc import Mapping
 from enum import Enum
 from io import BytesIO, StringIO
-from typing import Dict
+from typing import Dict, Iterator
 
 import numpy as np
 import pybase64 as base64
 from numpy.lib.format import read_array, write_array
 from sortedcontainers import SortedDict
 
+from laboneq.core.serialization import array_blobs
 from laboneq.core.serialization.externals import (
     XarrayDataArrayDeserializer,
     XarrayDatasetDeserializer,
     serialize_maybe_xarray,
 )
+from laboneq.core.utilities.deferred import Deferred
 
 _logger = logging.getLogger(__name__)
 
@@ -32,6 +38,70 @@ class SerializerException(Exception):
     pass
 
 
+# Array dtypes not preserved when converted to lists, always stored as binary
+_COMPACT_DTYPES = frozenset(
+    np.dtype(t)
+    for t in (
+        np.complex64,
+        np.float32,
+        np.float16,
+        np.int8,
+        np.int16,
+        np.int32,
+        np.uint8,
+        np.uint16,
+        np.uint32,
+    )
+)
+
+
+# Directory of the serialized document, referenced NPY files are relative to it
+_document_directory: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "document_directory", default=None
+)
+
+
+@contextlib.contextmanager
+def document_directory(directory: str | os.PathLike) -> Iterator[None]:
+    """Resolve the references to NPY files relative to the given directory, when
+    serializing or deserializing a document stored in it."""
+    token = _document_directory.set(os.path.abspath(directory))
+    try:
+        yield
+    finally:
+        _document_directory.reset(token)
+
+
+def _npy_file_of(array_data) -> str | None:
+    """The NPY file backing the given array, if it is a memory-mapped NPY file as
+    a whole (and not a view into it), whose content is in sync with the array."""
+    if not isinstance(array_data, np.memmap) or array_data.filename is None:
+        return None
+    if array_data.mode not in ("r", "r+"):
+        # Changes to copy-on-write arrays are not in the file
+        return None
+    if not isinstance(array_data.base, mmap.mmap):
+        return None
+    filename = str(array_data.filename)
+    if not filename.endswith(".npy") or array_data.offset == 0:
+        return None
+    directory = _document_directory.get()
+    if directory is not None:
+        try:
+            return os.path.relpath(filename, directory)
+        except ValueError:
+            # On another drive
+            pass
+    return filename
+
+
+def _resolve_npy_file(npy_file: str) -> str:
+    directory = _document_directory.get()
+    if directory is None:
+        return npy_file
+    return os.path.join(directory, npy_file)
+
+
 class NumpyArrayRepr:
     def __new__(
         cls,
@@ -40,8 +110,28 @@ class NumpyArrayRepr:
         complex_data=None,
         binary_npz=None,
         binary_npy=None,
+        npy_file=None,
+        blob=None,
     ):
         # deserialize
+        if blob is not None:
+            reader = array_blobs.current_reader()
+            if reader is None:
+                raise SerializerException(
+                    "The array data is stored in a separate binary file, which is only "
+                    "available when loading the serialized data from its directory."
+                )
+            return reader.read(blob)
+        if npy_file is not None:
+            try:
+                # Copy-on-write, changes to the loaded array don't affect the file
+                return np.load(
+                    _resolve_npy_file(npy_file), mmap_mode="c", allow_pickle=False
+                )
+            except OSError as e:
+                raise SerializerException(
+                    f"Failed to load the array data from '{npy_file}': {e}"
+                ) from e
         if binary_npz is not None:
             # For backwards compatibility only, we no longer emit npz blobs
             input_buffer = BytesIO(base64.b64decode(binary_npz.encode("ascii")))
@@ -66,10 +156,22 @@ class NumpyArrayRepr:
         complex_data=None,
         binary_npz=None,
         binary_npy=None,
+        npy_file=None,
+        blob=None,
     ):
         assert array_data is not None
         assert real_data is complex_data is binary_npz is binary_npy is None
-        if array_data.size > 100:
+        assert npy_file is blob is None
+        is_binary = array_data.size > 100 or array_data.dtype in _COMPACT_DTYPES
+        blob_writer = array_blobs.current_writer()
+        npy_file = _npy_file_of(array_data)
+        if is_binary and blob_writer is not None and not array_data.dtype.hasobject:
+            self.blob = blob_writer.write(array_data)
+        elif npy_file is not None:
+            # Reference the memory-mapped file instead of embedding its content
+            array_data.flush()
+            self.npy_file = npy_file
+        elif is_binary:
             output_buffer = BytesIO()
             write_array(output_buffer, array_data, version=(3, 0), allow_pickle=False)
             output_buffer.seek(0)
@@ -653,17 +755,26 @@ def deserialize_from_dict_with_ref_recursor(
                     entity_pool_deserialized,
                 ),
             )
+        type_name = data.get("__type")
+        lazy_fields = (
+            ()
+            if type_name is None
+            else _lazy_fields(class_mapping.get(type_name.split(".")[-1]))
+        )
         out_mapping = {
             k: deserialize_from_dict_with_ref_recursor(
                 v, class_mapping, entity_pool_raw, entity_pool_deserialized
             )
+            if k not in lazy_fields
+            else _deferred_deserialization(
+                v, class_mapping, entity_pool_raw, entity_pool_deserialized
+            )
             if v.__class__ not in (bool, int, float, str)
             else v
             # for performance: do not recurse on simple primitives
             for k, v in data.items()
             if k != "__type"
         }
-        type_name = data.get("__type")
         if type_name is None:
             return out_mapping
         type_name_short = type_name.split(".")[-1]
@@ -712,6 +823,25 @@ def deserialize_from_dict_with_ref_recursor(
     return data
 
 
+@functools.lru_cache()
+def _lazy_fields(cls) -> tuple[str, ...]:
+    return getattr(cls, "_deserialize_lazily", ())
+
+
+def _deferred_deserialization(
+    data, class_mapping, entity_pool_raw: Dict, entity_pool_deserialized: Dict
+) -> Deferred:
+    return Deferred(
+        functools.partial(
+            deserialize_from_dict_with_ref_recursor,
+            data,
+            class_mapping,
+            entity_pool_raw,
+            entity_pool_deserialized,
+        )
+    )
+
+
 def deserialize_from_dict_with_ref(data, class_mapping, entity_classes, entity_map):
     class_mapping[NumpyArrayRepr.__name__] = NumpyArrayRepr
     class_mapping[XarrayDataArrayDeserializer._type_] = XarrayDataArrayDeserializer
@@ -193,18 +193,23 @@ class CompiledExperiment:
         """Load a compiled experiment from a JSON file.
 
         Args:
-            filename: The file to load the compiled experiment from.
+            filename: The file to load the compiled experiment from, or the
+                directory if it was saved with `binary_arrays`.
         """
         from laboneq.dsl.serialization import Serializer
 
         return Serializer.from_json_file(filename, cls)
 
-    def save(self, filename: str):
+    def save(self, filename: str, binary_arrays: bool = False):
         """Store a compiled experiment in a JSON file.
 
         Args:
             filename: The file to save the compiled experiment to.
+            binary_arrays: If `True`, `filename` is a directory, which receives
+                the JSON file and, in a separate binary file, the raw array data.
+
+                !!! version-added "Added in version 2.21.0"
         """
         from laboneq.dsl.serialization import Serializer
 
-        Serializer.to_json_file(self, filename)
+        Serializer.to_json_file(self, filename, binary_arrays=binary_arrays)
@@ -0,0 +1,229 @@
+# Copyright 2023 Zurich Instruments AG
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Generic, Hashable, TypeVar
+
+_logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclasses.dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def __str__(self):
+        return f"{self.hits} hits, {self.misses} misses, {self.evictions} evictions"
+
+
+class LruCache(Generic[K, V]):
+    """Thread-safe in-memory cache, bounded by the total size of the values.
+
+    The least recently used values are evicted once their total size exceeds
+    `max_size`. The size of a value is given by `size_of`, by default 1, i.e.
+    `max_size` is the number of entries. Values larger than `max_size` are not
+    cached.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        size_of: Callable[[V], int] = lambda value: 1,
+        stats: CacheStats | None = None,
+    ):
+        self._max_size = max_size
+        self._size_of = size_of
+        self._size = 0
+        self._entries: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = CacheStats() if stats is None else stats
+
+    def __contains__(self, key: K) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def peek(self, key: K) -> V | None:
+        """Returns the cached value, or None, without counting a hit or a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def count(self, hits: int = 0, misses: int = 0):
+        """Counts hits and misses of lookups decided by the caller, e.g. via
+        `peek`."""
+        with self._lock:
+            self.stats.hits += hits
+            self.stats.misses += misses
+
+    def get(self, key: K) -> V | None:
+        """Returns the cached value, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[0]
+
+    def put(self, key: K, value: V):
+        size = self._size_of(value)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            if size > self._max_size:
+                return
+            self._entries[key] = (value, size)
+            self._size += size
+            while self._size > self._max_size:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self.stats.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class DiskCache:
+    """Cache of byte strings in the files of a directory.
+
+    The least recently used entries are evicted once the total size of the files
+    exceeds `max_size` bytes, and entries not used for more than `max_age` seconds
+    are evicted as well. The access time of an entry is tracked via the
+    modification time of its file, so the order survives across sessions and is
+    shared by all processes using the directory.
+    """
+
+    SUFFIX = ".bin"
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        max_size: int,
+        max_age: float | None = None,
+    ):
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_size = max_size
+        self._max_age = max_age
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{key}{self.SUFFIX}"
+
+    def _is_expired(self, mtime: float) -> bool:
+        return self._max_age is not None and time.time() - mtime > self._max_age
+
+    def _count(self, hits: int = 0, misses: int = 0):
+        with self._lock:
+            self.stats.hits += hits
+            self.stats.misses += misses
+
+    def contains(self, key: str) -> bool:
+        """Checks for an entry, without loading it."""
+        try:
+            return not self._is_expired(self._path(key).stat().st_mtime)
+        except OSError:
+            return False
+
+    def _read(self, key: str) -> bytes | None:
+        """Returns the content of an entry, or None, without counting a hit or a
+        miss."""
+        if not self.contains(key):
+            return None
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            # Mark as recently used
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def _discard(self, key: str):
+        self._path(key).unlink(missing_ok=True)
+
+    def get(self, key: str) -> bytes | None:
+        data = self._read(key)
+        if data is None:
+            self._count(misses=1)
+        else:
+            self._count(hits=1)
+        return data
+
+    def put(self, key: str, data: bytes):
+        path = self._path(key)
+        # Write to a file of its own first, so that concurrent readers, also of
+        # other processes, never see a partially written entry.
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            _logger.warning("Failed to store %s in cache: %s", path.name, exc)
+            tmp_path.unlink(missing_ok=True)
+            return
+        with self._lock:
+            self._evict()
+
+    def _evict(self):
+        entries = []
+        total_size = 0
+        for path in self._directory.glob(f"*{self.SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if self._is_expired(stat.st_mtime):
+                path.unlink(missing_ok=True)
+                self.stats.evictions += 1
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+        if total_size <= self._max_size:
+            return
+        entries.sort(key=lambda e: e[0])
+        for _, size, path in entries:
+            if total_size <= self._max_size:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total_size -= size
+            self.stats.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            for path in self._directory.glob(f"*{self.SUFFIX}"):
+                path.unlink(missing_ok=True)
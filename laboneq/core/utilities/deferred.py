@@ -0,0 +1,65 @@
+# Copyright 2023 Zurich Instruments AG
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import contextvars
+import threading
+from typing import Any, Callable
+
+_UNRESOLVED = object()
+
+
+def _resolved(value):
+    return value
+
+
+class Deferred:
+    """A value computed on first access.
+
+    The factory runs in a copy of the context that was current when the deferred
+    value was created, so that it sees the same context variables, e.g. the
+    source of serialized data.
+    """
+
+    __slots__ = ("_factory", "_context", "_value", "_lock")
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._context = contextvars.copy_context()
+        self._value = _UNRESOLVED
+        self._lock = threading.Lock()
+
+    def resolve(self) -> Any:
+        if self._value is _UNRESOLVED:
+            with self._lock:
+                if self._value is _UNRESOLVED:
+                    self._value = self._context.run(self._factory)
+                    # Release the source data
+                    self._factory = self._context = None
+        return self._value
+
+    def __reduce__(self):
+        return _resolved, (self.resolve(),)
+
+    def __deepcopy__(self, memo):
+        from copy import deepcopy
+
+        return deepcopy(self.resolve(), memo)
+
+
+class DeferredFieldsMixin:
+    """Resolves the `Deferred` values of the instance attributes on access.
+
+    Classes may list the fields that the deserializer should only materialize
+    when they are first accessed in `_deserialize_lazily`.
+    """
+
+    _deserialize_lazily: tuple[str, ...] = ()
+
+    def __getattribute__(self, name):
+        value = object.__getattribute__(self, name)
+        if type(value) is Deferred:
+            value = value.resolve()
+            object.__setattr__(self, name, value)
+        return value
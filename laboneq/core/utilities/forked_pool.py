@@ -0,0 +1,84 @@
+# Copyright 2023 Zurich Instruments AG
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import concurrent.futures
+import functools
+import logging
+import multiprocessing
+import threading
+from typing import Any, Callable, Sequence, TypeVar
+
+_logger = logging.getLogger(__name__)
+
+S = TypeVar("S")
+T = TypeVar("T")
+R = TypeVar("R")
+
+# The state passed to the function in the worker processes, inherited when forking
+_worker_state: Any = None
+_worker_state_lock = threading.Lock()
+# Whether this process is a worker process forked by `run_forked`
+_is_worker = False
+
+
+def _init_worker():
+    global _is_worker, _worker_state_lock
+    _is_worker = True
+    # Inherited in the locked state from the parent
+    _worker_state_lock = threading.Lock()
+
+
+def _call_in_worker(fn: Callable[[Any, Any], Any], arg):
+    return fn(_worker_state, arg)
+
+
+def can_fork() -> bool:
+    """Whether worker processes can be forked from the calling thread.
+
+    Forking is only done from the main thread, as forking while another thread
+    holds a lock, e.g. of the logging module, may deadlock the child. Worker
+    processes of `run_forked` don't fork again, nested calls run serially.
+    """
+    return (
+        not _is_worker
+        and "fork" in multiprocessing.get_all_start_methods()
+        and threading.current_thread() is threading.main_thread()
+    )
+
+
+def run_forked(
+    fn: Callable[[S, T], R], state: S, args: Sequence[T], max_workers: int
+) -> list[R]:
+    """Returns `[fn(state, arg) for arg in args]`, computed in up to `max_workers`
+    forked processes.
+
+    The worker processes inherit `state` when forking, so only the arguments and
+    the results must be picklable, and `fn` must be a module-level function.
+    The calls are made serially in this process if `max_workers` is 1 or less,
+    or if the processes cannot be forked, see `can_fork`.
+    """
+    global _worker_state
+
+    max_workers = min(max_workers, len(args))
+    if max_workers > 1 and not can_fork():
+        _logger.debug(
+            "Forking worker processes is only supported from the main thread "
+            "on platforms with the 'fork' start method, running serially"
+        )
+        max_workers = 1
+    if max_workers <= 1:
+        return [fn(state, arg) for arg in args]
+
+    with _worker_state_lock:
+        _worker_state = state
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker,
+            ) as executor:
+                return list(executor.map(functools.partial(_call_in_worker, fn), args))
+        finally:
+            _worker_state = None
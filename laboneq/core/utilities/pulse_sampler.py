@@ -6,7 +6,7 @@ from __future__ import annotations
 import logging
 from copy import deepcopy
 from numbers import Complex
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 
 import numpy as np
 
@@ -15,6 +15,10 @@ from laboneq.core.types.enums.mixer_type import MixerType
 
 _logger = logging.getLogger(__name__)
 
+# This is used as a workaround for the SHFQA requiring that for sampled pulses,  abs(s)  < 1.0 must hold
+# to be able to play pulses with an amplitude of 1.0, we scale complex pulses by this factor
+SHFQA_COMPLEX_SAMPLE_SCALING = 1 - 1e-10
+
 
 def length_to_samples(length, sampling_rate) -> int:
     return round(length * sampling_rate)
@@ -61,6 +65,83 @@ def sample_marker(num_total_samples, sampling_rate, enable, start, length):
     return marker_samples
 
 
+def _scale_and_modulate(
+    samples: np.ndarray,
+    *,
+    signal_type: str,
+    sampling_rate: float,
+    amplitude,
+    phase,
+    modulation_frequency,
+    mixer_type: MixerType | None,
+) -> np.ndarray:
+    """Scale and modulate the samples along the last axis.
+
+    The amplitude, phase and modulation frequency are scalars, or arrays of shape
+    (number of pulses, 1) for samples of shape (number of pulses, number of
+    samples).
+    """
+    if signal_type == "iq":
+        samples = samples.astype(complex)
+    else:
+        assert np.all(samples.imag == 0.0)
+        amplitude = np.real(amplitude)
+        samples = samples.real
+
+    samples = samples * amplitude
+
+    _logger.debug(
+        "Doing modulation with modulation_frequency %s and phase %s",
+        modulation_frequency,
+        phase,
+    )
+
+    t = np.arange(samples.shape[-1]) / sampling_rate
+    if np.any(modulation_frequency):
+        carrier_phase = 2.0 * np.pi * modulation_frequency * t
+    else:
+        carrier_phase = 0
+    carrier_phase += phase
+
+    if signal_type == "iq":
+        samples = np.exp(-1.0j * carrier_phase) * samples
+    else:
+        if not np.allclose(samples.imag, 0.0):
+            raise LabOneQException("Complex samples not permitted for RF signals")
+        samples = np.cos(carrier_phase) * samples
+
+    if mixer_type == MixerType.UHFQA_ENVELOPE and signal_type == "iq":
+        if not np.allclose(samples.imag, 0.0):
+            raise LabOneQException(
+                "HW modulation on UHFQA requires a real baseband (phase "
+                "modulation is not permitted)."
+            )
+        samples = samples.real * (1.0 + 1.0j)
+
+    return samples
+
+
+def _sample_markers(markers, num_samples, sampling_rate) -> Dict[str, np.ndarray]:
+    """Sample the markers of a pulse, as "samples_marker1" and "samples_marker2"."""
+    sampled = {}
+    for i in ["1", "2"]:
+        m = next(
+            (m for m in markers if m.get("marker_selector") == "marker" + i),
+            None,
+        )
+        if m:
+            m_sampled = sample_marker(
+                num_samples,
+                sampling_rate=sampling_rate,
+                enable=m.get("enable"),
+                start=m.get("start"),
+                length=m.get("length"),
+            )
+            if m_sampled is not None:
+                sampled["samples_marker" + i] = m_sampled
+    return sampled
+
+
 def sample_pulse(
     *,
     signal_type: str,
@@ -135,73 +216,175 @@ def sample_pulse(
         assert len(shape) == 2 and shape[1] == 2
         samples = samples[:, 0] + 1j * samples[:, 1]
 
-    if signal_type == "iq":
-        samples = samples.astype(complex)
-    else:
-        assert all(samples.imag == 0.0)
-        amplitude = amplitude.real
-        samples = samples.real
+    samples = _scale_and_modulate(
+        samples,
+        signal_type=signal_type,
+        sampling_rate=sampling_rate,
+        amplitude=amplitude,
+        phase=phase or 0.0,
+        modulation_frequency=modulation_frequency or 0.0,
+        mixer_type=mixer_type,
+    )
 
-    samples *= amplitude
+    retval = {"samples_i": samples.real, "samples_q": samples.imag}
+    if markers:
+        retval.update(_sample_markers(markers, len(samples), sampling_rate))
+    return retval
 
-    phase = phase or 0.0
-    modulation_frequency = modulation_frequency or 0.0
 
-    _logger.debug(
-        "Doing modulation with modulation_frequency %f and phase %f",
-        modulation_frequency,
-        phase,
-    )
+pulse_function_library = dict()
 
-    t = np.arange(num_samples) / sampling_rate
-    if modulation_frequency:
-        carrier_phase = 2.0 * np.pi * modulation_frequency * t
-    else:
-        carrier_phase = 0
-    carrier_phase += phase
+# Names of the pulse functions that accept arrays of shape (n, 1) for any of their
+# parameters, and then return the n corresponding pulses as an array of shape
+# (n, len(x)), see `sample_pulse_batch`
+batched_pulse_functions: set[str] = set()
 
-    if signal_type == "iq":
-        samples = np.exp(-1.0j * carrier_phase) * samples
-    else:
-        if not np.allclose(samples.imag, 0.0):
-            raise LabOneQException("Complex samples not permitted for RF signals")
-        samples = np.cos(carrier_phase) * samples
 
-    if mixer_type == MixerType.UHFQA_ENVELOPE and signal_type == "iq":
-        if not np.allclose(samples.imag, 0.0):
-            raise LabOneQException(
-                "HW modulation on UHFQA requires a real baseband (phase "
-                "modulation is not permitted)."
-            )
-        samples = samples.real * (1.0 + 1.0j)
+def _batched_pulse_parameters(
+    pulse_parameters: Sequence[Dict[str, Any] | None], count: int
+) -> Dict[str, Any]:
+    """Merges the parameters of the variants, as columns for those that differ.
 
-    retval = {"samples_i": samples.real, "samples_q": samples.imag}
-    if markers:
-        for i in ["1", "2"]:
-            m = next(
-                (m for m in markers if m.get("marker_selector") == "marker" + i),
-                None,
+    All variants must be given the same parameter names.
+    """
+    names = set(pulse_parameters[0] or {})
+    merged = {}
+    for name in names:
+        values = [(p or {})[name] for p in pulse_parameters]
+        if all(v is values[0] for v in values) or all(
+            np.isscalar(v) and v == values[0] for v in values
+        ):
+            merged[name] = values[0]
+        else:
+            merged[name] = np.array(values).reshape(count, 1)
+    return merged
+
+
+def sample_pulse_batch(
+    *,
+    signal_type: str,
+    sampling_rate: float,
+    length: float,
+    pulse_function: str,
+    amplitudes: Sequence[Complex],
+    phases: Sequence[float | None] | None = None,
+    modulation_frequencies: Sequence[float | None] | None = None,
+    mixer_type: Optional[MixerType] = MixerType.IQ,
+    pulse_parameters: Sequence[Dict[str, Any] | None] | None = None,
+    markers=None,
+) -> Dict[str, np.ndarray]:
+    """Sample many variants of a functional pulse at once.
+
+    The variants share the pulse function and its length, and differ in amplitude,
+    phase, modulation frequency and pulse parameters. Row `k` of the result is the
+    same as the result of `sample_pulse` for the `k`-th values of these arguments.
+
+    If the pulse function supports batching (see `batched_pulse_functions`), it is
+    evaluated once for all variants. Otherwise, it is evaluated once per variant,
+    and only the scaling and modulation are vectorized.
+
+    Args:
+        signal_type: "iq" if the pulse represents quadrature (IQ) modulation.
+        sampling_rate: Sampling rate of the device the pulse is played on.
+        length: Pulse length in seconds
+        pulse_function: The function to sample
+        amplitudes: Amplitude of each variant
+        phases: Phase shift of each variant
+        modulation_frequencies: Oscillator frequency of each variant (for
+          software modulation if not None)
+        mixer_type: Type of the mixer after the AWG. Only effective for IQ signals.
+        pulse_parameters: Pulse parameters of each variant
+        markers: The markers, common to all variants
+
+    Returns:
+        A dict with the arrays "samples_i" and "samples_q", and
+        "samples_marker1" and "samples_marker2" if given by the markers, of shape
+        (number of variants, number of samples).
+    """
+    count = len(amplitudes)
+    phases = [None] * count if phases is None else phases
+    modulation_frequencies = (
+        [None] * count if modulation_frequencies is None else modulation_frequencies
+    )
+    pulse_parameters = [None] * count if pulse_parameters is None else pulse_parameters
+    if not count == len(phases) == len(modulation_frequencies) == len(pulse_parameters):
+        raise ValueError("All variants must be given the same number of values.")
+
+    num_samples = length_to_samples(length, sampling_rate)
+    x = np.linspace(-1, 1, num_samples, endpoint=False)
+    function = pulse_function_library[pulse_function]
+
+    if pulse_function in batched_pulse_functions:
+        # Variants lacking a parameter get the default of the pulse function, so
+        # those with different parameter names are evaluated separately
+        by_names: dict[frozenset[str], list[int]] = {}
+        for index, parameters in enumerate(pulse_parameters):
+            by_names.setdefault(frozenset(parameters or {}), []).append(index)
+        groups = []
+        for indices in by_names.values():
+            group_samples = function(
+                x,
+                length=length,
+                amplitude=np.array([amplitudes[i] for i in indices]).reshape(-1, 1),
+                sampling_rate=sampling_rate,
+                **_batched_pulse_parameters(
+                    [pulse_parameters[i] for i in indices], len(indices)
+                ),
             )
-            if m:
-                start = m.get("start")
-                length = m.get("length")
-                enable = m.get("enable")
-                m_sampled = sample_marker(
-                    len(samples),
-                    sampling_rate=sampling_rate,
-                    enable=enable,
-                    start=start,
+            # Parameters common to all variants may result in a single pulse
+            groups.append(
+                (
+                    indices,
+                    np.broadcast_to(
+                        group_samples, (len(indices), np.shape(group_samples)[-1])
+                    ),
+                )
+            )
+        samples = np.empty(
+            (count, groups[0][1].shape[1]),
+            dtype=np.result_type(*[group_samples for _, group_samples in groups]),
+        )
+        for indices, group_samples in groups:
+            samples[indices] = group_samples
+    else:
+        samples = np.array(
+            [
+                function(
+                    x,
                     length=length,
+                    amplitude=amplitude,
+                    sampling_rate=sampling_rate,
+                    **(parameters or {}),
                 )
-                if m_sampled is not None:
-                    retval["samples_marker" + i] = m_sampled
+                for amplitude, parameters in zip(amplitudes, pulse_parameters)
+            ]
+        )
+    samples = samples[:, :num_samples]
+    if samples.ndim > 2:
+        assert samples.ndim == 3 and samples.shape[2] == 2
+        samples = samples[:, :, 0] + 1j * samples[:, :, 1]
+
+    samples = _scale_and_modulate(
+        samples,
+        signal_type=signal_type,
+        sampling_rate=sampling_rate,
+        amplitude=np.array(amplitudes).reshape(count, 1),
+        phase=np.array([phase or 0.0 for phase in phases]).reshape(count, 1),
+        modulation_frequency=np.array(
+            [frequency or 0.0 for frequency in modulation_frequencies]
+        ).reshape(count, 1),
+        mixer_type=mixer_type,
+    )
 
+    retval = {"samples_i": samples.real, "samples_q": samples.imag}
+    if markers:
+        for name, marker in _sample_markers(
+            markers, samples.shape[-1], sampling_rate
+        ).items():
+            retval[name] = np.tile(marker, (count, 1))
     return retval
 
 
-pulse_function_library = dict()
-
-
 def verify_amplitude_no_clipping(
     samples, pulse_id: str | None, mixer_type: MixerType, signal_id: str | None
 ):
@@ -15,6 +15,7 @@ from numpy.typing import ArrayLike
 from laboneq.compiler.common.pulse_parameters import decode_pulse_parameters
 from laboneq.core.exceptions.laboneq_exception import LabOneQException
 from laboneq.core.utilities.pulse_sampler import (
+    SHFQA_COMPLEX_SAMPLE_SCALING,
     combine_pulse_parameters,
     sample_pulse,
     verify_amplitude_no_clipping,
@@ -124,9 +125,13 @@ def _replace_pulse_in_wave(
             target_ofs = instance.offset_samples
             plen = min(len_samples, len(new_samples) - target_ofs)
         if component == Component.COMPLEX:
+            # Scaled like the complex waves emitted by the code generator
             new_samples[target_ofs : target_ofs + plen] = (
-                samples["samples_i"][pulse_ofs : pulse_ofs + plen]
-                - 1.0j * samples["samples_q"][pulse_ofs : pulse_ofs + plen]
+                SHFQA_COMPLEX_SAMPLE_SCALING
+                * (
+                    samples["samples_i"][pulse_ofs : pulse_ofs + plen]
+                    - 1.0j * samples["samples_q"][pulse_ofs : pulse_ofs + plen]
+                )
             )
         else:
             comp = (
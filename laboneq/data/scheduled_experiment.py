@@ -8,6 +8,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from laboneq.core.utilities.deferred import DeferredFieldsMixin
 from laboneq.core.validators import dicts_equal
 from laboneq.data import EnumReprMixin
 from laboneq.data.recipe import Recipe
@@ -66,7 +67,16 @@ class CompilerArtifact:
 
 
 @dataclass
-class ArtifactsCodegen(CompilerArtifact):
+class ArtifactsCodegen(DeferredFieldsMixin, CompilerArtifact):
+    # Only materialized on first access when loading a compiled experiment
+    _deserialize_lazily = (
+        "src",
+        "waves",
+        "wave_indices",
+        "command_tables",
+        "pulse_map",
+    )
+
     #: The SeqC source code, per device.
     src: list[dict[str, str]] = None
 
@@ -3,11 +3,15 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Any, Callable, Dict
 
 import numpy as np
 
-from laboneq.core.utilities.pulse_sampler import pulse_function_library
+from laboneq.core.utilities.pulse_sampler import (
+    batched_pulse_functions,
+    pulse_function_library,
+)
 from laboneq.dsl.experiment.pulse import (
     PulseFunctional,
     PulseSampledComplex,
@@ -15,7 +19,11 @@ from laboneq.dsl.experiment.pulse import (
 )
 
 
-def register_pulse_functional(sampler: Callable, name: str | None = None):
+def register_pulse_functional(
+    sampler: Callable | None = None,
+    name: str | None = None,
+    supports_batching: bool = False,
+):
     """Build & register a new pulse type from a sampler function.
 
     The sampler function must have the following signature:
@@ -40,12 +48,23 @@ def register_pulse_functional(sampler: Callable, name: str | None = None):
     amplitude. LabOne Q will automatically rescale the sampler's output to the correct
     amplitude and length.
 
+    If the sampler function accepts arrays of shape ``(n, 1)`` for any of its
+    parameters, and then returns the ``n`` corresponding pulses as an array of shape
+    ``(n, len(x))``, register it with ``supports_batching=True``. The compiler then
+    samples the variants of the pulse, e.g. in a parameter sweep, with a single call.
+    Without arguments other than ``sampler``, this function may also be used as a
+    decorator factory, e.g. ``@register_pulse_functional(supports_batching=True)``.
+
 
     Args:
         sampler:
             the function used for sampling the pulse
         name:
             the name used internally for referring to this pulse type
+        supports_batching:
+            whether the sampler function can evaluate many parameter values at once
+
+            !!! version-added "Added in version 2.21.0"
 
     Returns:
         pulse_factory (function):
@@ -62,6 +81,11 @@ def register_pulse_functional(sampler: Callable, name: str | None = None):
                     pass
             ```
     """
+    if sampler is None:
+        return functools.partial(
+            register_pulse_functional, name=name, supports_batching=supports_batching
+        )
+
     if name is None:
         function_name = sampler.__name__
     else:
@@ -99,10 +123,14 @@ def register_pulse_functional(sampler: Callable, name: str | None = None):
     # we do not wrap __qualname__, it throws off the documentation generator
 
     pulse_function_library[function_name] = sampler
+    if supports_batching:
+        batched_pulse_functions.add(function_name)
+    else:
+        batched_pulse_functions.discard(function_name)
     return factory
 
 
-@register_pulse_functional
+@register_pulse_functional(supports_batching=True)
 def gaussian(
     x,
     sigma=1 / 3,
@@ -130,16 +158,15 @@ def gaussian(
     """
 
     # Check if order is even and positive
-    if order <= 0 or order % 2 != 0:
+    if np.any(order <= 0) or np.any(order % 2 != 0):
         raise ValueError("The order must be positive and even.")
 
     gauss = np.exp(-((x**order) / (2 * sigma**2)))
 
-    if zero_boundaries:
+    if np.any(zero_boundaries):
         dt = x[0] - (x[1] - x[0])
-        delta = np.exp(-((dt**order) / (2 * sigma**2)))
-        gauss -= delta
-        gauss /= 1 - delta
+        delta = np.where(zero_boundaries, np.exp(-((dt**order) / (2 * sigma**2))), 0)
+        gauss = (gauss - delta) / (1 - delta)
 
     return gauss
 
@@ -187,7 +214,7 @@ def gaussian_square(
     return gauss_sq
 
 
-@register_pulse_functional
+@register_pulse_functional(supports_batching=True)
 def const(x, **_):
     """Create a constant pulse.
 
@@ -204,7 +231,7 @@ def const(x, **_):
     return np.ones_like(x)
 
 
-@register_pulse_functional
+@register_pulse_functional(supports_batching=True)
 def triangle(x, **_):
     """Create a triangle pulse.
 
@@ -225,7 +252,7 @@ def triangle(x, **_):
     return 1 - np.abs(x)
 
 
-@register_pulse_functional
+@register_pulse_functional(supports_batching=True)
 def sawtooth(x, **_):
     """Create a sawtooth pulse.
 
@@ -243,7 +270,7 @@ def sawtooth(x, **_):
     return 0.5 * (1 - x)
 
 
-@register_pulse_functional
+@register_pulse_functional(supports_batching=True)
 def drag(x, sigma=1 / 3, beta=0.2, zero_boundaries=False, **_):
     """Create a DRAG pulse.
 
@@ -265,15 +292,15 @@ def drag(x, sigma=1 / 3, beta=0.2, zero_boundaries=False, **_):
     """
     gauss = np.exp(-(x**2) / (2 * sigma**2))
     delta = 0
-    if zero_boundaries:
+    if np.any(zero_boundaries):
         dt = x[0] - (x[1] - x[0])
-        delta = np.exp(-(dt**2) / (2 * sigma**2))
+        delta = np.where(zero_boundaries, np.exp(-(dt**2) / (2 * sigma**2)), 0)
     d_gauss = -x / sigma**2 * gauss
-    gauss -= delta
+    gauss = gauss - delta
     return (gauss + 1j * beta * d_gauss) / (1 - delta)
 
 
-@register_pulse_functional
+@register_pulse_functional(supports_batching=True)
 def cos2(x, **_):
     """Create a raised cosine pulse.
 
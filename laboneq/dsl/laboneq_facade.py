@@ -41,6 +41,7 @@ class LabOneQFacade:
             run_parameters=run_parameters,
             target_setup=target_setup,
             neartime_callbacks=session._neartime_callbacks,
+            result_sinks=session._result_sinks,
         )
         controller.connect()
         session._controller = controller
@@ -84,13 +85,18 @@ class LabOneQFacade:
         return compiled_experiment
 
     @staticmethod
-    def run(session: Session):
+    def run(
+        session: Session,
+        result_dtype: npt.DTypeLike | dict[str, npt.DTypeLike] | None = None,
+    ):
         controller: ctrl.Controller = session._controller
 
         if controller._run_parameters.shut_down is True:
             atexit.register(ctrl._stop_controller, controller)
 
-        controller.execute_compiled_legacy(session.compiled_experiment, session)
+        controller.execute_compiled_legacy(
+            session.compiled_experiment, session, result_dtype=result_dtype
+        )
 
     @staticmethod
     def replace_pulse(
@@ -3,3 +3,4 @@
 
 from .acquired_result import AcquiredResult, AcquiredResults
 from .results import Results
+from .result_sinks import CallbackResultSink, FileResultSink, ResultSink, ResultStream
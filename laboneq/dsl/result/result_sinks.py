@@ -0,0 +1,193 @@
+# Copyright 2023 Zurich Instruments AG
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import queue
+from pathlib import Path
+from typing import IO, AsyncIterator, Callable, Iterator
+
+import numpy as np
+
+from laboneq.core.utilities.string_sanitize import string_sanitize
+
+from .acquired_result import AcquiredResult, AcquiredResults
+
+
+class ResultSink:
+    """Receiver of the results streamed during the experiment execution.
+
+    For every near-time step, the sink is given one `AcquiredResult` per handle.
+    Its `data` holds the results of the step only, its `axis_name` and `axis` describe
+    the real-time dimensions, and its `last_nt_step` holds the indices of the step.
+
+    All methods are called from the thread running the experiment.
+
+    !!! version-added "Added in version 2.21.0"
+    """
+
+    def open(self, acquired_results: AcquiredResults):
+        """Called before the execution, with the (yet empty) results of all handles."""
+
+    def append(self, result: AcquiredResult):
+        """Called for every near-time step and handle, as soon as the results are read."""
+
+    def close(self):
+        """Called after the execution, also if the execution failed."""
+
+
+class CallbackResultSink(ResultSink):
+    """Passes every streamed result slice to the given function.
+
+    Args:
+        callback: Function called with the `AcquiredResult` of a single near-time step.
+
+    !!! version-added "Added in version 2.21.0"
+    """
+
+    def __init__(self, callback: Callable[[AcquiredResult], None]):
+        self._callback = callback
+
+    def append(self, result: AcquiredResult):
+        self._callback(result)
+
+
+class ResultStream(ResultSink):
+    """Thread-safe stream of the result slices.
+
+    The stream can be consumed from another thread while the experiment runs, either
+    by iterating over it, or asynchronously via `async for`. The iteration ends when
+    the execution finishes.
+
+    !!! version-added "Added in version 2.21.0"
+    """
+
+    _END = object()
+
+    def __init__(self, maxsize: int = 0):
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+
+    def append(self, result: AcquiredResult):
+        self._queue.put(result)
+
+    def close(self):
+        self._queue.put(self._END)
+
+    def __iter__(self) -> Iterator[AcquiredResult]:
+        while True:
+            item = self._queue.get()
+            if item is self._END:
+                return
+            yield item
+
+    async def __aiter__(self) -> AsyncIterator[AcquiredResult]:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await loop.run_in_executor(None, self._queue.get)
+            if item is self._END:
+                return
+            yield item
+
+
+_RESULT_SUFFIX = ".result"
+
+
+class FileResultSink(ResultSink):
+    """Appends the result slices to chunked arrays on disk.
+
+    For every handle, the directory receives the files
+
+    * `<name>.result.json` - the header with the handle, dtype, chunk shape and axis
+      names,
+    * `<name>.result.bin` - the raw data of the near-time steps, one chunk after
+      another,
+    * `<name>.result.steps` - the indices of the near-time step of each chunk, one
+      per line,
+
+    where `<name>` is the sanitized handle. Data is flushed after every step, so that
+    it can be analyzed with `FileResultSink.load` while the experiment still runs.
+
+    Args:
+        directory: Target directory, created if it doesn't exist.
+
+    !!! version-added "Added in version 2.21.0"
+    """
+
+    def __init__(self, directory: str | os.PathLike):
+        self._directory = Path(directory)
+        self._files: dict[str, tuple[IO, IO]] = {}
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def open(self, acquired_results: AcquiredResults):
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def _open_handle(self, result: AcquiredResult) -> tuple[IO, IO]:
+        name = string_sanitize(result.handle) + _RESULT_SUFFIX
+        data = np.asarray(result.data)
+        header = {
+            "handle": result.handle,
+            "dtype": data.dtype.str,
+            "chunk_shape": list(data.shape),
+            "axis_name": [str(n) for n in result.axis_name],
+        }
+        (self._directory / f"{name}.json").write_text(json.dumps(header))
+        files = (
+            open(self._directory / f"{name}.bin", "wb"),
+            open(self._directory / f"{name}.steps", "w"),
+        )
+        self._files[result.handle] = files
+        return files
+
+    def append(self, result: AcquiredResult):
+        files = self._files.get(result.handle)
+        if files is None:
+            files = self._open_handle(result)
+        data_file, steps_file = files
+        data_file.write(np.ascontiguousarray(result.data).tobytes())
+        data_file.flush()
+        steps_file.write(json.dumps(result.last_nt_step) + "\n")
+        steps_file.flush()
+
+    def close(self):
+        for data_file, steps_file in self._files.values():
+            data_file.close()
+            steps_file.close()
+        self._files.clear()
+
+    @staticmethod
+    def load(
+        directory: str | os.PathLike,
+    ) -> dict[str, tuple[list[list[int]], np.memmap]]:
+        """Loads the results written by a `FileResultSink`.
+
+        Other files in the directory are ignored.
+
+        Returns:
+            A dictionary mapping the handles to tuples of the near-time step indices
+            and the memory-mapped data, with the chunk index as the first dimension.
+        """
+        directory = Path(directory)
+        loaded = {}
+        for header_path in directory.glob(f"*{_RESULT_SUFFIX}.json"):
+            header = json.loads(header_path.read_text())
+            dtype = np.dtype(header["dtype"])
+            chunk_shape = tuple(header["chunk_shape"])
+            steps_text = header_path.with_suffix(".steps").read_text()
+            steps = [json.loads(line) for line in steps_text.splitlines()]
+            data_path = header_path.with_suffix(".bin")
+            chunk_size = dtype.itemsize * int(np.prod(chunk_shape))
+            # Ignore a partially written last chunk, and steps without data
+            count = min(len(steps), data_path.stat().st_size // max(chunk_size, 1))
+            data = (
+                np.memmap(data_path, dtype=dtype, mode="r", shape=(count, *chunk_shape))
+                if count > 0
+                else np.empty((0, *chunk_shape), dtype=dtype)
+            )
+            loaded[header["handle"]] = (steps[:count], data)
+        return loaded
@@ -233,5 +233,5 @@ class Results:
     def load(filename) -> Results:
         return Serializer.from_json_file(filename, Results)
 
-    def save(self, filename):
-        Serializer.to_json_file(self, filename)
+    def save(self, filename, binary_arrays: bool = False):
+        Serializer.to_json_file(self, filename, binary_arrays=binary_arrays)
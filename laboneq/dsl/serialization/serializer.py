@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import copy
+import os
+import uuid
 from collections import OrderedDict
 from itertools import chain
 from typing import Dict
@@ -9,8 +11,15 @@ from typing import Dict
 import orjson
 
 from laboneq.core.exceptions import LabOneQException
+from laboneq.core.serialization.array_blobs import (
+    ArrayBlobReader,
+    ArrayBlobWriter,
+    reading_array_blobs,
+    writing_array_blobs,
+)
 from laboneq.core.serialization.simple_serialization import (
     deserialize_from_dict_with_ref,
+    document_directory,
     module_classes,
     serialize_to_dict_with_ref,
 )
@@ -30,6 +39,10 @@ from laboneq.dsl.prng import PRNGSample
 
 
 class Serializer:
+    # File names within the directory of the binary container format
+    CONTAINER_MANIFEST = "manifest.json"
+    CONTAINER_ARRAYS = "arrays.bin"
+
     @staticmethod
     def _entity_config():
         entity_classes = frozenset(
@@ -119,14 +132,59 @@ class Serializer:
         )
 
     @staticmethod
-    def to_json_file(serializable_object, filename: str):
-        json_string = Serializer.to_json(serializable_object)
+    def to_json_file(serializable_object, filename: str, binary_arrays: bool = False):
+        """Serializes the object to a JSON file.
+
+        With `binary_arrays`, `filename` is a directory which receives the JSON
+        manifest, and the large arrays as raw binary data in a separate file. Such
+        directories are loaded by `from_json_file` with the arrays memory-mapped.
+        """
+        if binary_arrays:
+            Serializer._to_container(serializable_object, filename)
+            return
+        with document_directory(os.path.dirname(os.path.abspath(filename))):
+            json_string = Serializer.to_json(serializable_object)
         try:
             with open(filename, mode="w") as file:
                 file.write(json_string)
         except IOError as e:
             raise LabOneQException() from e
 
+    @staticmethod
+    def _to_container(serializable_object, directory: str):
+        manifest_path = os.path.join(directory, Serializer.CONTAINER_MANIFEST)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # Never overwrite an existing arrays file, which may still be
+            # memory-mapped by objects loaded from a previous version of the
+            # container. The manifest records the name of the new file.
+            arrays_name = Serializer.CONTAINER_ARRAYS
+            if os.path.exists(os.path.join(directory, arrays_name)):
+                arrays_name = f"arrays-{uuid.uuid4().hex}.bin"
+            with open(os.path.join(directory, arrays_name), mode="xb") as file:
+                with writing_array_blobs(
+                    ArrayBlobWriter(file, name=arrays_name)
+                ), document_directory(directory):
+                    json_string = Serializer.to_json(serializable_object)
+            with open(manifest_path + ".tmp", mode="w") as file:
+                file.write(json_string)
+            os.replace(manifest_path + ".tmp", manifest_path)
+        except IOError as e:
+            raise LabOneQException(
+                f"Failed to write the container '{directory}': {e}"
+            ) from e
+        for name in os.listdir(directory):
+            if name != arrays_name and (
+                name == Serializer.CONTAINER_ARRAYS
+                or name.startswith("arrays-")
+                and name.endswith(".bin")
+            ):
+                try:
+                    os.remove(os.path.join(directory, name))
+                except OSError:
+                    # Still memory-mapped on Windows, removed on the next save
+                    pass
+
     @staticmethod
     def _classes_by_short_name():
         dsl_modules = [
@@ -244,10 +302,25 @@ class Serializer:
 
     @staticmethod
     def from_json_file(filename: str, type_hint):
+        if os.path.isdir(filename):
+            return Serializer._from_container(filename, type_hint)
         try:
             with open(filename, mode="r") as file:
                 json_string = file.read()
         except IOError as e:
             raise LabOneQException(e.__repr__()) from e
 
-        return Serializer.from_json(json_string, type_hint)
+        with document_directory(os.path.dirname(os.path.abspath(filename))):
+            return Serializer.from_json(json_string, type_hint)
+
+    @staticmethod
+    def _from_container(directory: str, type_hint):
+        try:
+            with open(os.path.join(directory, Serializer.CONTAINER_MANIFEST)) as file:
+                json_string = file.read()
+            reader = ArrayBlobReader(directory, Serializer.CONTAINER_ARRAYS)
+        except IOError as e:
+            raise LabOneQException(e.__repr__()) from e
+
+        with reading_array_blobs(reader), document_directory(directory):
+            return Serializer.from_json(json_string, type_hint)
@@ -24,11 +24,13 @@ from laboneq.dsl.device.io_units.logical_signal import (
 from laboneq.dsl.experiment import Experiment
 from laboneq.dsl.laboneq_facade import LabOneQFacade
 from laboneq.dsl.result import Results
+from laboneq.dsl.result.result_sinks import CallbackResultSink, ResultSink
 from laboneq.dsl.serialization import Serializer
 
 if TYPE_CHECKING:
     from laboneq.controller import Controller
     from laboneq.dsl.experiment.pulse import Pulse
+    from laboneq.dsl.result.acquired_result import AcquiredResult
 
 
 _logger = logging.getLogger(__name__)
@@ -122,6 +124,7 @@ class Session:
         else:
             self._logger = logging.getLogger("null")
         self._neartime_callbacks: Dict[str, Callable] = {}
+        self._result_sinks: list[ResultSink] = []
         self._toolkit_devices = ToolkitDevices()
 
     @property
@@ -192,6 +195,35 @@ class Session:
             name = func.__name__
         self._neartime_callbacks[name] = func
 
+    def register_result_sink(
+        self, sink: ResultSink | Callable[[AcquiredResult], None]
+    ) -> ResultSink:
+        """Registers a receiver of the results streamed during the execution.
+
+        The results of each near-time step are passed to the sink as soon as they are
+        read from the instruments, see [ResultSink][laboneq.dsl.result.result_sinks.ResultSink].
+
+        Args:
+            sink: The result sink, or a function to be called with the `AcquiredResult`
+                of every near-time step and handle.
+
+        Returns:
+            The registered sink.
+
+        !!! version-added "Added in version 2.21.0"
+        """
+        if not isinstance(sink, ResultSink):
+            sink = CallbackResultSink(sink)
+        self._result_sinks.append(sink)
+        return sink
+
+    def unregister_result_sink(self, sink: ResultSink):
+        """Removes a previously registered result sink.
+
+        !!! version-added "Added in version 2.21.0"
+        """
+        self._result_sinks.remove(sink)
+
     def register_user_function(self, func, name: str | None = None):
         """Registers a near-time callback to be referred from the experiment's `call` operation.
 
@@ -353,6 +385,7 @@ class Session:
     def run(
         self,
         experiment: Union[Experiment, CompiledExperiment] | None = None,
+        result_dtype: npt.DTypeLike | dict[str, npt.DTypeLike] | None = None,
     ) -> Results | None:
         """Executes the compiled experiment.
 
@@ -371,6 +404,15 @@ class Session:
                 run. The experiment will be compiled if it has not been yet. If no
                 experiment is specified the previously assigned and compiled experiment
                 is used.
+            result_dtype: Optional. The dtype of the acquired results, either for all
+                handles, or as a dictionary mapping handles to dtypes. Defaults to
+                `complex128`. Complex dtypes like `complex64` are supported for all
+                acquisition types, real dtypes like `float32` only for
+                discrimination, and integer dtypes like `int8` only for single-shot
+                discrimination. Integer results not yet acquired read -1 instead
+                of NaN.
+
+                !!! version-added "Added in version 2.21.0"
 
         Returns:
             results:
@@ -395,7 +437,7 @@ class Session:
             neartime_callback_results={},
             execution_errors=[],
         )
-        LabOneQFacade.run(self)
+        LabOneQFacade.run(self, result_dtype=result_dtype)
         return self.results
 
     def submit(
@@ -675,13 +717,19 @@ class Session:
 
         self._compiled_experiment = CompiledExperiment.load(filename)
 
-    def save_compiled_experiment(self, filename: str):
+    def save_compiled_experiment(self, filename: str, binary_arrays: bool = False):
         """Saves the compiled experiment from the session into a given file.
 
         Args:
             filename:
                 Filename (full path) of the file where the experiment
                 should be stored in.
+            binary_arrays:
+                If `True`, `filename` is a directory, which receives the JSON
+                file and, in a separate binary file, the raw array data. The
+                arrays are memory-mapped when loading the directory.
+
+                !!! version-added "Added in version 2.21.0"
         """
         if self._compiled_experiment is None:
             self.logger.info(
@@ -689,7 +737,7 @@ class Session:
                 "in order to compile an experiment."
             )
         else:
-            self._compiled_experiment.save(filename)
+            self._compiled_experiment.save(filename, binary_arrays=binary_arrays)
 
     def load_experiment_calibration(self, filename: str):
         """Loads a experiment calibration from a given file into the session.
@@ -732,18 +780,23 @@ class Session:
             signal_map = self._experiment_definition.get_signal_map()
             Serializer.to_json_file(signal_map, filename)
 
-    def save_results(self, filename: str):
+    def save_results(self, filename: str, binary_arrays: bool = False):
         """Saves the result from the session into a given file.
 
         Args:
             filename: Filename (full path) of the file where the result should be stored in.
+            binary_arrays: If `True`, `filename` is a directory, which receives the JSON
+                file and, in a separate binary file, the raw array data. The arrays are
+                memory-mapped when loading the directory.
+
+                !!! version-added "Added in version 2.21.0"
         """
         if self._last_results is None:
             self.logger.info(
                 "No results available in this session. Execute run() or simulate_outputs() in order to generate an experiment's result."
             )
         else:
-            self._last_results.save(filename)
+            self._last_results.save(filename, binary_arrays=binary_arrays)
 
     def abort_execution(self):
         """Abort the execution of an experiment.
@@ -0,0 +1,151 @@
+# Copyright 2023 Zurich Instruments AG
+# SPDX-License-Identifier: Apache-2.0
+
+"""Min/max envelopes of simulated waveforms at multiple resolutions.
+
+Level 0 of the pyramid holds the minimum and maximum of every `BASE_BUCKET_SAMPLES`
+samples, each further level those of `LEVEL_FACTOR` buckets of the level below.
+An envelope of any window at a given number of points is then reduced from the
+coarsest level with at least `LEVEL_FACTOR` buckets per point, i.e. from fewer
+than `LEVEL_FACTOR**2` buckets per point, independent of the length of the window.
+
+The waveform is sampled and reduced lazily, in chunks of `CHUNK_SAMPLES` samples,
+so that an envelope of a window only requires the chunks overlapping the window.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable
+
+import numpy as np
+
+# Number of samples per bucket of the finest level
+BASE_BUCKET_SAMPLES = 32
+# Ratio of the bucket sizes of consecutive levels
+LEVEL_FACTOR = 4
+# The level with one bucket per chunk
+CHUNK_LEVEL = 7
+# Number of samples sampled and reduced at once
+CHUNK_SAMPLES = BASE_BUCKET_SAMPLES * LEVEL_FACTOR**CHUNK_LEVEL
+
+
+def _reduce(values: np.ndarray, group: int, ufunc: np.ufunc) -> np.ndarray:
+    """Reduce groups of `group` consecutive values along the last axis, the last
+    group may be incomplete."""
+    if values.shape[-1] == 0 or group == 1:
+        return values
+    return ufunc.reduceat(values, np.arange(0, values.shape[-1], group), axis=-1)
+
+
+def bucket_samples(samples: int, points: int) -> int:
+    """The number of samples per bucket to show `samples` in at most about `points`
+    points."""
+    return -(-samples // max(points, 1))
+
+
+class EnvelopePyramid:
+    """Min/max envelopes of a waveform, at decreasing resolutions.
+
+    The envelopes of the real and imaginary parts of complex waveforms are kept
+    separately, as rows of the level arrays.
+
+    Args:
+        sample: Returns the `length` samples of the waveform starting at sample
+            `start`, called as `sample(start, length)`.
+        length: The number of samples of the waveform.
+    """
+
+    def __init__(self, sample: Callable[[int, int], np.ndarray], length: int):
+        self._sample = sample
+        self._length = length
+        # The levels 0 to CHUNK_LEVEL of the chunks sampled so far, by chunk index
+        self._chunks: dict[int, list[tuple[np.ndarray, np.ndarray]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def is_complex(self) -> bool:
+        return self._chunk_levels(0)[0][0].shape[0] == 2
+
+    def _chunk_levels(self, index: int) -> list[tuple[np.ndarray, np.ndarray]]:
+        with self._lock:
+            levels = self._chunks.get(index)
+            if levels is not None:
+                return levels
+            start = index * CHUNK_SAMPLES
+            chunk = self._sample(start, min(CHUNK_SAMPLES, self._length - start))
+            if np.iscomplexobj(chunk):
+                rows = np.vstack([chunk.real, chunk.imag])
+            else:
+                rows = np.reshape(chunk, (1, -1))
+            rows = rows.astype(np.float32)
+            mins = _reduce(rows, BASE_BUCKET_SAMPLES, np.minimum)
+            maxs = _reduce(rows, BASE_BUCKET_SAMPLES, np.maximum)
+            levels = [(mins, maxs)]
+            for _ in range(CHUNK_LEVEL):
+                mins = _reduce(mins, LEVEL_FACTOR, np.minimum)
+                maxs = _reduce(maxs, LEVEL_FACTOR, np.maximum)
+                levels.append((mins, maxs))
+            self._chunks[index] = levels
+            return levels
+
+    def _level(
+        self, level: int, first: int, last: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """The minima and maxima of the buckets `[first, last)` of a level."""
+        if level > CHUNK_LEVEL:
+            # Reduced from the chunk level, the groups align with the chunks
+            group = LEVEL_FACTOR ** (level - CHUNK_LEVEL)
+            mins, maxs = self._level(CHUNK_LEVEL, first * group, last * group)
+            return (
+                _reduce(mins, group, np.minimum),
+                _reduce(maxs, group, np.maximum),
+            )
+        bucket = BASE_BUCKET_SAMPLES * LEVEL_FACTOR**level
+        last = min(last, -(-self._length // bucket))
+        first = min(first, last)
+        per_chunk = LEVEL_FACTOR ** (CHUNK_LEVEL - level)
+        chunks = [
+            self._chunk_levels(index)[level]
+            for index in range(first // per_chunk, -(-last // per_chunk))
+        ]
+        if not chunks:
+            rows = self._chunk_levels(0)[level][0].shape[0]
+            empty = np.empty((rows, 0), dtype=np.float32)
+            return empty, empty
+        offset = first // per_chunk * per_chunk
+        return (
+            np.hstack([mins for mins, _ in chunks])[:, first - offset : last - offset],
+            np.hstack([maxs for _, maxs in chunks])[:, first - offset : last - offset],
+        )
+
+    def envelope(
+        self, start_samples: int, end_samples: int, points: int
+    ) -> tuple[int, int, np.ndarray, np.ndarray] | None:
+        """The envelope of the samples `[start_samples, end_samples)` in about
+        `points` buckets.
+
+        Returns the first sample of the first bucket, the number of samples per
+        bucket, and the minima and maxima of the buckets, or None if the buckets
+        would be smaller than those of the finest level.
+        """
+        target = bucket_samples(end_samples - start_samples, points)
+        if target < BASE_BUCKET_SAMPLES:
+            return None
+        level = 0
+        while BASE_BUCKET_SAMPLES * LEVEL_FACTOR ** (level + 2) <= target:
+            level += 1
+        bucket = BASE_BUCKET_SAMPLES * LEVEL_FACTOR**level
+        # Round up to whole buckets of the level, for at most `points` + 1 buckets
+        group = -(-target // bucket)
+        out_bucket = group * bucket
+        first = start_samples // out_bucket * group
+        last = min(-(-end_samples // out_bucket) * group, -(-self._length // bucket))
+        first = min(first, last)
+        mins, maxs = self._level(level, first, last)
+        return (
+            first * bucket,
+            out_bucket,
+            _reduce(mins, group, np.minimum),
+            _reduce(maxs, group, np.maximum),
+        )
@@ -3,8 +3,11 @@
 
 from __future__ import annotations
 
+import os
+import threading
 from dataclasses import dataclass
 
+import numpy as np
 from numpy.typing import ArrayLike
 
 from laboneq.core.types.compiled_experiment import CompiledExperiment
@@ -12,7 +15,17 @@ from laboneq.data.recipe import RealtimeExecutionInit
 from laboneq.dsl.device.device_setup import DeviceSetup
 from laboneq.dsl.device.instruments.shfqc import SHFQC
 from laboneq.dsl.device.io_units.physical_channel import PhysicalChannel
-from laboneq.simulator.seqc_parser import simulate
+from laboneq.simulator.envelope_pyramid import (
+    BASE_BUCKET_SAMPLES,
+    EnvelopePyramid,
+    bucket_samples,
+)
+from laboneq.simulator.seqc_parser import (
+    SeqCSimulation,
+    analyze_compiled,
+    run_single_source,
+    simulate_sources,
+)
 from laboneq.simulator.wave_scroller import SimTarget, WaveScroller
 
 
@@ -25,6 +38,27 @@ class OutputData:
     frequency: ArrayLike = None
 
 
+@dataclass
+class EnvelopeData:
+    time: ArrayLike
+    wave_min: ArrayLike
+    wave_max: ArrayLike
+    samples_per_point: int = 1
+
+
+def _simulation_end(sim: SeqCSimulation) -> int:
+    """The sample after the end of the last event of a simulation."""
+    end_samples = sim.event_index().end_samples
+    end = int(end_samples.max()) if len(end_samples) else 0
+    for loop in sim.loops:
+        block_start = sim.events[loop.first_event].start_samples
+        end = max(
+            end,
+            block_start + (loop.count - 1) * loop.period_samples + loop.span_samples,
+        )
+    return end
+
+
 @dataclass
 class _AWG_ID:
     is_out: bool
@@ -109,6 +143,13 @@ class OutputSimulator:
         max_output_length:
             Deprecated and has no effect. Use the `output_length` argument to
             the `get_snippet` method instead.
+        loop_aware:
+            Whether to simulate the repetitions of loops in a steady state
+            only once, instead of unrolling them. The simulation time of long
+            averaging loops then no longer depends on the number of iterations.
+            Repetitions that start after `max_simulation_length` are dropped.
+
+            !!! version-added "Added in version 2.21.0"
 
     Attributes:
         max_output_length:
@@ -136,6 +177,10 @@ class OutputSimulator:
         # Maximum output length can also be set later
         output_simulator.max_output_length = 5e-6
 
+        # The SeqC programs are simulated on first use. To simulate all of them
+        # upfront, in parallel processes:
+        output_simulator.simulate_all()
+
         # As next, retrieve the actual simulated waveform
         data = output_simulator.get_snippet(
             physical_channel,
@@ -159,12 +204,22 @@ class OutputSimulator:
         compiled_experiment: CompiledExperiment,
         max_simulation_length: float = 10e-3,
         max_output_length: float = 10e-6,
+        loop_aware: bool = False,
     ) -> None:
         self._compiled_experiment = compiled_experiment
         self._max_output_length = max_output_length
-        self._simulations = simulate(
-            compiled_experiment, max_time=max_simulation_length
-        )
+        self._max_simulation_length = max_simulation_length
+        self._loop_aware = loop_aware
+        seqc_descriptors, self._waves = analyze_compiled(compiled_experiment)
+        self._seqc_descriptors = {d.name: d for d in seqc_descriptors}
+        # The SeqC programs are simulated on first use
+        self._simulations: dict[str, SeqCSimulation] = {}
+        self._envelope_pyramids: dict[tuple, EnvelopePyramid] = {}
+        self._lock = threading.Lock()
+        # Held while simulating a program, so that it is simulated only once
+        self._program_locks = {
+            name: threading.Lock() for name in self._seqc_descriptors
+        }
 
     @property
     def max_output_length(self) -> float:
@@ -174,6 +229,59 @@ class OutputSimulator:
     def max_output_length(self, max_output_length: float):
         self._max_output_length = max_output_length
 
+    def simulate_all(self, max_workers: int | None = None):
+        """Simulate all SeqC programs of the experiment at once.
+
+        Otherwise, each program is simulated when a snippet of one of its channels
+        is first requested.
+
+        Arguments:
+            max_workers: The maximum number of processes to simulate the programs
+                in. Defaults to the number of CPUs. The processes are only forked
+                from the main thread, elsewhere the programs are simulated in the
+                calling thread.
+
+        !!! version-added "Added in version 2.21.0"
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        with self._lock:
+            pending = [
+                descriptor
+                for name, descriptor in self._seqc_descriptors.items()
+                if name not in self._simulations
+            ]
+        simulations = simulate_sources(
+            pending,
+            self._waves,
+            self._max_simulation_length,
+            max_workers,
+            self._loop_aware,
+        )
+        with self._lock:
+            for name, sim in simulations.items():
+                # Keep the simulation of a concurrent request, if any
+                self._simulations.setdefault(name, sim)
+
+    def _simulation(self, prog: str) -> SeqCSimulation:
+        with self._lock:
+            sim = self._simulations.get(prog)
+        if sim is not None:
+            return sim
+        with self._program_locks[prog]:
+            with self._lock:
+                sim = self._simulations.get(prog)
+            if sim is None:
+                sim = run_single_source(
+                    self._seqc_descriptors[prog],
+                    self._waves,
+                    self._max_simulation_length,
+                    self._loop_aware,
+                )
+                with self._lock:
+                    sim = self._simulations.setdefault(prog, sim)
+            return sim
+
     def _uid_to_channel(self, uid: str) -> PhysicalChannel:
         pcg = self._compiled_experiment.device_setup.physical_channel_groups
         channel_by_uids = {
@@ -187,6 +295,18 @@ class OutputSimulator:
                 f" Available channels: {', '.join(channel_by_uids.keys())}"
             ) from e
 
+    def _awg_id(self, physical_channel: str | PhysicalChannel) -> _AWG_ID:
+        channel = (
+            physical_channel
+            if isinstance(physical_channel, PhysicalChannel)
+            else self._uid_to_channel(physical_channel)
+        )
+        return _AWG_ID(
+            self._compiled_experiment.device_setup,
+            channel,
+            self._compiled_experiment.scheduled_experiment.recipe.realtime_execution_init,
+        )
+
     def get_snippet(
         self,
         physical_channel: str | PhysicalChannel,
@@ -219,18 +339,7 @@ class OutputSimulator:
                 The corresponding attribute is `None` if the associated data was not
                 requested.
         """
-        channel = (
-            physical_channel
-            if isinstance(physical_channel, PhysicalChannel)
-            else self._uid_to_channel(physical_channel)
-        )
-        awg_id = _AWG_ID(
-            self._compiled_experiment.device_setup,
-            channel,
-            self._compiled_experiment.scheduled_experiment.recipe.realtime_execution_init,
-        )
-
-        sim = self._simulations[awg_id.prog]
+        awg_id = self._awg_id(physical_channel)
         sim_targets = SimTarget.NONE
         if get_wave and awg_id.is_out:
             sim_targets |= SimTarget.PLAY
@@ -245,7 +354,7 @@ class OutputSimulator:
         ws = WaveScroller(
             ch=awg_id.channels,
             sim_targets=sim_targets,
-            sim=sim,
+            sim=self._simulation(awg_id.prog),
         )
         ws.calc_snippet(start, output_length)
         return OutputData(
@@ -255,3 +364,101 @@ class OutputSimulator:
             trigger=ws.trigger_snippet,
             frequency=ws.frequency_snippet,
         )
+
+    def _envelope_pyramid(self, awg_id: _AWG_ID, ws: WaveScroller) -> EnvelopePyramid:
+        key = (awg_id.prog, tuple(awg_id.channels), awg_id.is_out)
+        with self._lock:
+            pyramid = self._envelope_pyramids.get(key)
+            if pyramid is not None:
+                return pyramid
+
+            rate = ws.sim.sampling_rate
+            time_delay = ws.time_delay()
+
+            # Called by the pyramid on first use of a chunk, serialized by its lock
+            def sample(start: int, length: int) -> np.ndarray:
+                ws.calc_snippet(start / rate + time_delay, length / rate)
+                wave = ws.wave_snippet if awg_id.is_out else ws.acquire_snippet
+                # The snippet ends with the last event in the chunk
+                return np.pad(wave, (0, length - len(wave)))
+
+            pyramid = EnvelopePyramid(sample, _simulation_end(ws.sim))
+            self._envelope_pyramids[key] = pyramid
+            return pyramid
+
+    def get_envelope(
+        self,
+        physical_channel: str | PhysicalChannel,
+        start: float,
+        output_length: float,
+        points: int,
+    ) -> EnvelopeData:
+        """Retrieve the envelope of the simulated waveform for a given channel and
+        window of time, at a resolution of about `points` points.
+
+        The minima and maxima of the waveform over consecutive buckets of samples
+        are taken from a pyramid of envelopes at decreasing resolutions, which is
+        built chunk by chunk, as the requested windows require. Once built, the
+        cost of a request only depends on `points`, not on the length of the
+        window. Windows with fewer than a few samples per point are returned
+        sample by sample, with equal minima and maxima.
+
+        Intended for plotting long waveforms, e.g. redrawing the visible window
+        on every zoom. The interactive pulse sheet viewer does not use it, and
+        still plots the samples of `get_snippet`.
+
+        Arguments:
+            physical_channel: The physical channel to retrieve the envelope for.
+            start: The start time of the window (in seconds).
+            output_length: The length of the window (in seconds).
+            points: The approximate number of buckets to return, e.g. the width
+                of a plot in pixels.
+
+        Returns:
+            The envelope data has the following attributes:
+
+                - `time`: an array of the start times of the buckets.
+                - `wave_min`: an array of the minima of the waveform in the
+                    buckets. For complex waveforms, the minima of the real and
+                    imaginary parts are taken separately.
+                - `wave_max`: an array of the maxima of the waveform in the buckets.
+                - `samples_per_point`: the number of samples per bucket.
+
+        !!! version-added "Added in version 2.21.0"
+        """
+        awg_id = self._awg_id(physical_channel)
+        ws = WaveScroller(
+            ch=awg_id.channels,
+            sim_targets=SimTarget.PLAY if awg_id.is_out else SimTarget.ACQUIRE,
+            sim=self._simulation(awg_id.prog),
+        )
+        rate = ws.sim.sampling_rate
+        time_delay = ws.time_delay()
+        start_samples = max(int(np.round((start - time_delay) * rate)), 0)
+        end_samples = max(
+            int(np.round((start + output_length - time_delay) * rate)), start_samples
+        )
+        envelope = None
+        if bucket_samples(end_samples - start_samples, points) >= BASE_BUCKET_SAMPLES:
+            pyramid = self._envelope_pyramid(awg_id, ws)
+            envelope = pyramid.envelope(start_samples, end_samples, points)
+        if envelope is None:
+            snippet = self.get_snippet(physical_channel, start, output_length)
+            return EnvelopeData(
+                time=snippet.time, wave_min=snippet.wave, wave_max=snippet.wave
+            )
+        first_sample, samples_per_point, mins, maxs = envelope
+        if pyramid.is_complex:
+            wave_min = mins[0] + 1j * mins[1]
+            wave_max = maxs[0] + 1j * maxs[1]
+        else:
+            wave_min, wave_max = mins[0], maxs[0]
+        time = (
+            first_sample + samples_per_point * np.arange(len(wave_min))
+        ) / rate + time_delay
+        return EnvelopeData(
+            time=time,
+            wave_min=wave_min,
+            wave_max=wave_max,
+            samples_per_point=samples_per_point,
+        )
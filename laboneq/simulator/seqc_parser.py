@@ -3,8 +3,12 @@
 
 from __future__ import annotations
 
+import bisect
+import hashlib
+import math
 import re
-from dataclasses import dataclass, field
+import threading
+from dataclasses import dataclass, field, replace
 from enum import Enum, auto
 from functools import lru_cache
 from types import SimpleNamespace
@@ -23,6 +27,7 @@ from pycparser.c_ast import (
     Decl,
     DoWhile,
     For,
+    FileAST,
     FuncCall,
     FuncDef,
     If,
@@ -32,6 +37,8 @@ from pycparser.c_ast import (
 from pycparser.c_parser import CParser
 
 from laboneq.compiler.common.compiler_settings import EXECUTETABLEENTRY_LATENCY
+from laboneq.core.utilities.caching import LruCache
+from laboneq.core.utilities.forked_pool import run_forked
 from laboneq.data.recipe import Recipe, TriggeringMode, RoutedOutput
 
 if TYPE_CHECKING:
@@ -111,12 +118,75 @@ def get_sample_multiple(device_type):
         return 16
 
 
+# Default number of parsed SeqC programs kept in memory
+DEFAULT_SEQC_PARSE_CACHE_MAX_ENTRIES = 64
+
+
+class SeqCParseCache:
+    """Bounded cache of preprocessed and parsed SeqC programs, keyed by a digest
+    of their text, and for parsed programs also by their name.
+
+    Identical programs, e.g. of several AWGs or near-time steps, are preprocessed
+    only once, and the programs of repeated simulations of the same experiment
+    are also parsed only once. The least recently used entries are dropped first.
+    The returned syntax trees are shared and must not be modified.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_SEQC_PARSE_CACHE_MAX_ENTRIES):
+        self._entries: LruCache[tuple, Any] = LruCache(max_entries)
+        self.stats = self._entries.stats
+
+    def _get(self, kind: tuple, text: str, compute):
+        key = (*kind, hashlib.blake2b(text.encode(), digest_size=16).digest())
+        value = self._entries.get(key)
+        if value is None:
+            value = compute()
+            self._entries.put(key, value)
+        return value
+
+    def preprocess(self, text: str) -> str:
+        """Same as `preprocess_source`."""
+        return self._get(("preprocess",), text, lambda: preprocess_source(text))
+
+    def parse(self, source: str, name: str) -> FileAST:
+        """Parse a preprocessed program.
+
+        The name is the file name in the coordinates of the nodes, so it is part of
+        the key.
+        """
+        return self._get(("parse", name), source, lambda: CParser().parse(source, name))
+
+    def clear(self):
+        self._entries.clear()
+
+
+_seqc_parse_cache: SeqCParseCache | None = None
+_seqc_parse_cache_lock = threading.Lock()
+
+
+def set_seqc_parse_cache(cache: SeqCParseCache | None):
+    """Sets the cache of parsed SeqC programs used by all simulations.
+
+    If None, a default cache is created on first use.
+    """
+    global _seqc_parse_cache
+    with _seqc_parse_cache_lock:
+        _seqc_parse_cache = cache
+
+
+def get_seqc_parse_cache() -> SeqCParseCache:
+    global _seqc_parse_cache
+    with _seqc_parse_cache_lock:
+        if _seqc_parse_cache is None:
+            _seqc_parse_cache = SeqCParseCache()
+        return _seqc_parse_cache
+
+
 def parse_seq_c(runtime: SimpleRuntime):
     if len(runtime.source) == 0:
         return
 
-    parser = CParser()
-    ast = parser.parse(runtime.source, runtime.descriptor.name)
+    ast = get_seqc_parse_cache().parse(runtime.source, runtime.descriptor.name)
     # ast_stream = StringIO()
     # ast.show(buf=ast_stream)
     # print(ast_stream.getvalue())
@@ -212,6 +282,150 @@ class StopSimulation(Exception):
     pass
 
 
+@dataclass
+class _IterationMark:
+    event_count: int
+    loop_count: int
+    time_samples: int
+    state: Any
+    counter: Any
+
+
+class _LoopTracker:
+    """Detects the steady state of a loop, in which each iteration produces the
+    same events as the previous one, shifted by a fixed period.
+
+    The comparison starts with the last event of the previous iteration, as
+    point-in-time events are inserted before the last time-span event.
+    """
+
+    def __init__(self, runtime: SimpleRuntime, counter: str | None = None):
+        self._runtime = runtime
+        # The variable counted down in the loop condition, if any
+        self._counter = counter
+        self._marks: list[_IterationMark] = []
+        self.first_event = 0
+        self.event_count = 0
+        self.period_samples = 0
+        self.counter_step = 0
+
+    def _mark(self) -> _IterationMark:
+        runtime = self._runtime
+        values = {name: var.get("value") for name, var in runtime.variables.items()}
+        counter = values.pop(self._counter, None)
+        return _IterationMark(
+            event_count=len(runtime.seqc_simulation.events),
+            loop_count=len(runtime.seqc_simulation.loops),
+            time_samples=runtime._last_played_sample(),
+            state=(
+                values,
+                dict(runtime._oscillator_sweep_config),
+                runtime.start_trigger_count,
+            ),
+            counter=counter,
+        )
+
+    def iteration_finished(self) -> bool:
+        """Returns True if the iteration just finished repeats the previous one."""
+        self._marks = [*self._marks[-2:], self._mark()]
+        if len(self._marks) < 3:
+            return False
+        a, b, c = self._marks
+        event_count = c.event_count - b.event_count
+        period = c.time_samples - b.time_samples
+        loop_count = c.loop_count - b.loop_count
+        if (
+            a.event_count < 1
+            or event_count <= 0
+            or b.event_count - a.event_count != event_count
+            or period <= 0
+            or b.time_samples - a.time_samples != period
+            or b.loop_count - a.loop_count != loop_count
+            or c.state != b.state
+        ):
+            return False
+        if self._counter is not None:
+            counter_step = c.counter - b.counter
+            if counter_step >= 0 or b.counter - a.counter != counter_step:
+                return False
+            self.counter_step = counter_step
+
+        events = self._runtime.seqc_simulation.events
+        # Including the pending last event, which starts the next iteration
+        for i in range(event_count + 1):
+            previous = events[a.event_count - 1 + i]
+            current = events[b.event_count - 1 + i]
+            if (
+                current.start_samples != previous.start_samples + period
+                or current.length_samples != previous.length_samples
+                or current.operation != previous.operation
+                or current.args != previous.args
+            ):
+                return False
+        loops = self._runtime.seqc_simulation.loops
+        for i in range(loop_count):
+            previous = loops[a.loop_count + i]
+            current = loops[b.loop_count + i]
+            if current.first_event < b.event_count - 1 or current != replace(
+                previous, first_event=previous.first_event + event_count
+            ):
+                return False
+
+        self.first_event = b.event_count - 1
+        self.event_count = event_count
+        self.period_samples = period
+        return True
+
+    def repeat(self, remaining: int):
+        """Record the last iteration to be repeated `remaining` more times."""
+        if remaining <= 0:
+            return
+        runtime = self._runtime
+        simulation = runtime.seqc_simulation
+        events = simulation.events
+        block_start = events[self.first_event].start_samples
+        block_end = self.first_event + self.event_count
+        span = max(
+            ev.start_samples + ev.length_samples
+            for ev in events[self.first_event : block_end]
+        )
+        for loop in simulation.loops:
+            if self.first_event <= loop.first_event < block_end:
+                span = max(
+                    span,
+                    events[loop.first_event].start_samples
+                    + (loop.count - 1) * loop.period_samples
+                    + loop.span_samples,
+                )
+        count = remaining + 1
+        stop = False
+        if runtime.max_time is not None:
+            # Drop the repetitions starting after the simulation region
+            max_count = (
+                int(
+                    (runtime.max_time * runtime.descriptor.sampling_rate - block_start)
+                    // self.period_samples
+                )
+                + 1
+            )
+            if max_count < count:
+                count = max(max_count, 1)
+                stop = True
+        simulation.loops.append(
+            SeqCLoop(
+                first_event=self.first_event,
+                event_count=self.event_count,
+                period_samples=self.period_samples,
+                count=count,
+                span_samples=span - block_start,
+            )
+        )
+        if stop:
+            events.pop(-1)
+            raise StopSimulation
+        events[-1].start_samples += remaining * self.period_samples
+
+
 def parse_set_func(param_name: str, stmt: Node, runtime: SimpleRuntime):
     def parse_step(lower_bound: int, stmt: Node):
         if isinstance(stmt, If):
@@ -265,6 +479,11 @@ def parse_item(item: Node, runtime: SimpleRuntime):
 
     elif isinstance(item, DoWhile):
         endless_guard = 10000
+        loop_tracker = (
+            _LoopTracker(runtime, counter=getattr(item.cond, "name", None))
+            if runtime.loop_aware
+            else None
+        )
         while True:
             for subitem in item.stmt.children():
                 parse_item(subitem[1], runtime)
@@ -278,6 +497,12 @@ def parse_item(item: Node, runtime: SimpleRuntime):
 
             if variable_value <= 0:
                 break
+            if loop_tracker is not None and loop_tracker.iteration_finished():
+                counter_step = loop_tracker.counter_step
+                remaining = math.ceil(variable_value / -counter_step)
+                loop_tracker.repeat(remaining)
+                variables[condition_variable_name]["value"] += remaining * counter_step
+                break
             endless_guard -= 1
             if endless_guard <= 0:
                 raise RuntimeError("Endless guard triggered")
@@ -287,9 +512,13 @@ def parse_item(item: Node, runtime: SimpleRuntime):
 
         # if cond and next are None, assume the for loop is just encoding a seqc repeat
         n = int(parse_expression(item.init, runtime))
-        for _i in range(n):
+        loop_tracker = _LoopTracker(runtime) if runtime.loop_aware else None
+        for i in range(n):
             for subitem in item.stmt.children():
                 parse_item(subitem[1], runtime)
+            if loop_tracker is not None and loop_tracker.iteration_finished():
+                loop_tracker.repeat(n - i - 1)
+                break
     if (
         runtime.max_time is not None
         and runtime._last_play_start_samples()[0] / runtime.descriptor.sampling_rate
@@ -339,6 +568,82 @@ class SeqCEvent:
     args: list[Any]
 
 
+@dataclass
+class SeqCLoop:
+    """A block of events which is repeated with a fixed period.
+
+    Only the first repetition of the block is stored in `SeqCSimulation.events`,
+    the events following the block are at the times after the last repetition.
+    """
+
+    first_event: int
+    event_count: int
+    period_samples: int
+    count: int
+    # Time from the start of a repetition to the end of its last event
+    span_samples: int
+
+
+def _append_shifted(events: Sequence[SeqCEvent], shift: int, out: list[SeqCEvent]):
+    if shift == 0:
+        out.extend(events)
+    else:
+        out.extend(
+            SeqCEvent(
+                ev.start_samples + shift, ev.length_samples, ev.operation, ev.args
+            )
+            for ev in events
+        )
+
+
+def _expand_loops(
+    events: list[SeqCEvent],
+    loops: list[SeqCLoop],
+    loop_starts: list[int],
+    first_loop: int,
+    lo: int,
+    hi: int,
+    shift: int,
+    start_samples: int,
+    end_samples: int,
+    out: list[SeqCEvent],
+):
+    """Append the events `events[lo:hi]` shifted by `shift` to `out`, with the
+    repetitions of the loops that overlap the window, and the last one before it.
+
+    The loops are ordered by their first event, enclosing loops first. Only the
+    loops from `first_loop` on are considered.
+    """
+    position = lo
+    for index in range(first_loop, bisect.bisect_left(loop_starts, hi)):
+        loop = loops[index]
+        if loop.first_event < position:
+            # Nested in a loop expanded before
+            continue
+        _append_shifted(events[position : loop.first_event], shift, out)
+        block_start = events[loop.first_event].start_samples + shift
+        period = loop.period_samples
+        # The first repetition overlapping the window, or ending before it
+        first = -((block_start + loop.span_samples - start_samples) // period) - 1
+        first = min(max(first, 0), loop.count - 1)
+        last = min((end_samples - block_start) // period, loop.count - 1)
+        for repetition in range(first, last + 1):
+            _expand_loops(
+                events,
+                loops,
+                loop_starts,
+                index + 1,
+                loop.first_event,
+                loop.first_event + loop.event_count,
+                shift + repetition * period,
+                start_samples,
+                end_samples,
+                out,
+            )
+        position = loop.first_event + loop.event_count
+    _append_shifted(events[position:hi], shift, out)
+
+
 @dataclass
 class WaveRefInfo:
     assigned_index: int = -1
@@ -416,6 +721,92 @@ class CommandTableEntryInfo:
         return cls(**d)
 
 
+class SeqCEventIndex:
+    """Columnar index of the events of a simulation.
+
+    The start, length and operation of the events are held in NumPy arrays, with
+    the positions of the events of each operation in separate arrays, so that the
+    events of a time window, and the last events before it, are found in
+    O(log n + k) rather than by scanning all events.
+    """
+
+    def __init__(self, events: list[SeqCEvent]):
+        self.events = events
+        count = len(events)
+        self.start_samples = np.fromiter(
+            (ev.start_samples for ev in events), dtype=np.int64, count=count
+        )
+        self.length_samples = np.fromiter(
+            (ev.length_samples for ev in events), dtype=np.int64, count=count
+        )
+        self.end_samples = self.start_samples + self.length_samples
+        self.operation = np.fromiter(
+            (ev.operation.value for ev in events), dtype=np.int8, count=count
+        )
+        # Running maximum of the start, the events are expected to be ordered by
+        # start already
+        self._max_start_samples = np.maximum.accumulate(self.start_samples)
+        # Positions of the events of each operation, and the running maximum of
+        # their end
+        self._by_operation: dict[Operation, tuple[np.ndarray, np.ndarray]] = {}
+        for operation in Operation:
+            positions = np.flatnonzero(self.operation == operation.value)
+            if len(positions) > 0:
+                self._by_operation[operation] = (
+                    positions,
+                    np.maximum.accumulate(self.end_samples[positions]),
+                )
+
+    def query(
+        self, operations: set[Operation], start_samples: int, end_samples: int
+    ) -> tuple[list[SeqCEvent], list[SeqCEvent]]:
+        """Find the events of the given operations in a time window.
+
+        Only the events before the first one starting after `end_samples` are
+        considered.
+
+        Returns:
+            The last event of each operation that ends before `start_samples`,
+            ordered by start, and the events that overlap the window (touching
+            included), in their original order.
+        """
+        count = np.searchsorted(self._max_start_samples, end_samples, side="right")
+        pre_events: list[tuple[int, int, int]] = []
+        interval_positions: list[np.ndarray] = []
+        for operation in operations:
+            by_operation = self._by_operation.get(operation)
+            if by_operation is None:
+                continue
+            positions, max_end_samples = by_operation
+            hi = np.searchsorted(positions, count)
+            # All events before `lo` end before the window
+            lo = min(np.searchsorted(max_end_samples, start_samples), hi)
+            candidates = positions[lo:hi]
+            overlapping = self.end_samples[candidates] >= start_samples
+            interval_positions.append(candidates[overlapping])
+            before = candidates[~overlapping]
+            if len(before) > 0:
+                last = before[-1]
+                first = positions[0] if lo > 0 else before[0]
+            elif lo > 0:
+                last = positions[lo - 1]
+                first = positions[0]
+            else:
+                continue
+            # Ties are ordered by the first preceding event of the operation
+            pre_events.append((self.start_samples[last], first, last))
+        pre_events.sort()
+        interval = (
+            np.sort(np.concatenate(interval_positions))
+            if interval_positions
+            else np.empty(0, dtype=np.int64)
+        )
+        return (
+            [self.events[i] for _, _, i in pre_events],
+            [self.events[i] for i in interval],
+        )
+
+
 @dataclass
 class SeqCSimulation:
     events: list[SeqCEvent] = field(default_factory=list)
@@ -425,6 +816,57 @@ class SeqCSimulation:
     startup_delay: float = field(default=0.0)
     output_port_delay: float = field(default=0.0)
     is_spectroscopy: bool = False
+    # The repeated blocks of events, of a loop-aware simulation
+    loops: list[SeqCLoop] = field(default_factory=list)
+    _event_index: SeqCEventIndex | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def events_in_window(self, start_samples: int, end_samples: int) -> list[SeqCEvent]:
+        """The events with the loops expanded, as far as needed for a time window.
+
+        Of each loop, the repetitions overlapping the window and the last one
+        before it are materialized.
+        """
+        if not self.loops:
+            return self.events
+        loops = sorted(
+            self.loops, key=lambda loop: (loop.first_event, -loop.event_count)
+        )
+        events: list[SeqCEvent] = []
+        _expand_loops(
+            self.events,
+            loops,
+            [loop.first_event for loop in loops],
+            0,
+            0,
+            len(self.events),
+            0,
+            start_samples,
+            end_samples,
+            events,
+        )
+        return events
+
+    def query_events(
+        self, operations: set[Operation], start_samples: int, end_samples: int
+    ) -> tuple[list[SeqCEvent], list[SeqCEvent]]:
+        """Same as `SeqCEventIndex.query`, with the loops expanded."""
+        if not self.loops:
+            return self.event_index().query(operations, start_samples, end_samples)
+        return SeqCEventIndex(self.events_in_window(start_samples, end_samples)).query(
+            operations, start_samples, end_samples
+        )
+
+    def event_index(self) -> SeqCEventIndex:
+        """The index of the events, built on first use."""
+        if (
+            self._event_index is None
+            or self._event_index.events is not self.events
+            or len(self._event_index.start_samples) != len(self.events)
+        ):
+            self._event_index = SeqCEventIndex(self.events)
+        return self._event_index
 
 
 class SimpleRuntime:
@@ -433,6 +875,7 @@ class SimpleRuntime:
         descriptor: SeqCDescriptor,
         waves,
         max_time: float | None,
+        loop_aware: bool = False,
     ):
         self.predefined_consts = {
             "QA_INT_0": 0b1,
@@ -502,11 +945,13 @@ class SimpleRuntime:
         self.times_at_port = {}
         self.descriptor = descriptor
         self.waves = waves
-        self.source = preprocess_source(descriptor.source)
+        self.source = get_seqc_parse_cache().preprocess(descriptor.source)
         self.wave_lookup_by_args: dict[Any, WaveRefInfo] = {}
         self.wave_names_by_index: dict[int, list[str]] = {}
         self.wave_data: list[Any] = []
         self.max_time: float | None = max_time
+        self.loop_aware = loop_aware
+        self.start_trigger_count = 0
         self._oscillator_sweep_config = {}
         self._oscillator_sweep_params: dict[str, dict[int, float]] = {}
         self._command_table_by_index = {
@@ -540,6 +985,7 @@ class SimpleRuntime:
         self.seqc_simulation.sampling_rate = self.descriptor.sampling_rate
         self.seqc_simulation.startup_delay = self.descriptor.startup_delay
         self.seqc_simulation.output_port_delay = self.descriptor.output_port_delay
+        self.seqc_simulation.event_index()
 
     def declare(self, name):
         self.variables[name] = {"name": name}
@@ -722,7 +1168,12 @@ class SimpleRuntime:
         if "index" not in ct_entry["waveform"]:
             return None, None
         wave_index = ct_entry["waveform"]["index"]
-        known_wave = WaveRefInfo(assigned_index=wave_index)
+        # Share the wave data among all entries and executions playing the wave
+        wave_key = ("ct", wave_index)
+        known_wave = self.wave_lookup_by_args.get(wave_key)
+        if known_wave is None:
+            known_wave = WaveRefInfo(assigned_index=wave_index)
+            self.wave_lookup_by_args[wave_key] = known_wave
 
         wave = self.descriptor.wave_index[wave_index]
 
@@ -967,6 +1418,12 @@ class SimpleRuntime:
         # Here the assumption is that before the start trigger event, only playZeros
         # could potentially affect timings, so we only remove the effect of playZero
         # events. Besides, only one start trigger event is assumed.
+        self.start_trigger_count += 1
+        if self.seqc_simulation.loops:
+            self.seqc_simulation.events = self.seqc_simulation.events_in_window(
+                0, self._last_played_sample()
+            )
+            self.seqc_simulation.loops = []
         back_shift_samples = 0
         filtered_events = []
         for ev in self.seqc_simulation.events:
@@ -1111,11 +1568,20 @@ def analyze_recipe(
     return seqc_descriptors
 
 
-def run_single_source(descriptor: SeqCDescriptor, waves, max_time) -> SeqCSimulation:
+def run_single_source(
+    descriptor: SeqCDescriptor, waves, max_time, loop_aware: bool = False
+) -> SeqCSimulation:
+    """Simulate a single SeqC program.
+
+    In loop-aware mode, once the iterations of a loop repeat the events of the
+    previous iteration shifted by a fixed period, the remaining iterations are
+    not executed but recorded as a `SeqCLoop`.
+    """
     runtime = SimpleRuntime(
         descriptor=descriptor,
         waves=waves,
         max_time=max_time,
+        loop_aware=loop_aware,
     )
     parse_seq_c(runtime)
     return runtime.seqc_simulation
@@ -1174,9 +1640,10 @@ def preprocess_source(text):
     return source
 
 
-def _analyze_compiled(
+def analyze_compiled(
     compiled: CompiledExperiment,
 ) -> tuple[list[SeqCDescriptor], dict[str, npt.ArrayLike]]:
+    """The descriptors of the SeqC programs and the waves of a compiled experiment."""
     if isinstance(compiled, dict):
         compiled = SimpleNamespace(
             scheduled_experiment=SimpleNamespace(
@@ -1201,9 +1668,41 @@ def _analyze_compiled(
     return seqc_descriptors, waves
 
 
-def simulate(compiled: CompiledExperiment, max_time=None) -> dict[str, SeqCSimulation]:
-    seqc_descriptors, waves = _analyze_compiled(compiled)
-    results: dict[str, SeqCSimulation] = {}
-    for descriptor in seqc_descriptors:
-        results[descriptor.name] = run_single_source(descriptor, waves, max_time)
-    return results
+# Kept for backwards compatibility
+_analyze_compiled = analyze_compiled
+
+
+def _simulate_in_worker(
+    state: tuple[list[SeqCDescriptor], dict[str, npt.ArrayLike], Any, bool],
+    index: int,
+) -> SeqCSimulation:
+    descriptors, waves, max_time, loop_aware = state
+    return run_single_source(descriptors[index], waves, max_time, loop_aware)
+
+
+def simulate_sources(
+    descriptors: list[SeqCDescriptor],
+    waves: dict[str, npt.ArrayLike],
+    max_time=None,
+    max_workers: int = 1,
+    loop_aware: bool = False,
+) -> dict[str, SeqCSimulation]:
+    """Simulates the given SeqC programs, in up to `max_workers` processes."""
+    # The worker processes inherit the descriptors and waves
+    results = run_forked(
+        _simulate_in_worker,
+        (descriptors, waves, max_time, loop_aware),
+        range(len(descriptors)),
+        max_workers,
+    )
+    return {descriptor.name: result for descriptor, result in zip(descriptors, results)}
+
+
+def simulate(
+    compiled: CompiledExperiment,
+    max_time=None,
+    max_workers: int = 1,
+    loop_aware: bool = False,
+) -> dict[str, SeqCSimulation]:
+    seqc_descriptors, waves = analyze_compiled(compiled)
+    return simulate_sources(seqc_descriptors, waves, max_time, max_workers, loop_aware)
@@ -18,25 +18,6 @@ from laboneq.simulator.seqc_parser import (
 )
 
 
-def _overlaps(a_start: int, a_length: int, b_start: int, b_length: int):
-    """Return True if the first and second sample intervals overlap.
-
-    Intervals that touch are considered to overlap.
-
-    Args:
-        a_start: The starting sample of the first interval.
-        a_length: The number of samples in the first interval.
-        b_start: The starting sample of the second interval.
-        b_length: The number of samples in the second interval.
-
-    Returns:
-        True if the intervals overlap. False otherwise.
-    """
-    a_end = a_start + a_length
-    b_end = b_start + b_length
-    return a_start <= b_end and b_start <= a_end
-
-
 def _slice_copy(
     a: ArrayLike,
     a_start: int,
@@ -451,13 +432,17 @@ class WaveScroller:
             if self.last_freq_set_samples < len(self.frequency_snippet):
                 self.frequency_snippet[self.last_freq_set_samples :] = self.last_freq
 
+    def time_delay(self) -> float:
+        """The time of the sample 0 of the simulation, in seconds."""
+        time_delay_secs = self.sim.output_port_delay if self.is_output() else 0.0
+        return time_delay_secs + self.sim.startup_delay
+
     def calc_snippet(
         self,
         start_secs: float,
         length_secs: float,
     ):
-        time_delay_secs = self.sim.output_port_delay if self.is_output() else 0.0
-        time_delay_secs += self.sim.startup_delay
+        time_delay_secs = self.time_delay()
         start_samples = int(
             np.round((start_secs - time_delay_secs) * self.sim.sampling_rate)
         )
@@ -469,27 +454,11 @@ class WaveScroller:
             start_samples = 0
         end_samples = start_samples + length_samples
 
-        # filter relevant events into events pre-interval and events that
-        # overlap the interval, keeping only the last of each kind of
-        # operation
-        pre_events = {}
-        interval_events = []
-        target_ops = self.target_ops()
-        for ev in self.sim.events:
-            if ev.start_samples > end_samples:
-                break
-            if ev.operation not in target_ops:
-                continue
-            if _overlaps(
-                start_samples,
-                length_samples,
-                ev.start_samples,
-                ev.length_samples,
-            ):
-                interval_events.append(ev)
-            else:
-                pre_events[ev.operation] = ev
-        pre_events = sorted(pre_events.values(), key=lambda ev: ev.start_samples)
+        # find relevant events pre-interval and events that overlap the
+        # interval, keeping only the last of each kind of operation pre-interval
+        pre_events, interval_events = self.sim.query_events(
+            self.target_ops(), start_samples, end_samples
+        )
 
         # truncate sample length to the end of the last contained event
         if interval_events:
@@ -0,0 +1,92 @@
+# Copyright 2023 Zurich Instruments AG
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+
+from laboneq.contrib.example_helpers.example_notebook_helper import (
+    create_device_setup,
+)
+from laboneq.core.utilities.forked_pool import can_fork
+from laboneq.simple import (
+    Experiment,
+    ExperimentSignal,
+    LinearSweepParameter,
+    Session,
+    pulse_library,
+)
+
+
+@pytest.fixture(scope="module")
+def session_and_experiment():
+    device_setup = create_device_setup(generation=2)
+    q0 = device_setup.logical_signal_groups["q0"].logical_signals
+    q1 = device_setup.logical_signal_groups["q1"].logical_signals
+    exp = Experiment(
+        "parallel",
+        signals=[
+            ExperimentSignal("drive0"),
+            ExperimentSignal("drive1"),
+            ExperimentSignal("measure"),
+            ExperimentSignal("acquire"),
+        ],
+    )
+    nt_amplitude = LinearSweepParameter("nt_amplitude", 0.1, 0.9, 4)
+    rt_amplitude = LinearSweepParameter("rt_amplitude", 0.1, 0.9, 5)
+    drag = pulse_library.drag(uid="drag", length=100e-9, amplitude=1.0)
+    readout = pulse_library.const(uid="readout", length=400e-9, amplitude=0.5)
+    with exp.sweep(parameter=nt_amplitude):
+        with exp.acquire_loop_rt(count=4):
+            with exp.sweep(parameter=rt_amplitude):
+                with exp.section(uid="drive"):
+                    exp.play("drive0", drag, amplitude=rt_amplitude)
+                    exp.play("drive1", drag, amplitude=nt_amplitude)
+                with exp.section(uid="measure", play_after="drive"):
+                    exp.play("measure", readout)
+                    exp.acquire("acquire", handle="h", length=400e-9)
+    exp.set_signal_map(
+        {
+            "drive0": q0["drive_line"],
+            "drive1": q1["drive_line"],
+            "measure": q0["measure_line"],
+            "acquire": q0["acquire_line"],
+        }
+    )
+    session = Session(device_setup)
+    session.connect(do_emulation=True)
+    return session, exp
+
+
+def _compile(session, exp, **settings):
+    compiled = session.compile(exp, compiler_settings=settings)
+    scheduled = compiled.scheduled_experiment
+    return (
+        scheduled.src,
+        scheduled.waves,
+        scheduled.command_tables,
+        scheduled.recipe,
+    )
+
+
+@pytest.mark.skipif(not can_fork(), reason="requires the 'fork' start method")
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {"RT_COMPILER_MAX_WORKERS": 2},
+        {"CODEGEN_MAX_WORKERS": 2},
+        {"RT_COMPILER_MAX_WORKERS": 2, "CODEGEN_MAX_WORKERS": 2},
+    ],
+)
+def test_parallel_compilation_matches_serial(session_and_experiment, settings):
+    session, exp = session_and_experiment
+    serial = _compile(session, exp)
+    parallel = _compile(session, exp, **settings)
+    src, waves, command_tables, recipe = parallel
+    assert src == serial[0]
+    assert [wave["filename"] for wave in waves] == [
+        wave["filename"] for wave in serial[1]
+    ]
+    for wave, serial_wave in zip(waves, serial[1]):
+        assert np.array_equal(wave["samples"], serial_wave["samples"])
+    assert command_tables == serial[2]
+    assert recipe == serial[3]
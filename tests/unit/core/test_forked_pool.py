@@ -0,0 +1,47 @@
+# Copyright 2023 Zurich Instruments AG
+# SPDX-License-Identifier: Apache-2.0
+
+import multiprocessing
+import os
+import signal
+
+import pytest
+
+from laboneq.core.utilities.forked_pool import can_fork, run_forked
+
+
+def _scale(factor, value):
+    return factor * value
+
+
+def _sum_scaled(count, factor):
+    return sum(run_forked(_scale, factor, range(count), max_workers=2))
+
+
+def _run_nested():
+    # A group of its own, so that the workers can be killed with the process
+    os.setpgrp()
+    assert run_forked(_sum_scaled, 3, [1, 2], max_workers=2) == [3, 6]
+
+
+def test_run_forked_serial():
+    assert run_forked(_scale, 2, [1, 2, 3], max_workers=1) == [2, 4, 6]
+
+
+@pytest.mark.skipif(not can_fork(), reason="requires the 'fork' start method")
+def test_run_forked():
+    assert run_forked(_scale, 2, [1, 2, 3], max_workers=2) == [2, 4, 6]
+
+
+@pytest.mark.skipif(not can_fork(), reason="requires the 'fork' start method")
+def test_run_forked_nested():
+    # Run in a process of its own, so that a deadlock fails the test instead of
+    # blocking the test session
+    process = multiprocessing.get_context("fork").Process(target=_run_nested)
+    process.start()
+    process.join(timeout=60)
+    if process.is_alive():
+        os.killpg(process.pid, signal.SIGKILL)
+        process.join()
+        pytest.fail("Nested run_forked did not complete")
+    assert process.exitcode == 0
@@ -0,0 +1,64 @@
+# Copyright 2023 Zurich Instruments AG
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+
+import laboneq.dsl.experiment.pulse_library  # noqa: F401, registers the functionals
+from laboneq.core.types.enums.mixer_type import MixerType
+from laboneq.core.utilities.pulse_sampler import sample_pulse, sample_pulse_batch
+
+
+@pytest.mark.parametrize(
+    "pulse_function,pulse_parameters",
+    [
+        ("gaussian", [{}, {"order": 4}]),
+        ("gaussian", [None, {"sigma": 0.2}, {"sigma": 0.1, "order": 4}]),
+        ("gaussian", [{"sigma": 0.2}, {"sigma": 0.3}, {"sigma": 0.3}]),
+        ("drag", [{}, {"beta": 0.3}]),
+        ("drag", [{"beta": 0.1}, None, {"beta": 0.3, "sigma": 0.2}]),
+        ("const", [None, None, None]),
+        ("cos2", [None, {}]),
+    ],
+)
+@pytest.mark.parametrize("signal_type", ["iq", "single"])
+def test_sample_pulse_batch_matches_sample_pulse(
+    pulse_function, pulse_parameters, signal_type
+):
+    if signal_type != "iq" and pulse_function == "drag":
+        pytest.skip("DRAG pulses are complex")
+    count = len(pulse_parameters)
+    amplitudes = [
+        0.5 + 0.1j * i if signal_type == "iq" else 0.5 - 0.1 * i for i in range(count)
+    ]
+    phases = [None, *[0.3 * i for i in range(1, count)]]
+    modulation_frequencies = [100e6 * i for i in range(count)]
+    markers = [{"marker_selector": "marker1", "start": 10e-9, "length": 20e-9}]
+    common = dict(
+        signal_type=signal_type,
+        sampling_rate=2e9,
+        length=64e-9,
+        pulse_function=pulse_function,
+        mixer_type=MixerType.IQ,
+        markers=markers,
+    )
+
+    batch = sample_pulse_batch(
+        amplitudes=amplitudes,
+        phases=phases,
+        modulation_frequencies=modulation_frequencies,
+        pulse_parameters=pulse_parameters,
+        **common,
+    )
+
+    for index in range(count):
+        single = sample_pulse(
+            amplitude=amplitudes[index],
+            phase=phases[index],
+            modulation_frequency=modulation_frequencies[index],
+            pulse_parameters=pulse_parameters[index],
+            **common,
+        )
+        assert single.keys() == batch.keys()
+        for name, samples in single.items():
+            np.testing.assert_allclose(batch[name][index], samples, atol=1e-12)